@@ -5,14 +5,721 @@
 CSV 파일 로딩, 데이터 클리닝, 이상치 제거, 리샘플링, 특징 추출 등의
 전체 파이프라인을 제공합니다.
 
-외부 라이브러리 없이 Python 표준 라이브러리만 사용합니다.
+기본("list") 백엔드는 Python 리스트를 주고받으며,
+"numpy" 백엔드는 numpy.ndarray, array('d') 등 버퍼 프로토콜 객체를
+복사 없이 받아 NumPy 벡터 연산으로 처리합니다.
+
+numpy 백엔드는 dtype="float32" 모드를 지원합니다. 샘플 버퍼와 중간 배열을
+float32로 유지해 메모리와 대역폭을 절반으로 줄이되, 합계/모멘트 누적
+(평균, 제곱합, 첨도의 4차 모멘트 등)은 float64로 수행합니다.
+float64 경로 대비 특징 값의 상대 오차는 FLOAT32_FEATURE_TOLERANCE 이내입니다.
 """
 
 import csv
 import math
 import statistics
 import json
-from typing import List, Dict, Optional, Any
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from fractions import Fraction
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    List, Dict, Optional, Any, Callable, Iterable, Iterator, Sequence, Tuple,
+    Union,
+)
+
+import numpy as np
+
+
+# list 백엔드는 리스트, numpy 백엔드는 배열/버퍼 객체를 받습니다
+ArrayLike = Union[List[float], np.ndarray, Any]
+
+
+@dataclass
+class CleaningReport:
+    """
+    결측치 보간 결과 요약
+
+    Attributes:
+        imputed_count: 보간으로 채운 샘플 수
+        longest_gap: 가장 긴 연속 결측 구간의 길이 (샘플 수)
+    """
+    imputed_count: int
+    longest_gap: int
+
+
+class MomentAccumulator:
+    """
+    단일 패스 모멘트 누적기
+
+    샘플을 한 번만 순회하면서 평균, 2~4차 중심 모멘트, 최대/최소값을
+    동시에 누적합니다. Welford 방식을 고차 모멘트로 확장한 온라인 갱신식
+    (Pébay, 2008)을 사용하므로 큰 오프셋이 있는 신호에서도 수치적으로 안정합니다.
+
+    extract_all_features()의 결과는 개별 calculate_* 메서드와
+    상대 오차 FEATURE_TOLERANCE(1e-9) 이내로 일치합니다.
+    """
+
+    def __init__(self):
+        self.n: int = 0
+        self.mean: float = 0.0
+        self.m2: float = 0.0  # 편차 제곱합
+        self.m3: float = 0.0  # 편차 세제곱합
+        self.m4: float = 0.0  # 편차 네제곱합
+        self.max: float = -math.inf
+        self.min: float = math.inf
+
+    def update(self, x: float) -> None:
+        """샘플 하나를 누적합니다."""
+        n1 = self.n
+        self.n += 1
+        n = self.n
+
+        delta = x - self.mean
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        term1 = delta * delta_n * n1
+
+        # 고차 모멘트부터 갱신 (낮은 차수의 이전 값이 필요)
+        self.m4 += (
+            term1 * delta_n2 * (n * n - 3 * n + 3)
+            + 6 * delta_n2 * self.m2
+            - 4 * delta_n * self.m3
+        )
+        self.m3 += term1 * delta_n * (n - 2) - 3 * delta_n * self.m2
+        self.m2 += term1
+        self.mean += delta_n
+
+        if x > self.max:
+            self.max = x
+        if x < self.min:
+            self.min = x
+
+    def extend(self, data: Iterable[float]) -> None:
+        """여러 샘플을 한 번의 순회로 누적합니다."""
+        for x in data:
+            self.update(x)
+
+    def features(self) -> Dict[str, float]:
+        """
+        누적된 모멘트로 8개 특징값을 계산합니다.
+
+        Returns:
+            extract_all_features()와 같은 키를 가진 특징값 딕셔너리
+
+        Raises:
+            ValueError: 샘플이 4개 미만이거나 RMS가 0일 때
+        """
+        n = self.n
+        if n < 4:
+            raise ValueError("특징 추출에는 최소 4개의 데이터가 필요합니다")
+
+        # mean(x^2) = mean^2 + 분산(모집단) → 음수끼리 빼지 않으므로 안정적
+        rms = math.sqrt(self.mean * self.mean + self.m2 / n)
+        if rms == 0:
+            raise ValueError("RMS가 0이므로 Crest Factor를 계산할 수 없습니다")
+
+        if self.m2 == 0:
+            kurtosis = 0.0
+        else:
+            kurtosis = n * self.m4 / (self.m2 * self.m2) - 3.0
+
+        peak = max(abs(self.max), abs(self.min))
+
+        return {
+            "rms": rms,
+            "kurtosis": kurtosis,
+            "peak_to_peak": self.max - self.min,
+            "crest_factor": peak / rms,
+            "mean": float(self.mean),
+            "std": math.sqrt(self.m2 / (n - 1)),
+            "max": float(self.max),
+            "min": float(self.min),
+        }
+
+
+# ============================================================
+# 지연 평가 특징 의존성 그래프
+# ============================================================
+# 각 노드는 (의존 노드들, 계산 함수)이며, 계산 함수는 (데이터 배열, 계산된 값들)을 받습니다.
+# extract_features()는 요청된 특징에 필요한 노드만 한 번씩 계산하고 공유합니다.
+
+def _dot64(a: np.ndarray, b: np.ndarray) -> float:
+    """1차원 내적을 float64로 누적합니다 (float32 입력은 버퍼 단위로 변환)."""
+    if a.dtype == np.float64 and b.dtype == np.float64:
+        return float(np.dot(a, b))
+    return float(np.einsum("i,i->", a, b, dtype=np.float64))
+
+
+def _node_crest_factor(arr: np.ndarray, v: Dict[str, Any]) -> float:
+    if v["rms"] == 0:
+        raise ValueError("RMS가 0이므로 Crest Factor를 계산할 수 없습니다")
+    return v["peak"] / v["rms"]
+
+
+def _node_kurtosis(arr: np.ndarray, v: Dict[str, Any]) -> float:
+    if v["m2_sum"] == 0:
+        return 0.0
+    return arr.size * v["m4_sum"] / (v["m2_sum"] * v["m2_sum"]) - 3.0
+
+
+def _node_dev_sq(arr: np.ndarray, v: Dict[str, Any]) -> np.ndarray:
+    dev_sq = arr - v["mean"]
+    dev_sq *= dev_sq
+    return dev_sq
+
+
+FEATURE_GRAPH: Dict[str, Tuple[Tuple[str, ...], Callable[..., Any]]] = {
+    # 중간값 (데이터 패스가 필요한 노드)
+    "mean": ((), lambda arr, v: float(arr.mean(dtype=np.float64))),
+    "max": ((), lambda arr, v: float(arr.max())),
+    "min": ((), lambda arr, v: float(arr.min())),
+    "sum_sq": ((), lambda arr, v: _dot64(arr, arr)),
+    "dev_sq": (("mean",), _node_dev_sq),
+    "m2_sum": (("dev_sq",), lambda arr, v: float(v["dev_sq"].sum(dtype=np.float64))),
+    "m4_sum": (("dev_sq",), lambda arr, v: _dot64(v["dev_sq"], v["dev_sq"])),
+    "peak": (("max", "min"), lambda arr, v: max(abs(v["max"]), abs(v["min"]))),
+    # 특징 (스칼라 연산만 수행)
+    "rms": (("sum_sq",), lambda arr, v: math.sqrt(v["sum_sq"] / arr.size)),
+    "peak_to_peak": (("max", "min"), lambda arr, v: v["max"] - v["min"]),
+    "crest_factor": (("peak", "rms"), _node_crest_factor),
+    "std": (("m2_sum",), lambda arr, v: math.sqrt(v["m2_sum"] / (arr.size - 1))),
+    "kurtosis": (("m2_sum", "m4_sum"), _node_kurtosis),
+}
+
+# 요청 가능한 특징 이름 (extract_all_features()와 같은 키)
+FEATURE_NAMES = (
+    "rms", "kurtosis", "peak_to_peak", "crest_factor",
+    "mean", "std", "max", "min",
+)
+
+# 특징별 최소 샘플 수와 에러 메시지
+_FEATURE_MIN_SAMPLES = {
+    "kurtosis": (4, "첨도 계산에는 최소 4개의 데이터가 필요합니다"),
+    "std": (2, "표준편차 계산에는 최소 2개의 데이터가 필요합니다"),
+}
+
+
+def _resolve_feature_plan(features: Iterable[str]) -> List[str]:
+    """요청된 특징에 필요한 노드를 의존성 순서(위상 정렬)로 나열합니다."""
+    plan: List[str] = []
+    visited = set()
+
+    def visit(name: str) -> None:
+        if name in visited:
+            return
+        visited.add(name)
+        for dep in FEATURE_GRAPH[name][0]:
+            visit(dep)
+        plan.append(name)
+
+    for name in sorted(features):
+        visit(name)
+    return plan
+
+
+class RollingFeatureExtractor:
+    """
+    슬라이딩 윈도우 특징 추출기
+
+    윈도우 내 샘플의 거듭제곱 합(1~4차)을 추가/제거로 O(1) 갱신하고,
+    최대/최소값은 단조 deque로 추적합니다 (peak = max(|max|, |min|)).
+    hop 샘플마다 extract_all_features()와 같은 키의 특징 행을 내보냅니다.
+
+    상쇄 오차를 줄이기 위해 거듭제곱 합은 기준값(shift)을 뺀 값으로 누적합니다.
+    window개 샘플이 교체될 때, 큰 충격값이 윈도우를 벗어날 때, 또는 DC 단차 등으로
+    윈도우 평균이 기준값에서 표준편차 이상 멀어질 때 평균에 가장 가까운 샘플을
+    새 기준값으로 버퍼에서 합을 다시 계산합니다 (분할 상환 O(1)).
+    """
+
+    # 빠져나간 값의 4차 항이 남은 4차 합의 이 배수를 넘으면 즉시 재계산
+    REBASE_RATIO = 100.0
+
+    def __init__(self, window: int, hop: int):
+        if window < 4:
+            raise ValueError("특징 추출에는 최소 4개의 데이터가 필요합니다")
+        if hop <= 0:
+            raise ValueError("hop은 양수여야 합니다")
+
+        self.window = window
+        self.hop = hop
+        self.count: int = 0
+        self._buffer: deque = deque()
+        self._max_deque: deque = deque()  # (index, value), 값 내림차순
+        self._min_deque: deque = deque()  # (index, value), 값 오름차순
+        self._shift: float = 0.0
+        self._sums = [0.0, 0.0, 0.0, 0.0]
+        self._evicted_since_rebase: int = 0
+
+    def push(self, x: float) -> Optional[Dict[str, float]]:
+        """
+        샘플 하나를 추가합니다.
+
+        Returns:
+            윈도우가 가득 찼고 hop 경계에 도달하면 특징 딕셔너리, 아니면 None
+
+        Raises:
+            ValueError: 내보낼 윈도우의 RMS가 0일 때 (extract_all_features()와 같음)
+        """
+        idx = self.count
+        self.count += 1
+
+        if not self._buffer:
+            self._shift = x
+        self._buffer.append(x)
+        self._add_power_sums(x - self._shift, 1.0)
+
+        while self._max_deque and self._max_deque[-1][1] <= x:
+            self._max_deque.pop()
+        self._max_deque.append((idx, x))
+        while self._min_deque and self._min_deque[-1][1] >= x:
+            self._min_deque.pop()
+        self._min_deque.append((idx, x))
+
+        if len(self._buffer) > self.window:
+            old_d = self._buffer.popleft() - self._shift
+            self._add_power_sums(old_d, -1.0)
+            self._evicted_since_rebase += 1
+            # 남은 합에 비해 큰 값(충격)이 빠져나가면 상쇄 오차가 커지므로 즉시 재계산
+            old_d4 = (old_d * old_d) ** 2
+            if (
+                self._evicted_since_rebase >= self.window
+                or old_d4 > self.REBASE_RATIO * self._sums[3]
+            ):
+                self._rebase()
+
+        # 평균이 기준값에서 멀어지면 (s1² > m2) 분산/첨도 계산의 상쇄 오차가 커짐
+        sums = self._sums
+        if 2.0 * sums[0] * sums[0] > len(self._buffer) * sums[1]:
+            self._rebase()
+
+        oldest = self.count - self.window
+        while self._max_deque[0][0] < oldest:
+            self._max_deque.popleft()
+        while self._min_deque[0][0] < oldest:
+            self._min_deque.popleft()
+
+        if oldest >= 0 and oldest % self.hop == 0:
+            return self.features()
+        return None
+
+    def _add_power_sums(self, d: float, sign: float) -> None:
+        d2 = d * d
+        sums = self._sums
+        sums[0] += sign * d
+        sums[1] += sign * d2
+        sums[2] += sign * d2 * d
+        sums[3] += sign * d2 * d2
+
+    def _rebase(self) -> None:
+        """윈도우 평균에 가장 가까운 샘플을 기준값으로 거듭제곱 합을 다시 계산합니다."""
+        mean = math.fsum(self._buffer) / len(self._buffer)
+        self._shift = min(self._buffer, key=lambda value: abs(value - mean))
+        self._sums = [0.0, 0.0, 0.0, 0.0]
+        for value in self._buffer:
+            self._add_power_sums(value - self._shift, 1.0)
+        self._evicted_since_rebase = 0
+
+    def features(self) -> Dict[str, float]:
+        """
+        현재 윈도우의 특징값을 계산합니다 (O(1)).
+
+        Raises:
+            ValueError: 윈도우가 가득 차지 않았거나 RMS가 0일 때
+        """
+        n = len(self._buffer)
+        if n < self.window:
+            raise ValueError("윈도우가 아직 채워지지 않았습니다")
+
+        max_val = self._max_deque[0][1]
+        min_val = self._min_deque[0][1]
+
+        s1, s2, s3, s4 = (v / n for v in self._sums)
+        # 모든 샘플이 같으면 (max == min) 반올림 잔차와 무관하게 분산은 정확히 0
+        m2 = max(s2 - s1 * s1, 0.0) if max_val != min_val else 0.0
+
+        mean = self._shift + s1
+        rms = math.sqrt(mean * mean + m2)
+        if rms == 0:
+            raise ValueError("RMS가 0이므로 Crest Factor를 계산할 수 없습니다")
+
+        if m2 == 0:
+            kurtosis = 0.0
+        else:
+            s1_sq = s1 * s1
+            m4 = s4 - 4 * s1 * s3 + 6 * s1_sq * s2 - 3 * s1_sq * s1_sq
+            kurtosis = m4 / (m2 * m2) - 3.0
+
+        return {
+            "rms": rms,
+            "kurtosis": kurtosis,
+            "peak_to_peak": max_val - min_val,
+            "crest_factor": max(abs(max_val), abs(min_val)) / rms,
+            "mean": mean,
+            "std": math.sqrt(m2 * n / (n - 1)),
+            "max": float(max_val),
+            "min": float(min_val),
+        }
+
+
+# 리샘플링 필터 설계 상수
+RESAMPLE_MAX_DENOMINATOR = 1000   # up/down 유리수 근사의 최대 분모
+RESAMPLE_ZERO_CROSSINGS = 10      # 필터 반길이 = 10 * max(up, down)
+RESAMPLE_KAISER_BETA = 5.0
+
+
+@lru_cache(maxsize=64)
+def _resample_filter(
+    source_rate: float, target_rate: float
+) -> Tuple[int, int, int, np.ndarray]:
+    """
+    (source_rate, target_rate) 쌍의 폴리페이즈 저역통과 필터를 설계합니다.
+
+    Returns:
+        (up, down, half_len, phases) 튜플.
+        phases[p, j] = h[p + up * j] 이며 읽기 전용입니다 (캐시 공유).
+    """
+    ratio = (Fraction(target_rate) / Fraction(source_rate)).limit_denominator(
+        RESAMPLE_MAX_DENOMINATOR
+    )
+    up, down = ratio.numerator, ratio.denominator
+    if up == down:
+        return up, down, 0, np.ones((1, 1))
+
+    # 업샘플된 신호 기준 차단 주파수 = 1 / max(up, down) (나이퀴스트 정규화)
+    max_rate = max(up, down)
+    half_len = RESAMPLE_ZERO_CROSSINGS * max_rate
+    taps = np.arange(-half_len, half_len + 1, dtype=np.float64)
+    h = np.sinc(taps / max_rate) * np.kaiser(taps.size, RESAMPLE_KAISER_BETA)
+    # 0 삽입 업샘플링으로 줄어든 DC 이득을 up배로 보상
+    h *= up / h.sum()
+
+    taps_per_phase = -(-h.size // up)
+    padded = np.zeros(taps_per_phase * up)
+    padded[:h.size] = h
+    phases = padded.reshape(taps_per_phase, up).T.copy()
+    phases.setflags(write=False)
+
+    return up, down, half_len, phases
+
+
+def _polyphase_resample(
+    block: np.ndarray,
+    up: int,
+    down: int,
+    half_len: int,
+    phases: np.ndarray,
+) -> np.ndarray:
+    """
+    (n_samples, n_channels) 블록에 up/down 폴리페이즈 필터를 적용합니다.
+
+    출력 샘플 m은 업샘플 좌표 t = m * down + half_len(필터 지연 보상)에서
+    y[m] = sum_j phases[t % up, j] * x[t // up - j] 로 계산됩니다.
+    m을 up으로 나눈 나머지가 같은 출력끼리는 위상이 같고 입력 위치가
+    down 간격으로 증가하므로, 탭마다 strided 슬라이스 하나로 모든 출력과
+    채널을 한 번에 누적합니다 (인덱스 gather 복사 없음).
+    """
+    n_samples, n_channels = block.shape
+    taps_per_phase = phases.shape[1]
+    n_out = -(-n_samples * up // down)
+
+    # 신호 양끝 밖은 0으로 간주
+    pad = taps_per_phase + half_len // up + 1
+    padded = np.zeros((n_samples + 2 * pad, n_channels), dtype=block.dtype)
+    padded[pad:pad + n_samples] = block
+
+    # 출력과 탭 누적은 입력 dtype을 따름 (float32 모드에서 대역폭 절반)
+    phases = phases.astype(block.dtype, copy=False)
+    out = np.zeros((n_out, n_channels), dtype=block.dtype)
+    for r in range(min(up, n_out)):
+        t0 = r * down + half_len
+        phase = phases[t0 % up]
+        base = t0 // up + pad
+        out_r = out[r::up]
+        span = (out_r.shape[0] - 1) * down + 1
+
+        for j in range(taps_per_phase):
+            if phase[j] != 0.0:
+                start = base - j
+                out_r += phase[j] * padded[start:start + span:down]
+
+    return out
+
+
+@lru_cache(maxsize=64)
+def _spectral_window(
+    frame_length: int, sample_rate: float
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    (frame_length, sample_rate)별 Hann 윈도우와 주파수 축을 계산합니다.
+
+    Returns:
+        (window, freqs, psd_scale) 튜플. 배열은 읽기 전용입니다 (캐시 공유).
+        psd_scale = 1 / (sample_rate * sum(window^2)) 는 밀도(V^2/Hz) 스케일
+    """
+    window = np.hanning(frame_length)
+    freqs = np.fft.rfftfreq(frame_length, d=1.0 / sample_rate)
+    window.setflags(write=False)
+    freqs.setflags(write=False)
+    psd_scale = 1.0 / (sample_rate * float(np.dot(window, window)))
+    return window, freqs, psd_scale
+
+
+@lru_cache(maxsize=256)
+def _band_bin_ranges(
+    frame_length: int,
+    sample_rate: float,
+    bands: Tuple[Tuple[float, float], ...],
+) -> Tuple[Tuple[int, int], ...]:
+    """주파수 대역 [low, high)를 rfft 빈 인덱스 범위 [start, stop)로 변환합니다."""
+    _, freqs, _ = _spectral_window(frame_length, sample_rate)
+    return tuple(
+        (
+            int(np.searchsorted(freqs, low, side="left")),
+            int(np.searchsorted(freqs, high, side="left")),
+        )
+        for low, high in bands
+    )
+
+
+@dataclass
+class SpectralFeatures:
+    """
+    스펙트럼 특징 결과
+
+    Attributes:
+        freqs: 주파수 축 (Hz), 길이 frame_length // 2 + 1
+        psd: Welch 평균 파워 스펙트럼 밀도 (단측, 단위^2/Hz)
+        band_energies: {(low, high): 대역 에너지} (PSD 적분값)
+        spectral_centroid: 스펙트럼 무게중심 주파수 (Hz)
+        n_frames: 평균에 사용된 프레임 수
+    """
+    freqs: np.ndarray
+    psd: np.ndarray
+    band_energies: Dict[Tuple[float, float], float]
+    spectral_centroid: float
+    n_frames: int
+
+
+def _csv_rows(reader: Iterator[List[str]]) -> Iterator[List[str]]:
+    """
+    csv.reader의 행을 그대로 내보내되, 구문 오류(csv.Error)는 ValueError로 바꿉니다.
+
+    Raises:
+        ValueError: 따옴표 불일치, 필드 크기 제한 초과 등 CSV 구문 오류 (파일 줄 번호 포함)
+    """
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            raise ValueError(f"{reader.line_num}행 CSV 구문 오류: {e}") from e
+        yield row
+
+
+@dataclass
+class BatchFeatureResult:
+    """
+    디렉토리 일괄 특징 추출 결과
+
+    Attributes:
+        features: {파일 상대 경로: 특징 딕셔너리}
+        errors: {파일 상대 경로: 에러 메시지} (실패한 파일만)
+    """
+    features: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+def _extract_file_features(
+    task: Tuple[str, str, str, str]
+) -> Tuple[str, Optional[Dict[str, float]], Optional[str]]:
+    """
+    프로세스 풀 작업 함수: 파일 하나를 로딩하고 특징을 추출합니다.
+
+    피클 가능하도록 모듈 최상위에 정의하며, 에러는 예외 대신 메시지로 반환해
+    한 파일의 실패가 다른 파일 처리에 영향을 주지 않게 합니다.
+
+    Args:
+        task: (key, filepath, backend, dtype) 튜플
+
+    Returns:
+        (key, 특징 딕셔너리 또는 None, 에러 메시지 또는 None)
+    """
+    key, filepath, backend, dtype = task
+    processor = VibrationDataProcessor(backend=backend, dtype=dtype)
+    try:
+        _, amplitudes = processor.load_csv_columnar(filepath)
+        data = amplitudes if backend == "numpy" else amplitudes.tolist()
+        return key, processor.extract_all_features(data), None
+    except (ValueError, OSError) as e:
+        return key, None, f"{type(e).__name__}: {e}"
+
+
+@dataclass
+class IQRFences:
+    """
+    IQR 이상치 경계
+
+    다축 블록에서는 각 값이 (n_axes,) 배열입니다.
+
+    Attributes:
+        q1: 1사분위수
+        q3: 3사분위수
+        lower: 하한 경계 (Q1 - 1.5*IQR)
+        upper: 상한 경계 (Q3 + 1.5*IQR)
+    """
+    q1: Union[float, np.ndarray]
+    q3: Union[float, np.ndarray]
+    lower: Union[float, np.ndarray]
+    upper: Union[float, np.ndarray]
+
+    # 경계 계산에 사용하는 IQR 배수
+    MULTIPLIER = 1.5
+
+    @classmethod
+    def from_quartiles(cls, q1: float, q3: float) -> "IQRFences":
+        """Q1, Q3로 경계를 계산합니다."""
+        iqr = q3 - q1
+        return cls(
+            q1=q1,
+            q3=q3,
+            lower=q1 - cls.MULTIPLIER * iqr,
+            upper=q3 + cls.MULTIPLIER * iqr,
+        )
+
+
+class P2Quantile:
+    """
+    P² 알고리즘 기반 스트리밍 분위수 추정기 (Jain & Chlamtac, 1985)
+
+    5개의 마커 높이/위치만 유지하면서 샘플마다 포물선 보간으로 마커를 조정합니다.
+    메모리 사용량은 샘플 수와 무관하게 일정합니다.
+    처음 5개 샘플까지는 정확한 분위수를 반환합니다.
+    """
+
+    def __init__(self, p: float):
+        if not 0.0 < p < 1.0:
+            raise ValueError("분위수 p는 0과 1 사이여야 합니다")
+        self.p = p
+        self.count: int = 0
+        self._heights: List[float] = []
+        self._positions: List[int] = [1, 2, 3, 4, 5]
+        self._desired: List[float] = [1.0, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5.0]
+        self._increments: List[float] = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def update(self, x: float) -> None:
+        """샘플 하나로 추정값을 갱신합니다."""
+        self.count += 1
+        q = self._heights
+
+        if self.count <= 5:
+            q.append(x)
+            if self.count == 5:
+                q.sort()
+            return
+
+        n = self._positions
+
+        # x가 속한 셀 k 찾기 (양끝 마커는 최소/최대값으로 갱신)
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # 중간 마커 3개를 원하는 위치로 조정
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (
+                d <= -1 and n[i - 1] - n[i] < -1
+            ):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if q[i - 1] < candidate < q[i + 1]:
+                    q[i] = candidate
+                else:
+                    q[i] += step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                n[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        """P² 포물선(piecewise-parabolic) 보간 공식"""
+        q = self._heights
+        n = self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> float:
+        """
+        현재 분위수 추정값을 반환합니다.
+
+        Raises:
+            ValueError: 샘플이 없을 때
+        """
+        if self.count == 0:
+            raise ValueError("데이터가 비어있습니다")
+
+        if self.count <= 5:
+            ordered = sorted(self._heights)
+            pos = (len(ordered) - 1) * self.p
+            lower = int(pos)
+            upper = min(lower + 1, len(ordered) - 1)
+            return ordered[lower] + (pos - lower) * (
+                ordered[upper] - ordered[lower]
+            )
+
+        return self._heights[2]
+
+
+class StreamingIQR:
+    """
+    무한 스트림용 근사 IQR 경계 추정기
+
+    Q1, Q3를 각각 P2Quantile로 추적하므로 메모리 사용량이 일정합니다.
+    """
+
+    def __init__(self):
+        self._q1 = P2Quantile(0.25)
+        self._q3 = P2Quantile(0.75)
+
+    @property
+    def count(self) -> int:
+        """지금까지 누적된 샘플 수"""
+        return self._q1.count
+
+    def update(self, x: float) -> None:
+        """샘플 하나를 누적합니다."""
+        self._q1.update(x)
+        self._q3.update(x)
+
+    def extend(self, data: Iterable[float]) -> None:
+        """여러 샘플을 누적합니다."""
+        for x in data:
+            self.update(x)
+
+    def fences(self) -> IQRFences:
+        """
+        현재 추정값으로 IQR 경계를 계산합니다.
+
+        Raises:
+            ValueError: 샘플이 없을 때
+        """
+        return IQRFences.from_quartiles(self._q1.value(), self._q3.value())
 
 
 class VibrationDataProcessor:
@@ -22,6 +729,87 @@ class VibrationDataProcessor:
     설비 예지보전을 위한 진동 데이터의 수집, 전처리, 특징 추출을 담당합니다.
     """
 
+    # extract_all_features()와 개별 calculate_* 결과 간 허용 상대 오차
+    FEATURE_TOLERANCE = 1e-9
+
+    # 지원하는 연산 백엔드
+    BACKENDS = ("list", "numpy")
+
+    # 지원하는 샘플 dtype (float32는 numpy 백엔드 전용)
+    DTYPES = ("float64", "float32")
+
+    # dtype="float32" 모드 특징 값의 float64 경로 대비 허용 상대 오차
+    # (입력 양자화 오차 2^-24 ≈ 6e-8에 누적·제곱 연산 여유를 둔 값)
+    FLOAT32_FEATURE_TOLERANCE = 1e-5
+
+    # CSV 필수 컬럼
+    REQUIRED_CSV_COLUMNS = ("timestamp", "amplitude")
+
+    # iter_csv_chunks() 기본 블록 크기 (행 수)
+    DEFAULT_CHUNK_SIZE = 65536
+
+    def __init__(self, backend: str = "list", dtype: str = "float64"):
+        """
+        처리기 초기화
+
+        Args:
+            backend: 연산 백엔드
+                "list": Python 리스트 입출력 (기본값)
+                "numpy": ndarray/버퍼 입력, ndarray 출력, 벡터 연산
+            dtype: 샘플 배열 타입
+                "float64": 기본값
+                "float32": 샘플과 중간 배열을 float32로 처리 (numpy 백엔드 전용).
+                    누적은 float64로 수행하며, 특징 값의 상대 오차는
+                    FLOAT32_FEATURE_TOLERANCE 이내
+
+        Raises:
+            ValueError: 지원하지 않는 백엔드나 dtype일 때
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                f"지원하지 않는 백엔드입니다: {backend}. "
+                f"지원 백엔드: {list(self.BACKENDS)}"
+            )
+        if dtype not in self.DTYPES:
+            raise ValueError(
+                f"지원하지 않는 dtype입니다: {dtype}. "
+                f"지원 타입: {list(self.DTYPES)}"
+            )
+        if dtype == "float32" and backend != "numpy":
+            raise ValueError("float32 모드는 numpy 백엔드에서만 지원합니다")
+        self.backend = backend
+        self.dtype = np.dtype(dtype)
+
+    def _as_array(self, data: ArrayLike, allow_2d: bool = False) -> np.ndarray:
+        """
+        입력을 1차원 float 배열로 변환합니다.
+
+        ndarray와 버퍼 프로토콜 객체(array('d'), memoryview 등)는
+        float 타입이면 복사 없이 뷰로 사용합니다.
+        float32 모드에서는 float32가 아닌 입력만 float32로 변환합니다.
+        리스트의 None은 NaN으로 변환됩니다.
+        allow_2d=True이면 (n_samples, n_channels) 블록도 허용합니다.
+        """
+        if isinstance(data, list):
+            arr = np.array(data, dtype=self.dtype)
+        else:
+            arr = np.asarray(data)
+
+        if arr.dtype.kind != "f" or (
+            self.dtype == np.float32 and arr.dtype != np.float32
+        ):
+            arr = arr.astype(self.dtype)
+
+        if allow_2d and arr.ndim == 2:
+            return arr
+
+        if arr.ndim != 1:
+            raise ValueError(
+                f"1차원 데이터만 지원합니다: shape={arr.shape}"
+            )
+
+        return arr
+
     def load_csv(self, filepath: str) -> List[Dict[str, float]]:
         """
         CSV 파일에서 진동 데이터를 로딩합니다.
@@ -42,16 +830,7 @@ class VibrationDataProcessor:
                 reader = csv.DictReader(f)
 
                 # 헤더 검증
-                if reader.fieldnames is None:
-                    raise ValueError("CSV 파일이 비어있습니다")
-
-                required_columns = {"timestamp", "amplitude"}
-                actual_columns = set(reader.fieldnames)
-                missing = required_columns - actual_columns
-                if missing:
-                    raise ValueError(
-                        f"필수 컬럼이 누락되었습니다: {missing}"
-                    )
+                self._validate_csv_header(reader.fieldnames)
 
                 for row_num, row in enumerate(reader, start=2):
                     try:
@@ -68,75 +847,281 @@ class VibrationDataProcessor:
 
         return data
 
-    def clean_data(self, data: List[Optional[float]]) -> List[float]:
+    def _validate_csv_header(
+        self,
+        fieldnames: Optional[List[str]],
+        required: Sequence[str] = REQUIRED_CSV_COLUMNS,
+    ) -> None:
+        """
+        CSV 헤더에 필수 컬럼이 있는지 검증합니다.
+
+        Raises:
+            ValueError: 헤더가 없거나 필수 컬럼이 누락되었을 때
+        """
+        if fieldnames is None:
+            raise ValueError("CSV 파일이 비어있습니다")
+
+        missing = set(required) - set(fieldnames)
+        if missing:
+            raise ValueError(
+                f"필수 컬럼이 누락되었습니다: {missing}"
+            )
+
+    def iter_csv_chunks(
+        self,
+        filepath: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        amplitude_columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        CSV 파일을 고정 크기 컬럼 블록 단위로 읽습니다.
+
+        행마다 딕셔너리를 만들지 않고 timestamp/amplitude를 배열에
+        바로 채우므로, 파일 크기와 무관하게 메모리 사용량이
+        chunk_size에 비례하는 수준으로 유지됩니다.
+        헤더 검증과 행 번호 에러 메시지는 load_csv()와 같습니다.
+
+        Args:
+            filepath: CSV 파일 경로 (timestamp, amplitude 컬럼 필요)
+            chunk_size: 블록당 최대 행 수
+            amplitude_columns: 다축 센서의 진폭 컬럼 이름들 (예: ("x", "y", "z")).
+                None이면 "amplitude" 단일 컬럼
+
+        Yields:
+            (timestamps, amplitudes) 배열 튜플. timestamps는 항상 float64,
+            amplitudes는 처리기 dtype이며 단일 컬럼이면 (n,), 다축이면 (n, n_axes)
+            마지막 블록은 chunk_size보다 짧을 수 있습니다.
+
+        Raises:
+            FileNotFoundError: 파일이 존재하지 않을 때
+            ValueError: CSV 형식이 올바르지 않거나 chunk_size가 0 이하일 때
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size는 양수여야 합니다")
+
+        try:
+            f = open(filepath, "r", encoding="utf-8", newline="")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {filepath}")
+
+        with f:
+            reader = csv.reader(f)
+            rows = _csv_rows(reader)
+
+            if amplitude_columns is None:
+                columns: Tuple[str, ...] = ("amplitude",)
+                shape: Tuple[int, ...] = (chunk_size,)
+            else:
+                columns = tuple(amplitude_columns)
+                shape = (chunk_size, len(columns))
+                if not columns:
+                    raise ValueError("진폭 컬럼을 하나 이상 지정해야 합니다")
+
+            # DictReader와 같이 첫 줄이 헤더 (앞쪽 빈 줄은 건너뛰지 않으므로
+            # 빈 줄로 시작하는 파일은 load_csv()와 같은 필수 컬럼 에러)
+            header = next(rows, None)
+            self._validate_csv_header(header, ("timestamp",) + columns)
+            ts_col = header.index("timestamp")
+            amp_cols = [header.index(name) for name in columns]
+            amp_col = amp_cols[0]
+
+            timestamps = np.empty(chunk_size, dtype=np.float64)
+            amplitudes = np.empty(shape, dtype=self.dtype)
+            count = 0
+
+            # 데이터 행의 빈 줄은 DictReader와 같이 건너뜀 (행 번호 계산도 동일)
+            data_rows = (row for row in rows if row)
+            for row_num, row in enumerate(data_rows, start=2):
+                try:
+                    timestamps[count] = float(row[ts_col])
+                    if amplitude_columns is None:
+                        amplitudes[count] = float(row[amp_col])
+                    else:
+                        amplitudes[count] = [float(row[c]) for c in amp_cols]
+                except (ValueError, TypeError, IndexError) as e:
+                    raise ValueError(
+                        f"{row_num}행 데이터 변환 오류: {e}"
+                    )
+                count += 1
+
+                if count == chunk_size:
+                    yield timestamps, amplitudes
+                    # 소비자가 이전 블록을 보관할 수 있도록 새 버퍼 할당
+                    timestamps = np.empty(chunk_size, dtype=np.float64)
+                    amplitudes = np.empty(shape, dtype=self.dtype)
+                    count = 0
+
+            if count:
+                yield timestamps[:count], amplitudes[:count]
+
+    def load_csv_columnar(
+        self,
+        filepath: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        amplitude_columns: Optional[Sequence[str]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        CSV 파일 전체를 컬럼 형태로 로딩합니다.
+
+        iter_csv_chunks()의 블록을 이어 붙입니다.
+
+        Args:
+            filepath: CSV 파일 경로 (timestamp, amplitude 컬럼 필요)
+            chunk_size: 내부 읽기 블록 크기
+            amplitude_columns: 다축 진폭 컬럼 이름들 (None이면 "amplitude")
+
+        Returns:
+            (timestamps, amplitudes) 배열 튜플 (dtype은 iter_csv_chunks()와 같음).
+            amplitudes는 다축이면 (n, n_axes)
+
+        Raises:
+            FileNotFoundError: 파일이 존재하지 않을 때
+            ValueError: CSV 형식이 올바르지 않을 때
+        """
+        ts_chunks = []
+        amp_chunks = []
+        for timestamps, amplitudes in self.iter_csv_chunks(
+            filepath, chunk_size, amplitude_columns
+        ):
+            ts_chunks.append(timestamps)
+            amp_chunks.append(amplitudes)
+
+        if not ts_chunks:
+            empty = np.empty(0, dtype=np.float64)
+            if amplitude_columns is None:
+                return empty, np.empty(0, dtype=self.dtype)
+            return empty, np.empty((0, len(amplitude_columns)), dtype=self.dtype)
+
+        return np.concatenate(ts_chunks), np.concatenate(amp_chunks)
+
+    def clean_data(
+        self, data: List[Optional[float]], in_place: bool = False
+    ) -> List[float]:
         """
         결측치(None)를 선형 보간으로 채웁니다.
 
         선형 보간: 양쪽의 유효한 값을 이용하여 비례적으로 채움
         첫 번째/마지막 값이 None인 경우 가장 가까운 유효값으로 채움
 
+        보간 건수와 최장 갭이 필요하면 clean_data_with_report()를 사용하세요.
+
         Args:
             data: None을 포함할 수 있는 float 리스트
+                (numpy 백엔드에서는 NaN을 결측치로 갖는 float 배열도 가능)
+            in_place: True이면 float 배열 입력을 복사 없이 직접 채움
 
         Returns:
-            None이 제거된 float 리스트
+            None이 제거된 float 리스트 (numpy 백엔드는 ndarray)
 
         Raises:
             ValueError: 데이터가 비어있거나 모든 값이 None일 때
         """
-        if not data:
-            raise ValueError("데이터가 비어있습니다")
+        cleaned, _ = self.clean_data_with_report(data, in_place=in_place)
+        return cleaned
 
-        if all(v is None for v in data):
-            raise ValueError("모든 값이 결측치입니다")
+    def clean_data_with_report(
+        self, data: List[Optional[float]], in_place: bool = False
+    ) -> Tuple[List[float], CleaningReport]:
+        """
+        결측치를 선형 보간으로 채우고 보간 통계를 함께 반환합니다.
 
-        result = list(data)
+        None(리스트)과 NaN(float 배열)을 결측치로 취급합니다.
+        보간은 두 백엔드 모두 NumPy 커널로 한 번에 처리합니다.
 
-        # 유효한 값의 인덱스 찾기
-        valid_indices = [i for i, v in enumerate(result) if v is not None]
+        Args:
+            data: None/NaN을 포함할 수 있는 데이터.
+                (n_samples, n_axes) 블록은 축별로 보간
+            in_place: True이면 입력 배열을 직접 채움.
+                쓰기 가능한 float 배열(ndarray, array('d') 등)만 지원
 
-        if not valid_indices:
-            raise ValueError("모든 값이 결측치입니다")
+        Returns:
+            (보간된 데이터, CleaningReport) 튜플.
+            list 백엔드는 리스트, numpy 백엔드는 ndarray를 반환
 
-        # 시작 부분의 None을 첫 번째 유효값으로 채움
-        first_valid = valid_indices[0]
-        for i in range(first_valid):
-            result[i] = result[first_valid]
+        Raises:
+            ValueError: 데이터가 비어있거나 모든 값이 결측치일 때,
+                in_place를 지원하지 않는 입력일 때
+        """
+        if isinstance(data, list) and not data:
+            raise ValueError("데이터가 비어있습니다")
 
-        # 끝 부분의 None을 마지막 유효값으로 채움
-        last_valid = valid_indices[-1]
-        for i in range(last_valid + 1, len(result)):
-            result[i] = result[last_valid]
+        arr = self._as_array(data, allow_2d=True)
+
+        if in_place:
+            if (
+                isinstance(data, list)
+                or not arr.flags.writeable
+                or not np.shares_memory(arr, np.asarray(data))
+            ):
+                raise ValueError(
+                    "in_place는 쓰기 가능한 float 배열에서만 지원합니다"
+                )
+        elif not isinstance(data, list):
+            # 리스트는 _as_array()에서 이미 새 배열로 변환됨
+            arr = arr.copy()
+
+        report = self._fill_gaps(arr)
+
+        if self.backend == "list":
+            return arr.tolist(), report
+        return arr, report
+
+    @classmethod
+    def _fill_gaps(cls, arr: np.ndarray) -> CleaningReport:
+        """NaN 구간을 np.interp로 채우고 보간 통계를 계산합니다 (제자리 수정)"""
+        if arr.size == 0:
+            raise ValueError("데이터가 비어있습니다")
 
-        # 중간 부분의 None을 선형 보간
-        for idx in range(len(valid_indices) - 1):
-            start = valid_indices[idx]
-            end = valid_indices[idx + 1]
+        if arr.ndim == 2:
+            # 축별로 독립 보간 (열 뷰를 제자리 수정), 통계는 전체 축 기준
+            reports = [cls._fill_gaps(arr[:, axis]) for axis in range(arr.shape[1])]
+            return CleaningReport(
+                imputed_count=sum(r.imputed_count for r in reports),
+                longest_gap=max(r.longest_gap for r in reports),
+            )
 
-            if end - start > 1:
-                # 사이에 None이 있는 경우
-                start_val = result[start]
-                end_val = result[end]
-                gap = end - start
+        missing = np.isnan(arr)
+        if not missing.any():
+            return CleaningReport(imputed_count=0, longest_gap=0)
 
-                for i in range(start + 1, end):
-                    # 선형 보간 계산
-                    fraction = (i - start) / gap
-                    result[i] = start_val + fraction * (end_val - start_val)
+        valid = ~missing
+        if not valid.any():
+            raise ValueError("모든 값이 결측치입니다")
 
-        return result
+        # np.interp는 범위 밖을 양끝 유효값으로 채우므로 기존 동작과 같음
+        idx = np.arange(arr.size)
+        arr[missing] = np.interp(idx[missing], idx[valid], arr[valid])
+
+        # 결측 구간의 시작/끝 경계로 갭 길이 계산
+        edges = np.diff(missing.astype(np.int8), prepend=0, append=0)
+        gap_lengths = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+
+        return CleaningReport(
+            imputed_count=int(missing.sum()),
+            longest_gap=int(gap_lengths.max()),
+        )
 
     def remove_outliers(
-        self, data: List[float], method: str = "iqr"
+        self,
+        data: List[float],
+        method: str = "iqr",
+        fences: Optional[IQRFences] = None,
     ) -> List[float]:
         """
         통계적 방법으로 이상치를 제거합니다.
 
         IQR 방법: Q1 - 1.5*IQR ~ Q3 + 1.5*IQR 범위 밖의 값을 제거
 
+        Q1/Q3는 전체 정렬 대신 선택 알고리즘(np.partition, 선형 시간)으로 구합니다.
+        경계값을 재사용하려면 compute_iqr_fences()로 구한 결과를 fences로 전달하세요.
+
+        (n_samples, n_axes) 블록은 축별 경계를 구한 뒤, 한 축이라도 벗어난
+        샘플(행)을 모든 축에서 함께 제거합니다.
+
         Args:
             data: float 리스트
             method: 이상치 제거 방법 ("iqr" 지원)
+            fences: 미리 계산된 IQR 경계 (None이면 data로 계산)
 
         Returns:
             이상치가 제거된 float 리스트
@@ -147,42 +1132,105 @@ class VibrationDataProcessor:
         if method != "iqr":
             raise ValueError(f"지원하지 않는 방법입니다: {method}")
 
-        if len(data) < 4:
-            # 데이터가 너무 적으면 이상치 판단 불가
-            return list(data)
+        arr = self._as_array(data, allow_2d=True)
 
-        sorted_data = sorted(data)
-        n = len(sorted_data)
+        if fences is None:
+            if arr.shape[0] < 4:
+                # 데이터가 너무 적으면 이상치 판단 불가
+                return list(data) if self.backend == "list" else arr.copy()
+            fences = self._iqr_fences_array(arr)
 
-        # Q1 (25번째 백분위수)
-        q1_idx = n * 0.25
-        if q1_idx == int(q1_idx):
-            q1 = sorted_data[int(q1_idx)]
-        else:
-            lower = int(q1_idx)
-            upper = lower + 1
-            fraction = q1_idx - lower
-            q1 = sorted_data[lower] + fraction * (
-                sorted_data[min(upper, n - 1)] - sorted_data[lower]
-            )
+        if arr.ndim == 2 or self.backend == "numpy":
+            inside = (arr >= fences.lower) & (arr <= fences.upper)
+            if arr.ndim == 2:
+                inside = inside.all(axis=1)
+            kept = arr[inside]
+            return kept if self.backend == "numpy" else kept.tolist()
 
-        # Q3 (75번째 백분위수)
-        q3_idx = n * 0.75
-        if q3_idx == int(q3_idx):
-            q3 = sorted_data[int(q3_idx)]
-        else:
-            lower = int(q3_idx)
-            upper = lower + 1
-            fraction = q3_idx - lower
-            q3 = sorted_data[lower] + fraction * (
-                sorted_data[min(upper, n - 1)] - sorted_data[lower]
-            )
+        return [x for x in data if fences.lower <= x <= fences.upper]
 
-        iqr = q3 - q1
-        lower_bound = q1 - 1.5 * iqr
-        upper_bound = q3 + 1.5 * iqr
+    def compute_iqr_fences(self, data: List[float]) -> IQRFences:
+        """
+        IQR 이상치 경계를 계산합니다.
+
+        remove_outliers()와 같은 분위수 규칙(위치 = n * p, 선형 보간)을 사용합니다.
+
+        Args:
+            data: float 리스트 또는 배열
+
+        Returns:
+            IQRFences: Q1, Q3와 하한/상한 경계.
+                (n_samples, n_axes) 블록이면 각 값이 축별 배열
+
+        Raises:
+            ValueError: 데이터가 4개 미만일 때
+        """
+        arr = self._as_array(data, allow_2d=True)
+        if arr.shape[0] < 4:
+            raise ValueError("IQR 계산에는 최소 4개의 데이터가 필요합니다")
+        return self._iqr_fences_array(arr)
+
+    @staticmethod
+    def _iqr_fences_array(arr: np.ndarray) -> IQRFences:
+        """np.partition으로 Q1/Q3 위치의 원소만 선택해 경계를 계산합니다."""
+        n = arr.shape[0]
+        positions = [n * 0.25, n * 0.75]
+
+        # 보간에 필요한 인덱스(하한, 하한+1)만 정렬된 위치로 선택
+        kth = sorted({
+            min(int(pos) + offset, n - 1)
+            for pos in positions
+            for offset in (0, 1)
+        })
+        part = np.partition(arr, kth, axis=0)
+        # 1차원이면 float, 2차원이면 축별 배열
+        to_value = float if arr.ndim == 1 else np.asarray
+
+        def quantile(pos: float) -> Union[float, np.ndarray]:
+            lower = int(pos)
+            if pos == lower:
+                return to_value(part[lower])
+            upper = min(lower + 1, n - 1)
+            fraction = pos - lower
+            return to_value(part[lower] + fraction * (part[upper] - part[lower]))
+
+        return IQRFences.from_quartiles(
+            quantile(positions[0]), quantile(positions[1])
+        )
+
+    def iter_remove_outliers(
+        self,
+        chunks: Iterable[List[float]],
+        sketch: Optional[StreamingIQR] = None,
+    ) -> Iterator[List[float]]:
+        """
+        스트림(청크 반복자)에서 근사 IQR 경계로 이상치를 제거합니다.
+
+        각 청크로 P² 분위수 스케치를 갱신한 뒤, 그 시점의 경계로 청크를 거릅니다.
+        메모리 사용량은 스트림 길이와 무관하게 일정합니다.
+        누적 샘플이 4개 미만이면 remove_outliers()처럼 청크를 그대로 통과시킵니다.
+
+        Args:
+            chunks: float 리스트/배열의 반복자
+            sketch: 상태를 이어갈 StreamingIQR (None이면 새로 생성).
+                스트림 처리 후 sketch.fences()로 경계를 다시 사용할 수 있음
+
+        Yields:
+            이상치가 제거된 청크
+        """
+        if sketch is None:
+            sketch = StreamingIQR()
+
+        for chunk in chunks:
+            sketch.extend(self._as_array(chunk).tolist())
+
+            if sketch.count < 4:
+                yield list(chunk) if self.backend == "list" else (
+                    self._as_array(chunk).copy()
+                )
+                continue
 
-        return [x for x in data if lower_bound <= x <= upper_bound]
+            yield self.remove_outliers(chunk, fences=sketch.fences())
 
     def resample(self, data: List[float], target_freq: int) -> List[float]:
         """
@@ -201,6 +1249,9 @@ class VibrationDataProcessor:
         Raises:
             ValueError: 데이터가 비어있거나 target_freq가 0 이하일 때
         """
+        if self.backend == "numpy":
+            return self._resample_array(self._as_array(data), target_freq)
+
         if not data:
             raise ValueError("데이터가 비어있습니다")
 
@@ -233,6 +1284,80 @@ class VibrationDataProcessor:
 
         return result
 
+    def _resample_array(
+        self, arr: np.ndarray, target_freq: int
+    ) -> np.ndarray:
+        """resample()의 numpy 커널 (np.interp로 위치 일괄 보간)"""
+        if arr.size == 0:
+            raise ValueError("데이터가 비어있습니다")
+
+        if target_freq <= 0:
+            raise ValueError("목표 주파수는 양수여야 합니다")
+
+        original_len = arr.size
+        if target_freq == original_len:
+            return arr.copy()
+
+        # list 백엔드와 같은 길이 계산식 (부동소수점 반올림까지 동일)
+        ratio = target_freq / original_len
+        target_len = max(1, int(original_len * ratio))
+        positions = np.arange(target_len) * (
+            (original_len - 1) / max(1, target_len - 1)
+        )
+        return np.interp(positions, np.arange(original_len), arr).astype(
+            self.dtype, copy=False
+        )
+
+    def resample_to_rate(
+        self,
+        data: ArrayLike,
+        source_rate: float,
+        target_rate: float,
+    ) -> ArrayLike:
+        """
+        실제 샘플링 주파수 기준으로 안티에일리어싱 리샘플링을 수행합니다.
+
+        target_rate / source_rate를 유리수 up/down으로 근사한 뒤,
+        Kaiser 윈도우 저역통과 FIR을 적용하는 폴리페이즈 방식으로 변환합니다.
+        필터 계수는 (source_rate, target_rate) 쌍마다 한 번만 설계되어 캐시됩니다.
+        (n_samples, n_channels) 블록은 모든 채널을 한 번에 처리합니다.
+
+        Args:
+            data: (n_samples,) 또는 (n_samples, n_channels) 데이터
+            source_rate: 원본 샘플링 주파수 (Hz)
+            target_rate: 목표 샘플링 주파수 (Hz)
+
+        Returns:
+            리샘플링된 데이터. 길이는 ceil(n_samples * up / down).
+            list 백엔드는 리스트, numpy 백엔드는 ndarray
+
+        Raises:
+            ValueError: 데이터가 비어있거나 주파수가 0 이하일 때
+        """
+        if source_rate <= 0 or target_rate <= 0:
+            raise ValueError("샘플링 주파수는 양수여야 합니다")
+
+        arr = self._as_array(data, allow_2d=True)
+        if arr.shape[0] == 0:
+            raise ValueError("데이터가 비어있습니다")
+
+        up, down, half_len, phases = _resample_filter(
+            float(source_rate), float(target_rate)
+        )
+
+        if up == down:
+            result = np.array(arr, dtype=self.dtype)
+        else:
+            block = arr if arr.ndim == 2 else arr[:, np.newaxis]
+            block = block.astype(self.dtype, copy=False)
+            result = _polyphase_resample(block, up, down, half_len, phases)
+            if arr.ndim == 1:
+                result = result[:, 0]
+
+        if self.backend == "list":
+            return result.tolist()
+        return result
+
     def calculate_rms(self, data: List[float]) -> float:
         """
         RMS(Root Mean Square)를 계산합니다.
@@ -249,6 +1374,12 @@ class VibrationDataProcessor:
         Raises:
             ValueError: 데이터가 비어있을 때
         """
+        if self.backend == "numpy":
+            arr = self._as_array(data)
+            if arr.size == 0:
+                raise ValueError("데이터가 비어있습니다")
+            return math.sqrt(_dot64(arr, arr) / arr.size)
+
         if not data:
             raise ValueError("데이터가 비어있습니다")
 
@@ -274,6 +1405,9 @@ class VibrationDataProcessor:
         Raises:
             ValueError: 데이터가 3개 미만일 때
         """
+        if self.backend == "numpy":
+            return self._kurtosis_array(self._as_array(data))
+
         n = len(data)
         if n < 4:
             raise ValueError("첨도 계산에는 최소 4개의 데이터가 필요합니다")
@@ -293,6 +1427,22 @@ class VibrationDataProcessor:
 
         return kurtosis
 
+    def _kurtosis_array(self, arr: np.ndarray) -> float:
+        """calculate_kurtosis()의 numpy 커널"""
+        if arr.size < 4:
+            raise ValueError("첨도 계산에는 최소 4개의 데이터가 필요합니다")
+
+        # 편차 배열은 입력 dtype, 평균과 모멘트 누적은 float64
+        mean = arr.dtype.type(arr.mean(dtype=np.float64))
+        dev_sq = arr - mean
+        dev_sq *= dev_sq
+        m2 = float(dev_sq.mean(dtype=np.float64))
+        if m2 == 0:
+            return 0.0
+
+        m4 = _dot64(dev_sq, dev_sq) / arr.size
+        return m4 / (m2 * m2) - 3.0
+
     def calculate_peak_to_peak(self, data: List[float]) -> float:
         """
         Peak-to-Peak 값을 계산합니다.
@@ -308,6 +1458,12 @@ class VibrationDataProcessor:
         Raises:
             ValueError: 데이터가 비어있을 때
         """
+        if self.backend == "numpy":
+            arr = self._as_array(data)
+            if arr.size == 0:
+                raise ValueError("데이터가 비어있습니다")
+            return float(arr.max() - arr.min())
+
         if not data:
             raise ValueError("데이터가 비어있습니다")
 
@@ -329,7 +1485,11 @@ class VibrationDataProcessor:
         Raises:
             ValueError: 데이터가 비어있거나 RMS가 0일 때
         """
-        if not data:
+        if self.backend == "numpy":
+            data = self._as_array(data)
+            if data.size == 0:
+                raise ValueError("데이터가 비어있습니다")
+        elif not data:
             raise ValueError("데이터가 비어있습니다")
 
         rms = self.calculate_rms(data)
@@ -337,13 +1497,20 @@ class VibrationDataProcessor:
         if rms == 0:
             raise ValueError("RMS가 0이므로 Crest Factor를 계산할 수 없습니다")
 
-        peak = max(abs(x) for x in data)
+        if self.backend == "numpy":
+            peak = float(max(data.max(), -data.min()))
+        else:
+            peak = max(abs(x) for x in data)
         return peak / rms
 
     def extract_all_features(self, data: List[float]) -> Dict[str, float]:
         """
         모든 특징값을 한번에 추출합니다.
 
+        MomentAccumulator로 데이터를 한 번만 순회합니다.
+        결과는 calculate_rms() 등 개별 메서드 및 statistics.mean/stdev와
+        상대 오차 FEATURE_TOLERANCE 이내로 일치합니다.
+
         Args:
             data: float 리스트
 
@@ -361,23 +1528,365 @@ class VibrationDataProcessor:
             }
 
         Raises:
-            ValueError: 데이터가 충분하지 않을 때
+            ValueError: 데이터가 충분하지 않거나 RMS가 0일 때
         """
+        if self.backend == "numpy":
+            return self._features_array(self._as_array(data))
+
         if not data:
             raise ValueError("데이터가 비어있습니다")
 
         if len(data) < 4:
             raise ValueError("특징 추출에는 최소 4개의 데이터가 필요합니다")
 
-        features = {
-            "rms": self.calculate_rms(data),
-            "kurtosis": self.calculate_kurtosis(data),
-            "peak_to_peak": self.calculate_peak_to_peak(data),
-            "crest_factor": self.calculate_crest_factor(data),
-            "mean": statistics.mean(data),
-            "std": statistics.stdev(data),
-            "max": max(data),
-            "min": min(data),
+        acc = MomentAccumulator()
+        acc.extend(data)
+        return acc.features()
+
+    def _features_array(self, arr: np.ndarray) -> Dict[str, float]:
+        """extract_all_features()의 numpy 커널 (중간값을 공유)"""
+        columns = self._features_block(arr[:, np.newaxis])
+        return {key: float(values[0]) for key, values in columns.items()}
+
+    @staticmethod
+    def _features_block(block: np.ndarray) -> Dict[str, np.ndarray]:
+        """(n_samples, n_channels) 블록의 채널별 특징을 한 번에 계산합니다."""
+        n = block.shape[0]
+        if n == 0:
+            raise ValueError("데이터가 비어있습니다")
+
+        if n < 4:
+            raise ValueError("특징 추출에는 최소 4개의 데이터가 필요합니다")
+
+        # 편차 배열은 블록 dtype, 평균과 모멘트 누적은 float64
+        mean = block.mean(axis=0, dtype=np.float64)
+        max_val = block.max(axis=0).astype(np.float64)
+        min_val = block.min(axis=0).astype(np.float64)
+
+        dev_sq = block - mean.astype(block.dtype)
+        dev_sq *= dev_sq
+        m2_sum = dev_sq.sum(axis=0, dtype=np.float64)
+        m4_sum = np.einsum("ij,ij->j", dev_sq, dev_sq, dtype=np.float64)
+
+        rms = np.sqrt(mean * mean + m2_sum / n)
+        if np.any(rms == 0):
+            raise ValueError("RMS가 0이므로 Crest Factor를 계산할 수 없습니다")
+
+        # 분산이 0인 채널의 첨도는 0
+        safe_m2 = np.where(m2_sum == 0, 1.0, m2_sum)
+        kurtosis = np.where(
+            m2_sum == 0, 0.0, n * m4_sum / (safe_m2 * safe_m2) - 3.0
+        )
+
+        return {
+            "rms": rms,
+            "kurtosis": kurtosis,
+            "peak_to_peak": max_val - min_val,
+            "crest_factor": np.maximum(np.abs(max_val), np.abs(min_val)) / rms,
+            "mean": mean,
+            "std": np.sqrt(m2_sum / (n - 1)),
+            "max": max_val,
+            "min": min_val,
         }
 
-        return features
+    def extract_multiaxis_features(
+        self,
+        block: ArrayLike,
+        axis_names: Sequence[str] = ("x", "y", "z"),
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        다축(예: 3축 가속도계) 블록의 축별 특징과 벡터 크기 채널 특징을 추출합니다.
+
+        벡터 크기 채널 sqrt(x^2 + y^2 + ...)을 블록에 붙인 뒤,
+        모든 채널의 특징을 한 번의 벡터 연산으로 계산합니다.
+
+        Args:
+            block: (n_samples, n_axes) 데이터
+            axis_names: 축 이름들 (n_axes개)
+
+        Returns:
+            {축 이름: 특징 딕셔너리, ..., "magnitude": 특징 딕셔너리}
+
+        Raises:
+            ValueError: 2차원 블록이 아니거나, 축 이름 수가 다르거나,
+                데이터가 부족하거나 어떤 채널의 RMS가 0일 때
+        """
+        arr = self._as_array(block, allow_2d=True)
+        if arr.ndim != 2:
+            raise ValueError(
+                f"(n_samples, n_axes) 2차원 블록이 필요합니다: shape={arr.shape}"
+            )
+
+        if len(axis_names) != arr.shape[1]:
+            raise ValueError(
+                f"축 이름 수({len(axis_names)})와 축 수({arr.shape[1]})가 다릅니다"
+            )
+
+        magnitude = np.sqrt(np.einsum("ij,ij->i", arr, arr))
+        columns = self._features_block(np.column_stack([arr, magnitude]))
+
+        names = list(axis_names) + ["magnitude"]
+        return {
+            name: {key: float(values[i]) for key, values in columns.items()}
+            for i, name in enumerate(names)
+        }
+
+    def extract_features(
+        self, data: ArrayLike, features: Iterable[str]
+    ) -> Dict[str, float]:
+        """
+        요청한 특징만 계산합니다.
+
+        FEATURE_GRAPH의 의존성을 따라 필요한 중간값(평균, 제곱합, 중심 모멘트,
+        최대/최소값)만 한 번씩 계산하고 특징들이 공유합니다.
+        예: {"rms", "crest_factor"}는 제곱합과 최대/최소값만 계산하며
+        평균이나 중심 모멘트는 계산하지 않습니다.
+
+        Args:
+            data: 1차원 신호
+            features: 계산할 특징 이름들 (FEATURE_NAMES 중 일부)
+
+        Returns:
+            {특징 이름: 값} 딕셔너리 (요청한 특징만 포함)
+
+        Raises:
+            ValueError: 알 수 없는 특징이거나, 데이터가 비었거나,
+                특징별 최소 데이터 수보다 적거나, crest_factor 계산 시 RMS가 0일 때
+        """
+        requested = set(features)
+        unknown = requested - set(FEATURE_NAMES)
+        if unknown:
+            raise ValueError(
+                f"알 수 없는 특징입니다: {sorted(unknown)}. "
+                f"지원 특징: {list(FEATURE_NAMES)}"
+            )
+
+        arr = self._as_array(data)
+        if arr.size == 0:
+            raise ValueError("데이터가 비어있습니다")
+
+        for name in requested:
+            if name in _FEATURE_MIN_SAMPLES:
+                min_samples, message = _FEATURE_MIN_SAMPLES[name]
+                if arr.size < min_samples:
+                    raise ValueError(message)
+
+        values: Dict[str, Any] = {}
+        for name in _resolve_feature_plan(requested):
+            values[name] = FEATURE_GRAPH[name][1](arr, values)
+
+        return {name: values[name] for name in FEATURE_NAMES if name in requested}
+
+    def extract_rolling_features(
+        self, data: ArrayLike, window: int, hop: int
+    ) -> List[Dict[str, float]]:
+        """
+        슬라이딩 윈도우마다 특징값을 추출합니다.
+
+        RollingFeatureExtractor로 샘플당 O(1) 갱신하므로,
+        윈도우를 잘라 extract_all_features()를 반복 호출하는 O(n·w) 방식과 같은
+        결과를 O(n)에 얻습니다.
+
+        Args:
+            data: 1차원 신호
+            window: 윈도우 길이 (샘플 수, 4 이상)
+            hop: 윈도우 이동 간격 (샘플 수)
+
+        Returns:
+            특징 딕셔너리 리스트. i번째 행은 data[i*hop : i*hop + window] 구간
+
+        Raises:
+            ValueError: 인자가 올바르지 않거나 어떤 윈도우의 RMS가 0일 때
+        """
+        extractor = RollingFeatureExtractor(window, hop)
+        values = data.tolist() if isinstance(data, np.ndarray) else data
+
+        rows = []
+        for x in values:
+            row = extractor.push(x)
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    def batch_extract_features(
+        self,
+        directory: str,
+        pattern: str = "*.csv",
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ) -> BatchFeatureResult:
+        """
+        디렉토리의 CSV 파일들을 프로세스 풀로 나누어 특징을 추출합니다.
+
+        파일별로 load_csv_columnar() → extract_all_features()를 수행하며,
+        실패한 파일은 errors에 기록하고 나머지 파일은 계속 처리합니다.
+
+        Args:
+            directory: 캡처 파일 디렉토리
+            pattern: 파일 glob 패턴 (하위 디렉토리는 "**/*.csv")
+            max_workers: 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 처리)
+            chunksize: 워커에 한 번에 넘길 파일 수
+                (None이면 워커당 약 4개 묶음이 되도록 자동 계산)
+
+        Returns:
+            BatchFeatureResult: 파일 상대 경로를 키로 하는 특징/에러 테이블
+
+        Raises:
+            FileNotFoundError: 디렉토리가 없을 때
+            ValueError: max_workers나 chunksize가 0 이하일 때
+        """
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(f"디렉토리를 찾을 수 없습니다: {directory}")
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers <= 0:
+            raise ValueError("max_workers는 양수여야 합니다")
+
+        root = Path(directory)
+        tasks = [
+            (path.relative_to(root).as_posix(), str(path), self.backend,
+             self.dtype.name)
+            for path in sorted(root.glob(pattern))
+            if path.is_file()
+        ]
+
+        if chunksize is None:
+            chunksize = max(1, len(tasks) // (max_workers * 4))
+        if chunksize <= 0:
+            raise ValueError("chunksize는 양수여야 합니다")
+
+        result = BatchFeatureResult()
+        if not tasks:
+            return result
+
+        if max_workers == 1:
+            outcomes = map(_extract_file_features, tasks)
+            self._collect_batch_outcomes(result, outcomes)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(tasks))
+            ) as executor:
+                outcomes = executor.map(
+                    _extract_file_features, tasks, chunksize=chunksize
+                )
+                self._collect_batch_outcomes(result, outcomes)
+
+        return result
+
+    @staticmethod
+    def _collect_batch_outcomes(
+        result: BatchFeatureResult,
+        outcomes: Iterable[Tuple[str, Optional[Dict[str, float]], Optional[str]]],
+    ) -> None:
+        for key, features, error in outcomes:
+            if error is None:
+                result.features[key] = features
+            else:
+                result.errors[key] = error
+
+    def frame_signal(
+        self, data: ArrayLike, frame_length: int, hop: int
+    ) -> np.ndarray:
+        """
+        신호를 겹치는 프레임으로 나눕니다 (복사 없는 strided 뷰).
+
+        Args:
+            data: 1차원 신호
+            frame_length: 프레임 길이 (샘플 수)
+            hop: 프레임 간 이동 간격 (샘플 수)
+
+        Returns:
+            (n_frames, frame_length) 읽기 전용 뷰.
+            마지막에 frame_length를 채우지 못하는 샘플은 버립니다.
+
+        Raises:
+            ValueError: 길이/간격이 0 이하이거나 데이터가 frame_length보다 짧을 때
+        """
+        if frame_length <= 0 or hop <= 0:
+            raise ValueError("frame_length와 hop은 양수여야 합니다")
+
+        arr = self._as_array(data)
+        if arr.size < frame_length:
+            raise ValueError(
+                f"데이터 길이({arr.size})가 frame_length({frame_length})보다 짧습니다"
+            )
+
+        return np.lib.stride_tricks.sliding_window_view(
+            arr, frame_length
+        )[::hop]
+
+    def extract_spectral_features(
+        self,
+        data: ArrayLike,
+        sample_rate: float,
+        frame_length: int = 1024,
+        overlap: float = 0.5,
+        bands: Optional[Sequence[Tuple[float, float]]] = None,
+    ) -> SpectralFeatures:
+        """
+        Welch 방식으로 PSD, 대역 에너지, 스펙트럼 무게중심을 계산합니다.
+
+        신호를 겹치는 프레임으로 나누고, 프레임별 평균을 제거한 뒤
+        Hann 윈도우를 곱해 모든 프레임의 rfft를 한 번의 호출로 계산합니다.
+        윈도우와 주파수 빈은 (frame_length, sample_rate)별로 캐시됩니다.
+
+        Args:
+            data: 1차원 신호
+            sample_rate: 샘플링 주파수 (Hz)
+            frame_length: 프레임(FFT) 길이
+            overlap: 프레임 겹침 비율 (0.0 이상 1.0 미만)
+            bands: 에너지를 계산할 주파수 대역 [(low, high), ...] (Hz, high 미포함)
+
+        Returns:
+            SpectralFeatures: 스펙트럼 특징
+
+        Raises:
+            ValueError: 인자가 올바르지 않거나 데이터가 frame_length보다 짧을 때
+        """
+        if sample_rate <= 0:
+            raise ValueError("샘플링 주파수는 양수여야 합니다")
+
+        if not 0.0 <= overlap < 1.0:
+            raise ValueError("overlap은 0.0 이상 1.0 미만이어야 합니다")
+
+        hop = max(1, int(round(frame_length * (1.0 - overlap))))
+        frames = self.frame_signal(data, frame_length, hop)
+        window, freqs, psd_scale = _spectral_window(
+            frame_length, float(sample_rate)
+        )
+
+        # 프레임별 DC 제거 후 윈도우 적용 (한 번의 배열 연산)
+        windowed = frames - frames.mean(axis=1, keepdims=True)
+        windowed *= window
+        spectra = np.fft.rfft(windowed, axis=1)
+
+        power = spectra.real ** 2 + spectra.imag ** 2
+        psd = power.mean(axis=0, dtype=np.float64) * psd_scale
+        # 단측 스펙트럼: DC와 (짝수 길이의) 나이퀴스트 빈을 제외하고 2배
+        if frame_length % 2 == 0:
+            psd[1:-1] *= 2.0
+        else:
+            psd[1:] *= 2.0
+
+        df = float(sample_rate) / frame_length
+        band_energies: Dict[Tuple[float, float], float] = {}
+        if bands:
+            band_key = tuple((float(lo), float(hi)) for lo, hi in bands)
+            ranges = _band_bin_ranges(frame_length, float(sample_rate), band_key)
+            for band, (start, stop) in zip(band_key, ranges):
+                band_energies[band] = float(psd[start:stop].sum()) * df
+
+        total_power = float(psd.sum())
+        if total_power > 0:
+            centroid = float(np.dot(freqs, psd)) / total_power
+        else:
+            centroid = 0.0
+
+        return SpectralFeatures(
+            freqs=freqs,
+            psd=psd,
+            band_energies=band_energies,
+            spectral_centroid=centroid,
+            n_frames=frames.shape[0],
+        )
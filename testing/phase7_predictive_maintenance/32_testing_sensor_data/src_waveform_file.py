@@ -0,0 +1,332 @@
+"""
+바이너리 진동 파형 파일 모듈
+
+같은 CSV 파형을 반복해서 파싱하지 않도록, 작은 헤더와
+리틀 엔디언 원시 샘플로 이루어진 바이너리 컨테이너(.vwf)를 제공합니다.
+
+파일 구조:
+    [헤더 64바이트] [샘플 n_samples x channels (행 우선)]
+
+    헤더 (리틀 엔디언):
+        magic           4s   b"VWF1"
+        version         H    형식 버전
+        channels        H    채널 수
+        dtype_code      B    1 = float32, 2 = float64
+        (padding)       3x
+        sample_rate     d    샘플링 주파수 (Hz)
+        start_timestamp d    첫 샘플 시각 (초)
+        n_samples       Q    채널당 샘플 수
+
+읽기는 np.memmap을 사용하므로 파일을 여는 데 걸리는 시간이 파일 크기와
+무관하며, 실제로 접근한 페이지만 메모리에 올라옵니다.
+반환된 배열은 VibrationDataProcessor(backend="numpy")에 복사 없이 전달할 수 있습니다.
+"""
+
+import os
+import struct
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src_vibration_processor import VibrationDataProcessor
+
+
+WAVEFORM_MAGIC = b"VWF1"
+WAVEFORM_VERSION = 1
+
+# 헤더 고정 크기 (샘플 영역을 8바이트 정렬하기 위해 여유를 둠)
+HEADER_SIZE = 64
+_HEADER_STRUCT = struct.Struct("<4sHHB3xddQ")
+
+# dtype 코드 ↔ NumPy dtype 매핑 (항상 리틀 엔디언으로 저장)
+DTYPE_CODES = {1: "float32", 2: "float64"}
+_DTYPE_TO_CODE = {name: code for code, name in DTYPE_CODES.items()}
+
+
+@dataclass
+class WaveformHeader:
+    """
+    파형 파일 헤더
+
+    Attributes:
+        sample_rate: 샘플링 주파수 (Hz)
+        channels: 채널 수
+        dtype: 샘플 타입 ("float32" 또는 "float64")
+        start_timestamp: 첫 샘플 시각 (초)
+        n_samples: 채널당 샘플 수
+    """
+    sample_rate: float
+    channels: int
+    dtype: str
+    start_timestamp: float
+    n_samples: int
+
+    def timestamps(self) -> np.ndarray:
+        """샘플 시각 배열을 계산합니다 (파일에는 저장하지 않음)"""
+        return (
+            self.start_timestamp
+            + np.arange(self.n_samples, dtype=np.float64) / self.sample_rate
+        )
+
+    def pack(self) -> bytes:
+        """헤더를 HEADER_SIZE 바이트로 직렬화합니다."""
+        packed = _HEADER_STRUCT.pack(
+            WAVEFORM_MAGIC,
+            WAVEFORM_VERSION,
+            self.channels,
+            _DTYPE_TO_CODE[self.dtype],
+            self.sample_rate,
+            self.start_timestamp,
+            self.n_samples,
+        )
+        return packed.ljust(HEADER_SIZE, b"\0")
+
+    @classmethod
+    def unpack(cls, raw: bytes) -> "WaveformHeader":
+        """
+        바이트에서 헤더를 복원합니다.
+
+        Raises:
+            ValueError: 매직 넘버, 버전, dtype 코드가 올바르지 않을 때
+        """
+        if len(raw) < HEADER_SIZE:
+            raise ValueError("파형 파일 헤더가 잘렸습니다")
+
+        (magic, version, channels, dtype_code,
+         sample_rate, start_timestamp, n_samples) = _HEADER_STRUCT.unpack_from(raw)
+
+        if magic != WAVEFORM_MAGIC:
+            raise ValueError(f"파형 파일 형식이 아닙니다: magic={magic!r}")
+        if version != WAVEFORM_VERSION:
+            raise ValueError(f"지원하지 않는 파형 파일 버전입니다: {version}")
+        if dtype_code not in DTYPE_CODES:
+            raise ValueError(f"알 수 없는 dtype 코드입니다: {dtype_code}")
+
+        return cls(
+            sample_rate=sample_rate,
+            channels=channels,
+            dtype=DTYPE_CODES[dtype_code],
+            start_timestamp=start_timestamp,
+            n_samples=n_samples,
+        )
+
+
+def _validate_sample_rate(sample_rate: float) -> None:
+    if not sample_rate > 0:
+        raise ValueError("샘플링 주파수는 양수여야 합니다")
+
+
+def _validate_dtype(dtype: str) -> None:
+    if dtype not in _DTYPE_TO_CODE:
+        raise ValueError(
+            f"지원하지 않는 dtype입니다: {dtype}. "
+            f"지원 타입: {list(_DTYPE_TO_CODE)}"
+        )
+
+
+def write_waveform(
+    filepath: str,
+    samples: np.ndarray,
+    sample_rate: float,
+    start_timestamp: float = 0.0,
+    dtype: str = "float64",
+) -> WaveformHeader:
+    """
+    샘플 배열을 파형 파일로 저장합니다.
+
+    Args:
+        filepath: 저장 경로
+        samples: (n_samples,) 또는 (n_samples, channels) 배열
+        sample_rate: 샘플링 주파수 (Hz)
+        start_timestamp: 첫 샘플 시각 (초)
+        dtype: 저장 타입 ("float32" 또는 "float64")
+
+    Returns:
+        저장된 파일의 헤더
+
+    Raises:
+        ValueError: 인자가 올바르지 않을 때
+    """
+    _validate_sample_rate(sample_rate)
+    _validate_dtype(dtype)
+
+    arr = np.asarray(samples)
+    if arr.ndim not in (1, 2):
+        raise ValueError(
+            f"1차원 또는 2차원 배열만 저장할 수 있습니다: shape={arr.shape}"
+        )
+
+    header = WaveformHeader(
+        sample_rate=float(sample_rate),
+        channels=1 if arr.ndim == 1 else arr.shape[1],
+        dtype=dtype,
+        start_timestamp=float(start_timestamp),
+        n_samples=arr.shape[0],
+    )
+
+    le_dtype = np.dtype(dtype).newbyteorder("<")
+    with open(filepath, "wb") as f:
+        f.write(header.pack())
+        np.ascontiguousarray(arr, dtype=le_dtype).tofile(f)
+
+    return header
+
+
+def convert_csv_to_waveform(
+    csv_path: str,
+    out_path: str,
+    sample_rate: Optional[float] = None,
+    dtype: str = "float64",
+    chunk_size: int = VibrationDataProcessor.DEFAULT_CHUNK_SIZE,
+) -> WaveformHeader:
+    """
+    timestamp/amplitude CSV를 파형 파일로 변환합니다.
+
+    VibrationDataProcessor.iter_csv_chunks()로 블록 단위로 읽어 바로 기록하므로
+    CSV 크기와 무관하게 메모리 사용량이 일정합니다.
+    임시 파일에 쓴 뒤 성공하면 out_path로 교체하므로, 변환 중 오류가 나도
+    불완전한 파일이 남지 않습니다.
+
+    Args:
+        csv_path: 원본 CSV 경로
+        out_path: 저장할 파형 파일 경로
+        sample_rate: 샘플링 주파수 (Hz). None이면 첫 블록(첫 블록이 한 행뿐이면
+            첫 두 행)의 timestamp 간격 중앙값으로 추정
+        dtype: 저장 타입 ("float32" 또는 "float64")
+        chunk_size: CSV 읽기 블록 크기
+
+    Returns:
+        저장된 파일의 헤더
+
+    Raises:
+        FileNotFoundError: CSV 파일이 없을 때
+        ValueError: CSV 형식이 올바르지 않거나 샘플링 주파수를 알 수 없을 때
+    """
+    _validate_dtype(dtype)
+    if sample_rate is not None:
+        _validate_sample_rate(sample_rate)
+
+    processor = VibrationDataProcessor(backend="numpy")
+    le_dtype = np.dtype(dtype).newbyteorder("<")
+    header = None
+    # 샘플링 주파수 추정용 timestamp (두 행 이상 모일 때까지 보관)
+    head_timestamps = []
+
+    tmp_path = f"{out_path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            # n_samples와 샘플링 주파수는 마지막에 채우므로 자리만 확보
+            f.write(b"\0" * HEADER_SIZE)
+
+            for timestamps, amplitudes in processor.iter_csv_chunks(
+                csv_path, chunk_size
+            ):
+                if header is None:
+                    header = WaveformHeader(
+                        sample_rate=0.0,
+                        channels=1,
+                        dtype=dtype,
+                        start_timestamp=float(timestamps[0]),
+                        n_samples=0,
+                    )
+                if sample_rate is None:
+                    head_timestamps.extend(timestamps.tolist())
+                    if len(head_timestamps) >= 2:
+                        sample_rate = _estimate_sample_rate(head_timestamps)
+
+                amplitudes.astype(le_dtype, copy=False).tofile(f)
+                header.n_samples += amplitudes.size
+
+            if header is None:
+                raise ValueError("변환할 데이터가 없습니다")
+            if sample_rate is None:
+                raise ValueError(
+                    "샘플링 주파수를 추정하려면 최소 2개의 행이 필요합니다"
+                )
+
+            header.sample_rate = float(sample_rate)
+            f.seek(0)
+            f.write(header.pack())
+
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    return header
+
+
+def _estimate_sample_rate(timestamps) -> float:
+    """
+    timestamp 간격의 중앙값으로 샘플링 주파수를 추정합니다.
+
+    Raises:
+        ValueError: 간격 중앙값이 0 이하일 때 (중복되거나 역순인 timestamp)
+    """
+    spacing = float(np.median(np.diff(timestamps)))
+    if spacing <= 0:
+        raise ValueError(
+            f"timestamp 간격이 0 이하여서 샘플링 주파수를 추정할 수 없습니다: "
+            f"간격 중앙값={spacing}"
+        )
+    return 1.0 / spacing
+
+
+def read_waveform_header(filepath: str) -> WaveformHeader:
+    """
+    파형 파일의 헤더만 읽습니다.
+
+    Raises:
+        FileNotFoundError: 파일이 없을 때
+        ValueError: 파일 형식이 올바르지 않을 때
+    """
+    try:
+        with open(filepath, "rb") as f:
+            raw = f.read(HEADER_SIZE)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {filepath}")
+
+    return WaveformHeader.unpack(raw)
+
+
+def open_waveform(filepath: str) -> Tuple[WaveformHeader, np.ndarray]:
+    """
+    파형 파일을 메모리 맵으로 엽니다.
+
+    샘플은 읽기 전용 np.memmap 뷰로 반환되며, 접근하기 전까지는
+    디스크에서 읽지 않습니다.
+
+    Args:
+        filepath: 파형 파일 경로
+
+    Returns:
+        (header, samples) 튜플.
+        samples는 단일 채널이면 (n_samples,), 다채널이면 (n_samples, channels)
+
+    Raises:
+        FileNotFoundError: 파일이 없을 때
+        ValueError: 파일 형식이 올바르지 않거나 샘플 영역이 잘렸을 때
+    """
+    header = read_waveform_header(filepath)
+    le_dtype = np.dtype(header.dtype).newbyteorder("<")
+
+    shape: Tuple[int, ...]
+    if header.channels == 1:
+        shape = (header.n_samples,)
+    else:
+        shape = (header.n_samples, header.channels)
+
+    if header.n_samples == 0:
+        return header, np.empty(shape, dtype=le_dtype)
+
+    try:
+        samples = np.memmap(
+            filepath, dtype=le_dtype, mode="r",
+            offset=HEADER_SIZE, shape=shape,
+        )
+    except ValueError:
+        raise ValueError("파형 파일의 샘플 영역이 헤더보다 짧습니다")
+
+    return header, samples
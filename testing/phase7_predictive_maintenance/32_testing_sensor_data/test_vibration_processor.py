@@ -9,9 +9,26 @@ VibrationDataProcessor 클래스의 전체 파이프라인을 테스트합니다
 - 특징 추출 (RMS, Kurtosis, Peak-to-Peak, Crest Factor)
 """
 
+import array
 import math
+import statistics
+
+import numpy as np
 import pytest
-from src_vibration_processor import VibrationDataProcessor
+from src_vibration_processor import (
+    VibrationDataProcessor,
+    MomentAccumulator,
+    CleaningReport,
+    FEATURE_NAMES,
+    IQRFences,
+    P2Quantile,
+    StreamingIQR,
+    RollingFeatureExtractor,
+    SpectralFeatures,
+    _resample_filter,
+    _resolve_feature_plan,
+    _spectral_window,
+)
 
 
 # ============================================================
@@ -24,6 +41,12 @@ def processor():
     return VibrationDataProcessor()
 
 
+@pytest.fixture
+def np_processor():
+    """numpy 백엔드 VibrationDataProcessor 인스턴스"""
+    return VibrationDataProcessor(backend="numpy")
+
+
 # ============================================================
 # CSV 로딩 테스트
 # ============================================================
@@ -76,6 +99,91 @@ class TestLoadCSV:
             processor.load_csv("/nonexistent/path/data.csv")
 
 
+class TestColumnarCSV:
+    """컬럼 형태/청크 단위 CSV 로딩 테스트"""
+
+    def test_청크_분할(self, processor, sample_csv_file):
+        """고정 크기 블록으로 나뉘고 마지막 블록은 나머지 행"""
+        chunks = list(processor.iter_csv_chunks(sample_csv_file, chunk_size=2))
+
+        assert [len(ts) for ts, _ in chunks] == [2, 2, 1]
+        for timestamps, amplitudes in chunks:
+            assert timestamps.dtype == np.float64
+            assert amplitudes.dtype == np.float64
+
+    def test_load_csv와_일치(self, processor, sample_csv_file):
+        """컬럼 로딩 결과가 load_csv()의 딕셔너리 리스트와 같음"""
+        rows = processor.load_csv(sample_csv_file)
+        timestamps, amplitudes = processor.load_csv_columnar(
+            sample_csv_file, chunk_size=3)
+
+        assert timestamps.tolist() == [r["timestamp"] for r in rows]
+        assert amplitudes.tolist() == [r["amplitude"] for r in rows]
+
+    def test_컬럼_순서_무관(self, processor, tmp_path):
+        """헤더 순서가 달라도 컬럼 이름으로 찾음"""
+        csv_file = tmp_path / "swapped.csv"
+        csv_file.write_text(
+            "amplitude,extra,timestamp\n0.5,x,0.0\n\n1.5,y,0.1\n",
+            encoding="utf-8",
+        )
+        timestamps, amplitudes = processor.load_csv_columnar(str(csv_file))
+
+        assert timestamps.tolist() == [0.0, 0.1]
+        assert amplitudes.tolist() == [0.5, 1.5]
+
+    def test_헤더만_있는_파일(self, processor, header_only_csv_file):
+        """데이터가 없으면 빈 배열"""
+        assert list(processor.iter_csv_chunks(header_only_csv_file)) == []
+        timestamps, amplitudes = processor.load_csv_columnar(
+            header_only_csv_file)
+        assert timestamps.size == 0 and amplitudes.size == 0
+
+    @pytest.mark.parametrize("fixture_name, match", [
+        ("empty_csv_file", "비어있습니다"),
+        ("missing_column_csv_file", "필수 컬럼"),
+        ("malformed_csv_file", "3행 데이터 변환 오류"),
+    ])
+    def test_load_csv와_같은_에러(self, processor, request,
+                                fixture_name, match):
+        """헤더 검증과 행 번호 에러 메시지가 load_csv()와 같음"""
+        filepath = request.getfixturevalue(fixture_name)
+        with pytest.raises(ValueError, match=match):
+            processor.load_csv(filepath)
+        with pytest.raises(ValueError, match=match):
+            processor.load_csv_columnar(filepath)
+
+    def test_헤더_앞_빈_줄(self, processor, tmp_path):
+        """load_csv()와 같이 첫 줄을 헤더로 보므로 빈 줄로 시작하면 두 로더 모두 에러"""
+        csv_file = tmp_path / "leading_blank.csv"
+        csv_file.write_text(
+            "\ntimestamp,amplitude\n0.0,0.5\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="필수 컬럼"):
+            processor.load_csv(str(csv_file))
+        with pytest.raises(ValueError, match="필수 컬럼"):
+            processor.load_csv_columnar(str(csv_file))
+
+    def test_CSV_구문_오류는_ValueError(self, processor, tmp_path):
+        """필드 크기 제한 초과 같은 csv.Error는 줄 번호와 함께 ValueError"""
+        csv_file = tmp_path / "corrupt.csv"
+        csv_file.write_text(
+            "timestamp,amplitude\n0.0,1.0\n0.1,\"" + "9" * 200_000 + "\"\n",
+            encoding="utf-8",
+        )
+        with pytest.raises(ValueError, match="3행 CSV 구문 오류"):
+            processor.load_csv_columnar(str(csv_file))
+
+    def test_존재하지_않는_파일(self, processor):
+        """존재하지 않는 파일 경로"""
+        with pytest.raises(FileNotFoundError):
+            list(processor.iter_csv_chunks("/nonexistent/path/data.csv"))
+
+    def test_잘못된_청크_크기(self, processor, sample_csv_file):
+        """chunk_size가 0 이하이면 ValueError"""
+        with pytest.raises(ValueError, match="chunk_size"):
+            list(processor.iter_csv_chunks(sample_csv_file, chunk_size=0))
+
+
 # ============================================================
 # 데이터 클리닝 테스트
 # ============================================================
@@ -144,6 +252,63 @@ class TestCleanData:
             processor.clean_data([None, None, None])
 
 
+class TestCleanDataReport:
+    """보간 통계와 in_place 옵션 테스트"""
+
+    def test_보간_통계(self, processor, data_with_missing_values):
+        """보간 건수와 최장 갭 길이를 보고"""
+        cleaned, report = processor.clean_data_with_report(
+            data_with_missing_values)
+
+        assert report == CleaningReport(imputed_count=3, longest_gap=2)
+        assert cleaned == processor.clean_data(data_with_missing_values)
+
+    def test_양끝_갭도_포함(self, processor):
+        """시작/끝 부분 결측 구간도 갭으로 집계"""
+        _, report = processor.clean_data_with_report(
+            [None, None, None, 1.0, None, 2.0, None])
+        assert report == CleaningReport(imputed_count=5, longest_gap=3)
+
+    def test_결측치_없음(self, processor):
+        """결측치가 없으면 통계는 0"""
+        _, report = processor.clean_data_with_report([1.0, 2.0])
+        assert report == CleaningReport(imputed_count=0, longest_gap=0)
+
+    def test_대부분_결측_보간(self, np_processor):
+        """대부분이 NaN인 긴 배열도 선형 보간"""
+        data = np.full(100_001, np.nan)
+        data[0] = 0.0
+        data[-1] = 100_000.0
+
+        cleaned, report = np_processor.clean_data_with_report(data)
+
+        np.testing.assert_allclose(cleaned, np.arange(100_001.0))
+        assert report.longest_gap == 99_999
+
+    def test_in_place_ndarray(self, np_processor):
+        """in_place=True이면 입력 배열을 직접 채움"""
+        data = np.array([1.0, np.nan, 3.0])
+        result = np_processor.clean_data(data, in_place=True)
+
+        assert result is data
+        assert data.tolist() == [1.0, 2.0, 3.0]
+
+    def test_in_place_버퍼(self, np_processor):
+        """array('d')도 제자리에서 채움"""
+        data = array.array("d", [math.nan, 2.0, 4.0])
+        np_processor.clean_data(data, in_place=True)
+        assert data.tolist() == [2.0, 2.0, 4.0]
+
+    @pytest.mark.parametrize("data", [
+        [1.0, None, 3.0],
+        np.array([1, 2, 3]),
+    ])
+    def test_in_place_미지원_입력(self, np_processor, data):
+        """리스트나 정수 배열은 제자리 수정 불가"""
+        with pytest.raises(ValueError, match="in_place"):
+            np_processor.clean_data(data, in_place=True)
+
+
 # ============================================================
 # 이상치 제거 테스트
 # ============================================================
@@ -185,6 +350,110 @@ class TestRemoveOutliers:
             processor.remove_outliers([1.0, 2.0, 3.0, 4.0], method="zscore")
 
 
+class TestIQRFences:
+    """선택 기반 사분위수와 경계 재사용 테스트"""
+
+    @staticmethod
+    def _sorted_quartile(data, p):
+        """기존 정렬 기반 분위수 규칙 (위치 = n * p)"""
+        ordered = sorted(data)
+        n = len(ordered)
+        pos = n * p
+        lower = int(pos)
+        if pos == lower:
+            return ordered[lower]
+        upper = min(lower + 1, n - 1)
+        return ordered[lower] + (pos - lower) * (ordered[upper] - ordered[lower])
+
+    @pytest.mark.parametrize("n", [4, 5, 6, 7, 101, 1000])
+    def test_정렬_기반_결과와_일치(self, processor, n):
+        """선택 알고리즘 결과가 전체 정렬 결과와 같음"""
+        data = [math.sin(i * 1.7) * (i % 13) for i in range(n)]
+        fences = processor.compute_iqr_fences(data)
+
+        assert fences.q1 == pytest.approx(self._sorted_quartile(data, 0.25))
+        assert fences.q3 == pytest.approx(self._sorted_quartile(data, 0.75))
+        iqr = fences.q3 - fences.q1
+        assert fences.lower == pytest.approx(fences.q1 - 1.5 * iqr)
+        assert fences.upper == pytest.approx(fences.q3 + 1.5 * iqr)
+
+    def test_경계_재사용(self, processor, noisy_vibration_data):
+        """한 번 계산한 경계를 다른 데이터에 적용"""
+        fences = processor.compute_iqr_fences(noisy_vibration_data)
+        cleaned = processor.remove_outliers([0.0, 50.0, -0.5], fences=fences)
+        assert cleaned == [0.0, -0.5]
+
+    def test_데이터_부족_에러(self, processor):
+        """4개 미만이면 경계를 계산할 수 없음"""
+        with pytest.raises(ValueError, match="최소 4개"):
+            processor.compute_iqr_fences([1.0, 2.0, 3.0])
+
+
+class TestStreamingQuantiles:
+    """P² 스트리밍 분위수와 스트림 이상치 제거 테스트"""
+
+    @pytest.mark.parametrize("p", [0.25, 0.5, 0.75])
+    def test_P2_근사_정확도(self, p):
+        """P² 추정값이 정확한 분위수에 가까움"""
+        rng = np.random.default_rng(0)
+        data = rng.normal(size=20_000)
+        estimator = P2Quantile(p)
+        for x in data.tolist():
+            estimator.update(x)
+
+        assert estimator.value() == pytest.approx(
+            float(np.quantile(data, p)), abs=0.03)
+
+    def test_P2_소량_데이터_정확값(self):
+        """5개 이하에서는 정확한 분위수"""
+        estimator = P2Quantile(0.5)
+        for x in [3.0, 1.0, 2.0]:
+            estimator.update(x)
+        assert estimator.value() == 2.0
+
+    @pytest.mark.parametrize("p, expected", [(0.25, 2.0), (0.5, 3.0), (0.9, 4.6)])
+    def test_P2_5개_샘플_정확값(self, p, expected):
+        """정확히 5개일 때도 중앙값이 아닌 p 분위수"""
+        estimator = P2Quantile(p)
+        for x in [5.0, 1.0, 4.0, 2.0, 3.0]:
+            estimator.update(x)
+        assert estimator.value() == pytest.approx(expected)
+
+    def test_P2_잘못된_분위수(self):
+        """p가 (0, 1) 밖이면 ValueError"""
+        with pytest.raises(ValueError, match="0과 1 사이"):
+            P2Quantile(1.0)
+
+    def test_스트림_이상치_제거(self, processor, large_vibration_data):
+        """청크 스트림에서 극단값이 제거되고 경계를 재사용할 수 있음"""
+        data = list(large_vibration_data)
+        data[500] = 100.0
+        data[900] = -100.0
+        chunks = [data[i:i + 100] for i in range(0, len(data), 100)]
+        sketch = StreamingIQR()
+
+        cleaned = [
+            x
+            for chunk in processor.iter_remove_outliers(chunks, sketch=sketch)
+            for x in chunk
+        ]
+
+        assert 100.0 not in cleaned
+        assert -100.0 not in cleaned
+        assert sketch.count == len(data)
+
+        exact = processor.compute_iqr_fences(data)
+        approx = sketch.fences()
+        assert isinstance(approx, IQRFences)
+        assert approx.q1 == pytest.approx(exact.q1, abs=0.1)
+        assert approx.q3 == pytest.approx(exact.q3, abs=0.1)
+
+    def test_워밍업_구간_통과(self, processor):
+        """누적 샘플이 4개 미만이면 청크를 그대로 통과"""
+        result = list(processor.iter_remove_outliers([[1.0, 100.0]]))
+        assert result == [[1.0, 100.0]]
+
+
 # ============================================================
 # 리샘플링 테스트
 # ============================================================
@@ -227,6 +496,95 @@ class TestResample:
             processor.resample([1.0, 2.0], target_freq=-1)
 
 
+class TestResampleToRate:
+    """안티에일리어싱 폴리페이즈 리샘플링 테스트"""
+
+    SOURCE_RATE = 25600.0
+    TARGET_RATE = 2560.0
+
+    @staticmethod
+    def _tone(freq, rate, n):
+        t = np.arange(n) / rate
+        return np.sin(2 * np.pi * freq * t)
+
+    def test_출력_길이(self, np_processor):
+        """출력 길이는 ceil(n * target / source)"""
+        data = np.zeros(25600)
+        assert np_processor.resample_to_rate(
+            data, self.SOURCE_RATE, self.TARGET_RATE).shape == (2560,)
+        assert np_processor.resample_to_rate(
+            data[:1001], self.SOURCE_RATE, self.TARGET_RATE).shape == (101,)
+
+    def test_통과대역_유지(self, np_processor):
+        """나이퀴스트 이하 신호의 진폭은 유지"""
+        tone = self._tone(100.0, self.SOURCE_RATE, 25600)
+        result = np_processor.resample_to_rate(
+            tone, self.SOURCE_RATE, self.TARGET_RATE)
+        expected = self._tone(100.0, self.TARGET_RATE, 2560)
+
+        # 필터 길이만큼의 양끝은 0 패딩 영향이 있으므로 제외
+        # (Kaiser beta=5 통과대역 리플 ≈ 0.1%)
+        np.testing.assert_allclose(
+            result[50:-50], expected[50:-50], atol=5e-3)
+
+    def test_에일리어싱_제거(self, np_processor):
+        """목표 나이퀴스트(1280 Hz)를 넘는 성분은 제거"""
+        tone = self._tone(3000.0, self.SOURCE_RATE, 25600)
+        result = np_processor.resample_to_rate(
+            tone, self.SOURCE_RATE, self.TARGET_RATE)
+        assert np.sqrt(np.mean(result[50:-50] ** 2)) < 1e-3
+
+    def test_다채널_일괄처리(self, np_processor):
+        """(n, channels) 블록 결과가 채널별 처리와 같음"""
+        block = np.column_stack([
+            self._tone(f, self.SOURCE_RATE, 5000) for f in (50.0, 300.0, 900.0)
+        ])
+        result = np_processor.resample_to_rate(
+            block, self.SOURCE_RATE, self.TARGET_RATE)
+
+        assert result.shape == (500, 3)
+        for ch in range(3):
+            np.testing.assert_allclose(
+                result[:, ch],
+                np_processor.resample_to_rate(
+                    block[:, ch], self.SOURCE_RATE, self.TARGET_RATE),
+            )
+
+    def test_업샘플링_유리수_비율(self, np_processor):
+        """비정수 비율(25.6k → 44.1k)도 처리"""
+        tone = self._tone(200.0, self.SOURCE_RATE, 2560)
+        result = np_processor.resample_to_rate(tone, self.SOURCE_RATE, 44100.0)
+        expected = self._tone(200.0, 44100.0, result.shape[0])
+
+        assert result.shape == (4410,)
+        np.testing.assert_allclose(
+            result[200:-200], expected[200:-200], atol=5e-3)
+
+    def test_필터_캐시(self, np_processor):
+        """같은 주파수 쌍의 필터는 재사용"""
+        np_processor.resample_to_rate(
+            np.zeros(100), self.SOURCE_RATE, self.TARGET_RATE)
+        hits = _resample_filter.cache_info().hits
+        np_processor.resample_to_rate(
+            np.zeros(100), self.SOURCE_RATE, self.TARGET_RATE)
+        assert _resample_filter.cache_info().hits == hits + 1
+
+    def test_같은_주파수_복사(self, processor):
+        """주파수가 같으면 원본 복사본 (list 백엔드는 리스트)"""
+        data = [1.0, 2.0, 3.0]
+        assert processor.resample_to_rate(data, 100.0, 100.0) == data
+
+    def test_잘못된_주파수_에러(self, np_processor):
+        """주파수가 0 이하이면 ValueError"""
+        with pytest.raises(ValueError, match="양수"):
+            np_processor.resample_to_rate(np.ones(4), 0.0, 100.0)
+
+    def test_빈_데이터_에러(self, np_processor):
+        """빈 데이터는 ValueError"""
+        with pytest.raises(ValueError, match="비어있습니다"):
+            np_processor.resample_to_rate(np.array([]), 100.0, 50.0)
+
+
 # ============================================================
 # RMS 계산 테스트
 # ============================================================
@@ -429,6 +787,698 @@ class TestExtractAllFeatures:
             processor.extract_all_features([])
 
 
+# ============================================================
+# 단일 패스 모멘트 누적기 테스트
+# ============================================================
+
+class TestMomentAccumulator:
+    """MomentAccumulator와 개별 계산 메서드의 일치 여부 테스트"""
+
+    @pytest.mark.parametrize("fixture_name", [
+        "sample_vibration_data",
+        "noisy_vibration_data",
+        "large_vibration_data",
+    ])
+    def test_개별_메서드와_일치(self, processor, request, fixture_name):
+        """fused 결과가 개별 calculate_* 결과와 허용 오차 이내로 일치"""
+        data = request.getfixturevalue(fixture_name)
+        features = processor.extract_all_features(data)
+        tol = processor.FEATURE_TOLERANCE
+
+        assert features["rms"] == pytest.approx(
+            processor.calculate_rms(data), rel=tol)
+        assert features["kurtosis"] == pytest.approx(
+            processor.calculate_kurtosis(data), rel=tol, abs=tol)
+        assert features["peak_to_peak"] == processor.calculate_peak_to_peak(data)
+        assert features["crest_factor"] == pytest.approx(
+            processor.calculate_crest_factor(data), rel=tol)
+        assert features["std"] == pytest.approx(statistics.stdev(data), rel=tol)
+        assert features["mean"] == pytest.approx(
+            statistics.mean(data), rel=tol, abs=tol)
+        assert features["max"] == max(data)
+        assert features["min"] == min(data)
+
+    def test_큰_오프셋_수치_안정성(self, processor, sample_vibration_data):
+        """큰 DC 오프셋이 있어도 분산/첨도가 안정적으로 계산됨"""
+        data = [1e6 + x for x in sample_vibration_data]
+        acc = MomentAccumulator()
+        acc.extend(data)
+        features = acc.features()
+
+        assert features["std"] == pytest.approx(
+            statistics.stdev(sample_vibration_data), rel=1e-6)
+        assert features["kurtosis"] == pytest.approx(
+            processor.calculate_kurtosis(sample_vibration_data), rel=1e-6)
+
+    def test_일정한_데이터_첨도_0(self, constant_data):
+        """분산이 0이면 첨도는 0.0"""
+        acc = MomentAccumulator()
+        acc.extend(constant_data)
+        assert acc.features()["kurtosis"] == 0.0
+
+    def test_제로_데이터_에러(self, processor):
+        """모든 값이 0이면 Crest Factor 계산 불가"""
+        with pytest.raises(ValueError, match="RMS가 0"):
+            processor.extract_all_features([0.0] * 10)
+
+    def test_데이터_부족_에러(self):
+        """4개 미만 누적 시 ValueError"""
+        acc = MomentAccumulator()
+        acc.extend([1.0, 2.0, 3.0])
+        with pytest.raises(ValueError, match="최소 4개"):
+            acc.features()
+
+
+# ============================================================
+# NumPy 백엔드 테스트
+# ============================================================
+
+class TestNumpyBackend:
+    """numpy 백엔드가 list 백엔드와 같은 결과를 내는지 테스트"""
+
+    def test_지원하지_않는_백엔드_에러(self):
+        """알 수 없는 백엔드 이름은 ValueError"""
+        with pytest.raises(ValueError, match="지원하지 않는 백엔드"):
+            VibrationDataProcessor(backend="gpu")
+
+    def test_버퍼_입력_복사없음(self, np_processor):
+        """array('d') 입력은 복사 없이 뷰로 사용"""
+        buf = array.array("d", [1.0, 2.0, 3.0, 4.0])
+        arr = np_processor._as_array(buf)
+        assert np.shares_memory(arr, np.frombuffer(buf))
+
+    def test_ndarray_입력_복사없음(self, np_processor):
+        """float64 ndarray는 그대로 사용"""
+        data = np.linspace(0.0, 1.0, 10)
+        assert np_processor._as_array(data) is data
+
+    def test_2차원_입력_에러(self, np_processor):
+        """1차원이 아닌 입력은 ValueError"""
+        with pytest.raises(ValueError, match="1차원"):
+            np_processor.calculate_rms(np.ones((3, 2)))
+
+    def test_clean_data_일치(self, processor, np_processor):
+        """NaN 보간 결과가 list 백엔드의 None 보간과 일치"""
+        data = [None, 1.0, None, None, 4.0, 5.0, None]
+        arr = np.array([np.nan if v is None else v for v in data])
+
+        result = np_processor.clean_data(arr)
+
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_allclose(result, processor.clean_data(data))
+        assert np.isnan(arr[0])  # 원본은 변경되지 않음
+
+    def test_clean_data_모든_값_결측_에러(self, np_processor):
+        """모든 값이 NaN이면 ValueError"""
+        with pytest.raises(ValueError, match="모든 값이 결측치"):
+            np_processor.clean_data(np.full(5, np.nan))
+
+    def test_remove_outliers_일치(self, processor, np_processor,
+                                  noisy_vibration_data):
+        """IQR 필터링 결과가 list 백엔드와 같음"""
+        result = np_processor.remove_outliers(np.array(noisy_vibration_data))
+        expected = processor.remove_outliers(noisy_vibration_data)
+        np.testing.assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize("target_freq", [1, 5, 10, 500, 1500])
+    def test_resample_일치(self, processor, np_processor,
+                         large_vibration_data, target_freq):
+        """리샘플링 길이와 값이 list 백엔드와 같음"""
+        result = np_processor.resample(
+            np.array(large_vibration_data), target_freq)
+        expected = processor.resample(large_vibration_data, target_freq)
+        assert len(result) == len(expected)
+        np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-12)
+
+    def test_calculate_메서드_일치(self, processor, np_processor,
+                                 large_vibration_data):
+        """calculate_* 결과가 list 백엔드와 허용 오차 이내로 일치"""
+        arr = np.array(large_vibration_data)
+        tol = processor.FEATURE_TOLERANCE
+        for name in ["calculate_rms", "calculate_kurtosis",
+                     "calculate_peak_to_peak", "calculate_crest_factor"]:
+            expected = getattr(processor, name)(large_vibration_data)
+            actual = getattr(np_processor, name)(arr)
+            assert isinstance(actual, float)
+            assert actual == pytest.approx(expected, rel=tol), name
+
+    def test_extract_all_features_일치(self, processor, np_processor,
+                                       noisy_vibration_data):
+        """numpy 특징 추출 결과가 list 백엔드와 일치"""
+        expected = processor.extract_all_features(noisy_vibration_data)
+        actual = np_processor.extract_all_features(
+            array.array("d", noisy_vibration_data))
+
+        assert set(actual) == set(expected)
+        for key, value in expected.items():
+            assert isinstance(actual[key], float)
+            assert actual[key] == pytest.approx(
+                value, rel=processor.FEATURE_TOLERANCE, abs=1e-12), key
+
+    def test_에러_메시지_일치(self, np_processor):
+        """numpy 백엔드도 같은 에러 메시지를 사용"""
+        with pytest.raises(ValueError, match="비어있습니다"):
+            np_processor.calculate_rms(np.array([]))
+        with pytest.raises(ValueError, match="최소 4개"):
+            np_processor.calculate_kurtosis(np.array([1.0, 2.0]))
+        with pytest.raises(ValueError, match="RMS가 0"):
+            np_processor.calculate_crest_factor(np.zeros(4))
+        with pytest.raises(ValueError, match="양수"):
+            np_processor.resample(np.ones(3), target_freq=0)
+
+
+# ============================================================
+# 3축(다축) 처리 테스트
+# ============================================================
+
+class TestMultiAxis:
+    """(n_samples, n_axes) 블록 처리 테스트"""
+
+    @pytest.fixture
+    def triaxial_block(self, large_vibration_data):
+        """3축 진동 블록 (1000 x 3)"""
+        x = np.array(large_vibration_data)
+        return np.column_stack([x, 0.5 * x[::-1], np.roll(x, 100) + 0.2])
+
+    def test_다축_CSV_로딩(self, processor, tmp_path):
+        """여러 진폭 컬럼을 (n, n_axes) 블록으로 로딩"""
+        csv_file = tmp_path / "triaxial.csv"
+        csv_file.write_text(
+            "timestamp,x,y,z\n0.0,1,2,3\n0.1,4,5,6\n0.2,7,8,9\n",
+            encoding="utf-8",
+        )
+        timestamps, block = processor.load_csv_columnar(
+            str(csv_file), chunk_size=2, amplitude_columns=("x", "y", "z"))
+
+        assert timestamps.tolist() == [0.0, 0.1, 0.2]
+        assert block.shape == (3, 3)
+        assert block[:, 1].tolist() == [2.0, 5.0, 8.0]
+
+    def test_다축_CSV_컬럼_누락(self, processor, sample_csv_file):
+        """지정한 축 컬럼이 없으면 필수 컬럼 에러"""
+        with pytest.raises(ValueError, match="필수 컬럼"):
+            processor.load_csv_columnar(
+                sample_csv_file, amplitude_columns=("x", "y", "z"))
+
+    def test_축별_보간(self, np_processor):
+        """각 축의 결측치를 독립적으로 보간"""
+        block = np.array([
+            [1.0, np.nan],
+            [np.nan, 2.0],
+            [3.0, np.nan],
+            [4.0, np.nan],
+        ])
+        cleaned, report = np_processor.clean_data_with_report(block)
+
+        assert cleaned.tolist() == [[1.0, 2.0], [2.0, 2.0], [3.0, 2.0], [4.0, 2.0]]
+        assert report.imputed_count == 4
+        assert report.longest_gap == 2
+
+    def test_이상치_행_단위_제거(self, np_processor, triaxial_block):
+        """한 축만 이상치여도 해당 샘플 전체를 제거"""
+        block = triaxial_block.copy()
+        block[10, 0] = 100.0
+        block[20, 2] = -100.0
+
+        cleaned = np_processor.remove_outliers(block)
+        fences = np_processor.compute_iqr_fences(block)
+
+        assert cleaned.shape[1] == 3
+        assert cleaned.shape[0] <= 998
+        assert not np.any(np.all(cleaned == block[10], axis=1))
+        assert not np.any(np.all(cleaned == block[20], axis=1))
+        assert fences.lower.shape == (3,)
+        np.testing.assert_allclose(
+            fences.q1[0], np_processor.compute_iqr_fences(block[:, 0]).q1)
+
+    def test_축별_특징과_벡터크기(self, np_processor, triaxial_block):
+        """축별 특징이 1차원 추출과 같고 magnitude 채널이 추가됨"""
+        features = np_processor.extract_multiaxis_features(triaxial_block)
+
+        assert list(features) == ["x", "y", "z", "magnitude"]
+        for i, axis in enumerate(["x", "y", "z"]):
+            expected = np_processor.extract_all_features(triaxial_block[:, i])
+            assert features[axis] == pytest.approx(expected, rel=1e-9)
+
+        magnitude = np.linalg.norm(triaxial_block, axis=1)
+        assert features["magnitude"] == pytest.approx(
+            np_processor.extract_all_features(magnitude), rel=1e-9)
+
+    def test_축_이름_수_불일치(self, np_processor, triaxial_block):
+        """축 이름 수가 다르면 ValueError"""
+        with pytest.raises(ValueError, match="축 이름 수"):
+            np_processor.extract_multiaxis_features(
+                triaxial_block, axis_names=("x", "y"))
+
+    def test_1차원_입력_에러(self, np_processor, large_vibration_data):
+        """다축 특징 추출에는 2차원 블록 필요"""
+        with pytest.raises(ValueError, match="2차원"):
+            np_processor.extract_multiaxis_features(large_vibration_data)
+
+
+# ============================================================
+# 선택적 특징 계산 테스트
+# ============================================================
+
+class TestExtractFeatures:
+    """의존성 그래프 기반 선택적 특징 계산 테스트"""
+
+    def test_전체_요청시_일괄_추출과_일치(self, processor, noisy_vibration_data):
+        """모든 특징을 요청하면 extract_all_features()와 같음"""
+        result = processor.extract_features(noisy_vibration_data, FEATURE_NAMES)
+        expected = processor.extract_all_features(noisy_vibration_data)
+
+        assert list(result) == list(FEATURE_NAMES)
+        for key, value in expected.items():
+            assert result[key] == pytest.approx(
+                value, rel=processor.FEATURE_TOLERANCE), key
+
+    def test_요청한_특징만_반환(self, np_processor, sample_vibration_data):
+        """요청한 키만 반환"""
+        result = np_processor.extract_features(
+            np.array(sample_vibration_data), {"rms", "crest_factor"})
+
+        assert set(result) == {"rms", "crest_factor"}
+        assert result["crest_factor"] == pytest.approx(
+            np_processor.calculate_crest_factor(np.array(sample_vibration_data)))
+
+    def test_최소_중간값만_계산(self):
+        """rms + crest_factor는 평균/중심 모멘트를 계산하지 않음"""
+        plan = _resolve_feature_plan({"rms", "crest_factor"})
+
+        assert set(plan) == {"sum_sq", "rms", "max", "min", "peak", "crest_factor"}
+        assert plan.index("rms") < plan.index("crest_factor")
+
+    def test_중간값_공유(self):
+        """std와 kurtosis는 편차 제곱을 한 번만 계산"""
+        plan = _resolve_feature_plan({"std", "kurtosis"})
+        assert plan.count("dev_sq") == 1
+        assert plan.index("mean") < plan.index("dev_sq") < plan.index("m2_sum")
+
+    def test_특징별_최소_데이터(self, processor):
+        """rms는 1개, kurtosis는 4개 이상 필요"""
+        assert processor.extract_features([3.0], {"rms"}) == {"rms": 3.0}
+        with pytest.raises(ValueError, match="최소 4개"):
+            processor.extract_features([1.0, 2.0, 3.0], {"kurtosis"})
+
+    def test_알_수_없는_특징(self, processor):
+        """지원하지 않는 특징 이름은 ValueError"""
+        with pytest.raises(ValueError, match="알 수 없는 특징"):
+            processor.extract_features([1.0, 2.0], {"rms", "entropy"})
+
+    def test_제로_데이터_crest_factor(self, processor):
+        """RMS가 0이면 crest_factor 요청 시 에러"""
+        with pytest.raises(ValueError, match="RMS가 0"):
+            processor.extract_features([0.0, 0.0], {"crest_factor"})
+
+
+# ============================================================
+# 슬라이딩 윈도우 특징 테스트
+# ============================================================
+
+class TestRollingFeatures:
+    """O(1) 갱신 슬라이딩 윈도우 특징 추출 테스트"""
+
+    @staticmethod
+    def _assert_matches_batch(processor, data, rows, window, hop):
+        assert len(rows) == (len(data) - window) // hop + 1
+        for i, row in enumerate(rows):
+            expected = processor.extract_all_features(
+                data[i * hop:i * hop + window])
+            for key, value in expected.items():
+                assert row[key] == pytest.approx(value, rel=1e-7, abs=1e-9), (
+                    f"윈도우 {i}의 {key}"
+                )
+
+    @pytest.mark.parametrize("window, hop", [(4, 1), (50, 10), (200, 75)])
+    def test_배치_결과와_일치(self, processor, large_vibration_data,
+                           window, hop):
+        """모든 윈도우에서 extract_all_features()와 일치"""
+        rows = processor.extract_rolling_features(
+            large_vibration_data, window, hop)
+        self._assert_matches_batch(
+            processor, large_vibration_data, rows, window, hop)
+
+    def test_충격_데이터_일치(self, processor, noisy_vibration_data):
+        """이상치가 윈도우에 들어오고 나갈 때도 일치"""
+        rows = processor.extract_rolling_features(
+            noisy_vibration_data, 20, 3)
+        self._assert_matches_batch(
+            processor, noisy_vibration_data, rows, 20, 3)
+
+    def test_오프셋_긴_스트림_안정성(self, processor):
+        """큰 DC 오프셋의 긴 스트림에서도 누적 오차가 쌓이지 않음"""
+        data = [1000.0 + math.sin(i * 0.3) + 0.1 * (i % 7)
+                for i in range(5000)]
+        rows = processor.extract_rolling_features(data, 64, 64)
+        self._assert_matches_batch(processor, data, rows, 64, 64)
+
+    @pytest.mark.parametrize("step, noise", [
+        (100.0, 0.01), (1000.0, 1e-3), (2.5, 1e-3), (-1e4, 1.0),
+    ])
+    def test_DC_단차_일치(self, processor, step, noise):
+        """DC 단차가 윈도우를 지나는 동안과 지난 뒤의 모든 윈도우에서 일치"""
+        rng = np.random.default_rng(0)
+        data = np.concatenate([
+            rng.normal(0.0, noise, 300),
+            step + rng.normal(0.0, noise, 300),
+            rng.normal(0.0, noise, 200),
+        ]).tolist()
+        rows = processor.extract_rolling_features(data, 64, 1)
+        self._assert_matches_batch(processor, data, rows, 64, 1)
+
+    def test_단차_후_일정한_윈도우(self, processor):
+        """반올림 잔차가 남아도 모든 값이 같은 윈도우의 분산과 첨도는 0"""
+        data = [0.1 * i for i in range(20)] + [0.3] * 20
+        row = processor.extract_rolling_features(data, 8, 1)[-1]
+        assert row["std"] == 0.0
+        assert row["kurtosis"] == 0.0
+
+    def test_numpy_입력(self, np_processor, large_vibration_data):
+        """ndarray 입력도 처리"""
+        rows = np_processor.extract_rolling_features(
+            np.array(large_vibration_data), 100, 100)
+        assert len(rows) == 10
+
+    def test_스트리밍_push(self):
+        """hop 경계에서만 특징 행을 반환"""
+        extractor = RollingFeatureExtractor(window=4, hop=2)
+        emitted = [extractor.push(float(x)) is not None for x in range(1, 9)]
+        assert emitted == [False, False, False, True, False, True, False, True]
+
+    def test_일정한_윈도우_첨도_0(self, processor):
+        """분산이 0인 윈도우는 첨도 0 (배치와 같음)"""
+        rows = processor.extract_rolling_features(
+            [1.0, 2.0, 3.0, 4.0] + [5.0] * 10, 6, 1)
+        assert rows[-1]["kurtosis"] == 0.0
+        assert rows[-1]["std"] == 0.0
+
+    @pytest.mark.parametrize("window, hop, match", [
+        (3, 1, "최소 4개"),
+        (10, 0, "hop"),
+    ])
+    def test_잘못된_인자(self, window, hop, match):
+        """윈도우/홉 크기 검증"""
+        with pytest.raises(ValueError, match=match):
+            RollingFeatureExtractor(window, hop)
+
+
+# ============================================================
+# 스펙트럼 특징 테스트
+# ============================================================
+
+class TestSpectralFeatures:
+    """프레임 분할과 Welch PSD 기반 스펙트럼 특징 테스트"""
+
+    SAMPLE_RATE = 25600.0
+
+    @pytest.fixture
+    def tone_1khz(self):
+        """1 kHz 사인파 1초 분량"""
+        t = np.arange(25600) / self.SAMPLE_RATE
+        return np.sin(2 * np.pi * 1000.0 * t)
+
+    def test_프레임_분할(self, np_processor):
+        """겹치는 프레임이 복사 없는 뷰로 생성"""
+        data = np.arange(10.0)
+        frames = np_processor.frame_signal(data, frame_length=4, hop=2)
+
+        assert frames.shape == (4, 4)
+        assert frames[1].tolist() == [2.0, 3.0, 4.0, 5.0]
+        assert np.shares_memory(frames, data)
+
+    def test_파스발_정리(self, np_processor, tone_1khz):
+        """PSD 적분값이 신호 분산과 같음"""
+        result = np_processor.extract_spectral_features(
+            tone_1khz, self.SAMPLE_RATE)
+        df = result.freqs[1] - result.freqs[0]
+
+        assert isinstance(result, SpectralFeatures)
+        assert result.psd.sum() * df == pytest.approx(np.var(tone_1khz), rel=1e-3)
+
+    def test_대역_에너지(self, np_processor, tone_1khz):
+        """1 kHz 대역에 에너지가 집중"""
+        result = np_processor.extract_spectral_features(
+            tone_1khz, self.SAMPLE_RATE,
+            bands=[(900.0, 1100.0), (2000.0, 4000.0)],
+        )
+
+        assert result.band_energies[(900.0, 1100.0)] == pytest.approx(0.5, rel=1e-3)
+        assert result.band_energies[(2000.0, 4000.0)] < 1e-6
+
+    def test_스펙트럼_무게중심(self, np_processor, tone_1khz):
+        """단일 톤의 무게중심은 톤 주파수"""
+        result = np_processor.extract_spectral_features(
+            tone_1khz, self.SAMPLE_RATE)
+        assert result.spectral_centroid == pytest.approx(1000.0, rel=1e-3)
+
+    def test_프레임별_계산과_일치(self, np_processor, large_vibration_data):
+        """일괄 rfft 결과가 프레임별 루프 계산과 같음"""
+        result = np_processor.extract_spectral_features(
+            large_vibration_data, 1000.0, frame_length=256, overlap=0.5)
+
+        window = np.hanning(256)
+        expected = np.zeros(129)
+        frames = 0
+        for start in range(0, 1000 - 256 + 1, 128):
+            frame = np.array(large_vibration_data[start:start + 256])
+            spectrum = np.fft.rfft((frame - frame.mean()) * window)
+            expected += np.abs(spectrum) ** 2
+            frames += 1
+        expected /= frames * 1000.0 * np.sum(window ** 2)
+        expected[1:-1] *= 2
+
+        assert result.n_frames == frames
+        np.testing.assert_allclose(result.psd, expected, rtol=1e-10, atol=1e-15)
+
+    def test_윈도우_캐시(self, np_processor, tone_1khz):
+        """같은 (frame_length, sample_rate)의 윈도우는 재사용"""
+        np_processor.extract_spectral_features(tone_1khz, self.SAMPLE_RATE)
+        hits = _spectral_window.cache_info().hits
+        np_processor.extract_spectral_features(tone_1khz, self.SAMPLE_RATE)
+        assert _spectral_window.cache_info().hits > hits
+
+    @pytest.mark.parametrize("kwargs, match", [
+        ({"sample_rate": 0.0}, "양수"),
+        ({"sample_rate": 100.0, "overlap": 1.0}, "overlap"),
+        ({"sample_rate": 100.0, "frame_length": 4096}, "짧습니다"),
+    ])
+    def test_잘못된_인자(self, np_processor, kwargs, match):
+        """인자 검증"""
+        with pytest.raises(ValueError, match=match):
+            np_processor.extract_spectral_features(np.zeros(1000), **kwargs)
+
+
+# ============================================================
+# 디렉토리 일괄 특징 추출 테스트
+# ============================================================
+
+class TestBatchExtractFeatures:
+    """프로세스 풀 기반 일괄 특징 추출 테스트"""
+
+    @pytest.fixture
+    def capture_dir(self, tmp_path, sample_csv_content, malformed_csv_file):
+        """정상 파일 3개 + 잘못된 파일 2개가 있는 디렉토리"""
+        captures = tmp_path / "captures"
+        captures.mkdir()
+        for i in range(3):
+            rows = "".join(
+                f"{t * 0.001:.3f},{math.sin(t * (i + 1) * 0.1)}\n"
+                for t in range(50)
+            )
+            (captures / f"bearing_{i}.csv").write_text(
+                "timestamp,amplitude\n" + rows, encoding="utf-8")
+        (captures / "bad.csv").write_text(
+            "timestamp,amplitude\n0.0,1.0\n0.1,abc\n", encoding="utf-8")
+        (captures / "short.csv").write_text(
+            "timestamp,amplitude\n0.0,1.0\n", encoding="utf-8")
+        (captures / "notes.txt").write_text("무시됨", encoding="utf-8")
+        return captures
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_손상된_파일은_해당_파일만_실패(self, processor, capture_dir,
+                                  max_workers):
+        """csv.Error가 나는 파일이 있어도 나머지 파일은 처리됨"""
+        (capture_dir / "corrupt.csv").write_text(
+            "timestamp,amplitude\n0.0,\"" + "9" * 200_000 + "\"\n",
+            encoding="utf-8",
+        )
+        result = processor.batch_extract_features(
+            str(capture_dir), max_workers=max_workers)
+
+        assert len(result.features) == 3
+        assert "CSV 구문 오류" in result.errors["corrupt.csv"]
+
+    def test_파일별_특징_테이블(self, processor, capture_dir):
+        """정상 파일은 특징, 잘못된 파일은 에러로 분리"""
+        result = processor.batch_extract_features(
+            str(capture_dir), max_workers=1)
+
+        assert sorted(result.features) == [
+            "bearing_0.csv", "bearing_1.csv", "bearing_2.csv"]
+        assert sorted(result.errors) == ["bad.csv", "short.csv"]
+        assert "3행 데이터 변환 오류" in result.errors["bad.csv"]
+        assert "최소 4개" in result.errors["short.csv"]
+
+    def test_단일_처리와_일치(self, processor, capture_dir):
+        """특징값이 load_csv → extract_all_features 결과와 같음"""
+        result = processor.batch_extract_features(
+            str(capture_dir), max_workers=1)
+
+        rows = processor.load_csv(str(capture_dir / "bearing_1.csv"))
+        expected = processor.extract_all_features(
+            [row["amplitude"] for row in rows])
+        assert result.features["bearing_1.csv"] == pytest.approx(expected)
+
+    def test_프로세스_풀_결과_동일(self, np_processor, capture_dir):
+        """워커 수와 무관하게 같은 결과"""
+        serial = np_processor.batch_extract_features(
+            str(capture_dir), max_workers=1)
+        parallel = np_processor.batch_extract_features(
+            str(capture_dir), max_workers=2, chunksize=2)
+
+        assert parallel == serial
+
+    def test_빈_디렉토리(self, processor, tmp_path):
+        """대상 파일이 없으면 빈 결과"""
+        result = processor.batch_extract_features(str(tmp_path))
+        assert result.features == {} and result.errors == {}
+
+    def test_존재하지_않는_디렉토리(self, processor):
+        """없는 디렉토리는 FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            processor.batch_extract_features("/nonexistent/captures")
+
+    def test_잘못된_워커_수(self, processor, tmp_path):
+        """max_workers가 0 이하이면 ValueError"""
+        with pytest.raises(ValueError, match="max_workers"):
+            processor.batch_extract_features(str(tmp_path), max_workers=0)
+
+
+# ============================================================
+# float32 모드 테스트
+# ============================================================
+
+class TestFloat32Mode:
+    """dtype="float32" 처리 모드와 float64 대비 오차 한계 테스트"""
+
+    TOL = VibrationDataProcessor.FLOAT32_FEATURE_TOLERANCE
+
+    @pytest.fixture
+    def f32_processor(self):
+        """float32 모드 numpy 백엔드 처리기"""
+        return VibrationDataProcessor(backend="numpy", dtype="float32")
+
+    @pytest.fixture(params=["정현파", "DC_오프셋", "충격"])
+    def signal(self, request):
+        """25.6 kHz 2초 분량 진동 신호 (float64)"""
+        rng = np.random.default_rng(7)
+        t = np.arange(51200) / 25600.0
+        x = 0.5 * np.sin(2 * np.pi * 157.0 * t) + 0.05 * rng.standard_normal(t.size)
+        if request.param == "DC_오프셋":
+            x += 2.0
+        elif request.param == "충격":
+            x[rng.integers(0, t.size, 40)] += 3.0
+        return x
+
+    def assert_features_close(self, actual, expected):
+        """특징 값이 허용 상대 오차 이내인지 확인
+
+        초과 첨도는 0 근처에서 상대 오차가 의미 없으므로
+        m4 / m2^2 (= 초과 첨도 + 3) 기준으로 비교합니다.
+        """
+        for key, value in actual.items():
+            if key == "kurtosis":
+                assert value + 3.0 == pytest.approx(expected[key] + 3.0, rel=self.TOL)
+            else:
+                assert value == pytest.approx(expected[key], rel=self.TOL), key
+
+    @pytest.mark.parametrize("kwargs, match", [
+        ({"dtype": "float16"}, "지원하지 않는 dtype"),
+        ({"backend": "list", "dtype": "float32"}, "numpy 백엔드에서만"),
+    ])
+    def test_잘못된_dtype(self, kwargs, match):
+        """지원하지 않는 조합은 ValueError"""
+        with pytest.raises(ValueError, match=match):
+            VibrationDataProcessor(**kwargs)
+
+    def test_float32_입력은_복사_없음(self, f32_processor):
+        """float32 배열은 뷰로, 나머지 입력은 float32로 변환"""
+        data = np.arange(8, dtype=np.float32)
+
+        assert np.shares_memory(f32_processor._as_array(data), data)
+        assert f32_processor._as_array(data.astype(np.float64)).dtype == np.float32
+        assert f32_processor._as_array([1.0, None]).dtype == np.float32
+
+    def test_전체_특징_오차_한계(self, f32_processor, np_processor, signal):
+        """extract_all_features()가 float64 경로와 허용 오차 이내로 일치"""
+        result = f32_processor.extract_all_features(signal)
+        expected = np_processor.extract_all_features(signal)
+
+        assert all(isinstance(v, float) for v in result.values())
+        self.assert_features_close(result, expected)
+
+    def test_개별_특징_오차_한계(self, f32_processor, np_processor, signal):
+        """calculate_*()와 지연 그래프 경로도 같은 오차 한계를 만족"""
+        expected = np_processor.extract_all_features(signal)
+        single = {
+            "rms": f32_processor.calculate_rms(signal),
+            "kurtosis": f32_processor.calculate_kurtosis(signal),
+            "peak_to_peak": f32_processor.calculate_peak_to_peak(signal),
+            "crest_factor": f32_processor.calculate_crest_factor(signal),
+        }
+
+        self.assert_features_close(single, expected)
+        self.assert_features_close(
+            f32_processor.extract_features(signal, FEATURE_NAMES), expected)
+
+    def test_다축_특징_오차_한계(self, f32_processor, np_processor, signal):
+        """다축 블록과 크기 채널도 같은 오차 한계를 만족"""
+        block = np.column_stack([signal, 0.3 * signal[::-1], np.roll(signal, 99)])
+        result = f32_processor.extract_multiaxis_features(block)
+        expected = np_processor.extract_multiaxis_features(block)
+
+        for name in expected:
+            self.assert_features_close(result[name], expected[name])
+
+    def test_리샘플링은_float32_유지(self, f32_processor, np_processor, signal):
+        """출력이 float32이며 float64 경로와 단정밀도 수준으로 일치"""
+        result = f32_processor.resample_to_rate(signal, 25600.0, 10000.0)
+        expected = np_processor.resample_to_rate(signal, 25600.0, 10000.0)
+
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, expected, atol=1e-5 * np.abs(signal).max())
+        assert f32_processor.resample(signal, 100).dtype == np.float32
+
+    def test_스펙트럼_오차_한계(self, f32_processor, np_processor, signal):
+        """PSD 적분과 대역 에너지가 float64 경로와 일치"""
+        bands = [(100.0, 200.0)]
+        result = f32_processor.extract_spectral_features(signal, 25600.0, bands=bands)
+        expected = np_processor.extract_spectral_features(signal, 25600.0, bands=bands)
+
+        assert result.band_energies[bands[0]] == pytest.approx(
+            expected.band_energies[bands[0]], rel=self.TOL)
+        assert result.spectral_centroid == pytest.approx(
+            expected.spectral_centroid, rel=self.TOL)
+
+    def test_보간과_이상치_제거(self, f32_processor):
+        """클리닝 단계도 float32 배열을 유지"""
+        data = np.array([1.0, np.nan, 3.0, 2.0, 100.0, 2.5], dtype=np.float32)
+
+        cleaned = f32_processor.clean_data(data)
+        assert cleaned.dtype == np.float32
+        assert cleaned[1] == 2.0
+        assert f32_processor.remove_outliers(cleaned).dtype == np.float32
+
+    def test_CSV_진폭은_float32(self, f32_processor, sample_csv_file):
+        """진폭은 float32, timestamp는 정밀도를 위해 float64로 로딩"""
+        timestamps, amplitudes = f32_processor.load_csv_columnar(sample_csv_file)
+
+        assert timestamps.dtype == np.float64
+        assert amplitudes.dtype == np.float32
+        assert amplitudes.nbytes == timestamps.nbytes // 2
+
+
 # ============================================================
 # 통합 파이프라인 테스트
 # ============================================================
@@ -0,0 +1,187 @@
+"""
+바이너리 파형 파일 테스트 모듈
+
+src_waveform_file의 쓰기, CSV 변환, 메모리 맵 읽기를 테스트합니다.
+"""
+
+import numpy as np
+import pytest
+from src_vibration_processor import VibrationDataProcessor
+from src_waveform_file import (
+    HEADER_SIZE,
+    WaveformHeader,
+    convert_csv_to_waveform,
+    open_waveform,
+    read_waveform_header,
+    write_waveform,
+)
+
+
+@pytest.fixture
+def waveform_path(tmp_path):
+    """파형 파일 경로"""
+    return str(tmp_path / "capture.vwf")
+
+
+class TestWriteAndOpen:
+    """write_waveform() → open_waveform() 왕복 테스트"""
+
+    def test_단일_채널_왕복(self, waveform_path, large_vibration_data):
+        """저장한 샘플과 헤더가 그대로 복원됨"""
+        samples = np.array(large_vibration_data)
+        write_waveform(waveform_path, samples, sample_rate=1000.0,
+                       start_timestamp=12.5)
+
+        header, loaded = open_waveform(waveform_path)
+
+        assert header == WaveformHeader(
+            sample_rate=1000.0, channels=1, dtype="float64",
+            start_timestamp=12.5, n_samples=1000,
+        )
+        assert isinstance(loaded, np.memmap)
+        np.testing.assert_array_equal(loaded, samples)
+
+    def test_다채널_float32(self, waveform_path):
+        """(n, channels) 블록을 float32로 저장"""
+        samples = np.arange(30, dtype=np.float64).reshape(10, 3)
+        write_waveform(waveform_path, samples, sample_rate=25600.0,
+                       dtype="float32")
+
+        header, loaded = open_waveform(waveform_path)
+
+        assert header.channels == 3
+        assert loaded.shape == (10, 3)
+        assert loaded.dtype == np.float32
+        np.testing.assert_array_equal(loaded, samples)
+
+    def test_파일_크기(self, waveform_path, tmp_path):
+        """헤더 + 원시 샘플 외에 추가 데이터가 없음"""
+        write_waveform(waveform_path, np.zeros(100), sample_rate=1.0)
+        assert (tmp_path / "capture.vwf").stat().st_size == HEADER_SIZE + 800
+
+    def test_timestamps_계산(self, waveform_path):
+        """timestamp는 시작 시각과 샘플링 주파수로 계산"""
+        write_waveform(waveform_path, np.zeros(4), sample_rate=2.0,
+                       start_timestamp=1.0)
+        header = read_waveform_header(waveform_path)
+        assert header.timestamps().tolist() == [1.0, 1.5, 2.0, 2.5]
+
+    def test_처리기에_복사없이_전달(self, waveform_path, sample_vibration_data):
+        """메모리 맵 뷰를 numpy 백엔드가 그대로 사용"""
+        write_waveform(waveform_path, np.array(sample_vibration_data),
+                       sample_rate=50.0)
+        _, loaded = open_waveform(waveform_path)
+        processor = VibrationDataProcessor(backend="numpy")
+
+        assert np.shares_memory(processor._as_array(loaded), loaded)
+        assert processor.calculate_rms(loaded) == pytest.approx(
+            VibrationDataProcessor().calculate_rms(sample_vibration_data))
+
+    def test_빈_파형(self, waveform_path):
+        """샘플이 0개인 파일도 열 수 있음"""
+        write_waveform(waveform_path, np.empty(0), sample_rate=1.0)
+        header, loaded = open_waveform(waveform_path)
+        assert header.n_samples == 0
+        assert loaded.size == 0
+
+
+class TestConvertCSV:
+    """CSV → 파형 파일 변환 테스트"""
+
+    def test_변환_후_값_일치(self, sample_csv_file, waveform_path):
+        """진폭 값과 시작 시각, 추정 샘플링 주파수가 올바름"""
+        header = convert_csv_to_waveform(
+            sample_csv_file, waveform_path, chunk_size=2)
+
+        assert header.n_samples == 5
+        assert header.start_timestamp == 0.0
+        assert header.sample_rate == pytest.approx(1000.0)
+
+        _, loaded = open_waveform(waveform_path)
+        expected = [row["amplitude"] for row in
+                    VibrationDataProcessor().load_csv(sample_csv_file)]
+        assert loaded.tolist() == expected
+
+    def test_샘플링_주파수_지정(self, sample_csv_file, waveform_path):
+        """sample_rate를 지정하면 추정하지 않음"""
+        header = convert_csv_to_waveform(
+            sample_csv_file, waveform_path, sample_rate=500.0)
+        assert read_waveform_header(waveform_path) == header
+        assert header.sample_rate == 500.0
+
+    def test_데이터_없는_CSV(self, header_only_csv_file, waveform_path):
+        """헤더만 있는 CSV는 변환할 수 없음"""
+        with pytest.raises(ValueError, match="변환할 데이터가 없습니다"):
+            convert_csv_to_waveform(header_only_csv_file, waveform_path)
+
+    def test_잘못된_CSV_에러_전달(self, malformed_csv_file, waveform_path):
+        """CSV 변환 오류가 그대로 전달됨"""
+        with pytest.raises(ValueError, match="변환 오류"):
+            convert_csv_to_waveform(
+                malformed_csv_file, waveform_path, sample_rate=1.0)
+
+    def test_블록_크기_1에서도_추정(self, sample_csv_file, waveform_path):
+        """첫 두 행이 다른 블록에 있어도 샘플링 주파수 추정"""
+        header = convert_csv_to_waveform(
+            sample_csv_file, waveform_path, chunk_size=1)
+        assert header.sample_rate == pytest.approx(1000.0)
+        assert header.n_samples == 5
+
+    def test_중복_timestamp는_추정_불가(self, tmp_path, waveform_path):
+        """간격 중앙값이 0이면 ValueError, 출력 파일은 남지 않음"""
+        csv_file = tmp_path / "duplicated.csv"
+        csv_file.write_text(
+            "timestamp,amplitude\n0.0,1.0\n0.0,2.0\n0.0,3.0\n",
+            encoding="utf-8",
+        )
+        with pytest.raises(ValueError, match="간격이 0 이하"):
+            convert_csv_to_waveform(str(csv_file), waveform_path)
+        assert list(tmp_path.glob("capture.vwf*")) == []
+
+    def test_변환_실패시_파일_남지_않음(self, malformed_csv_file, waveform_path,
+                                  tmp_path):
+        """변환 도중 오류가 나면 출력 파일과 임시 파일이 없음"""
+        with pytest.raises(ValueError):
+            convert_csv_to_waveform(
+                malformed_csv_file, waveform_path, chunk_size=1)
+        assert list(tmp_path.glob("capture.vwf*")) == []
+
+
+class TestInvalidFiles:
+    """잘못된 파형 파일 처리 테스트"""
+
+    def test_존재하지_않는_파일(self):
+        """없는 파일은 FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            open_waveform("/nonexistent/path/capture.vwf")
+
+    def test_매직_넘버_불일치(self, tmp_path):
+        """형식이 다른 파일은 ValueError"""
+        bad = tmp_path / "bad.vwf"
+        bad.write_bytes(b"NOPE" + b"\0" * (HEADER_SIZE - 4))
+        with pytest.raises(ValueError, match="파형 파일 형식이 아닙니다"):
+            open_waveform(str(bad))
+
+    def test_잘린_헤더(self, tmp_path):
+        """헤더보다 짧은 파일은 ValueError"""
+        bad = tmp_path / "short.vwf"
+        bad.write_bytes(b"VWF1")
+        with pytest.raises(ValueError, match="헤더가 잘렸습니다"):
+            open_waveform(str(bad))
+
+    def test_잘린_샘플_영역(self, waveform_path):
+        """헤더의 샘플 수보다 파일이 짧으면 ValueError"""
+        write_waveform(waveform_path, np.zeros(100), sample_rate=1.0)
+        with open(waveform_path, "r+b") as f:
+            f.truncate(HEADER_SIZE + 80)
+        with pytest.raises(ValueError, match="샘플 영역"):
+            open_waveform(waveform_path)
+
+    @pytest.mark.parametrize("kwargs, match", [
+        ({"sample_rate": 0.0}, "양수"),
+        ({"sample_rate": 1.0, "dtype": "int16"}, "지원하지 않는 dtype"),
+    ])
+    def test_잘못된_쓰기_인자(self, waveform_path, kwargs, match):
+        """샘플링 주파수와 dtype 검증"""
+        with pytest.raises(ValueError, match=match):
+            write_waveform(waveform_path, np.zeros(4), **kwargs)
@@ -4,12 +4,19 @@
 공장 설비 센서에서 수집된 데이터의 유효성을 검증합니다.
 스키마 검증, 물리적 범위 검증, 시계열 갭 탐지, 완전성 검사를 제공합니다.
 
-외부 라이브러리 없이 Python 표준 라이브러리만 사용합니다.
+레코드 단위 검증은 Python 표준 라이브러리만 사용하며,
+대량 배치를 위한 컬럼형 검증(validate_range_columnar 등)은 NumPy를 사용합니다.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import (
+    List, Dict, Any, Iterable, Mapping, Optional, Sequence, Tuple, Union,
+)
+
+import numpy as np
 
 
 @dataclass
@@ -26,6 +33,707 @@ class ValidationResult:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
 
+    def merge(self, other: "ValidationResult") -> "ValidationResult":
+        """
+        두 결과를 합친 새 결과를 반환합니다 (원본은 변경하지 않음).
+
+        is_valid는 논리곱, 메시지는 self 뒤에 other를 이어 붙이므로
+        결합 법칙이 성립하고 파티션 순서대로 합치면 메시지 순서가 보존됩니다.
+        ValidationResult()가 항등원입니다.
+        """
+        return ValidationResult(
+            is_valid=self.is_valid and other.is_valid,
+            errors=self.errors + other.errors,
+            warnings=self.warnings + other.warnings,
+        )
+
+    @classmethod
+    def merge_all(cls, results: Iterable["ValidationResult"]) -> "ValidationResult":
+        """여러 결과를 순서대로 합칩니다 (빈 입력이면 유효한 빈 결과)."""
+        merged = cls()
+        for result in results:
+            merged.is_valid = merged.is_valid and result.is_valid
+            merged.errors.extend(result.errors)
+            merged.warnings.extend(result.warnings)
+        return merged
+
+
+# 컬럼형 범위 검증 구간 종류 코드
+SPAN_MISSING = 1     # None 또는 NaN (에러)
+SPAN_BELOW = 2       # 하한 미만 (에러)
+SPAN_ABOVE = 3       # 상한 초과 (에러)
+SPAN_NEAR_MIN = 4    # 하한 근접 (경고)
+SPAN_NEAR_MAX = 5    # 상한 근접 (경고)
+
+ERROR_SPAN_KINDS = (SPAN_MISSING, SPAN_BELOW, SPAN_ABOVE)
+WARNING_SPAN_KINDS = (SPAN_NEAR_MIN, SPAN_NEAR_MAX)
+
+# 컬럼형 검증 결과에서 종류별로 만들 메시지 수 기본값
+DEFAULT_MAX_MESSAGES = 20
+
+
+@dataclass
+class RangeViolations:
+    """
+    컬럼형 범위 검증 결과 (validate_range_columnar()의 반환값)
+
+    위반을 인덱스마다 문자열로 만들지 않고, 같은 종류가 연속된 구간을
+    [start, stop) 형태로 압축해 보관합니다. 메모리는 구간 수에 비례하며,
+    사람이 읽는 메시지는 messages()/to_result() 호출 시 최대
+    max_messages개만 만듭니다.
+
+    Attributes:
+        sensor_type: 센서 타입 (메시지에 사용)
+        min_val: 허용 최소값
+        max_val: 허용 최대값
+        values: 검증한 값 배열 (메시지 생성용, 입력이 float64 배열이면 뷰)
+        starts: 구간 시작 인덱스 (int64)
+        stops: 구간 끝 인덱스 (미포함, int64)
+        kinds: 구간 종류 코드 (SPAN_* 상수, int8)
+        max_messages: 종류(에러/경고)별 최대 메시지 수
+    """
+    sensor_type: str
+    min_val: float
+    max_val: float
+    values: np.ndarray
+    starts: np.ndarray
+    stops: np.ndarray
+    kinds: np.ndarray
+    max_messages: int = DEFAULT_MAX_MESSAGES
+
+    @property
+    def is_valid(self) -> bool:
+        """에러 구간이 없으면 True (경고 구간은 허용)"""
+        return not np.isin(self.kinds, ERROR_SPAN_KINDS).any()
+
+    @property
+    def violation_count(self) -> int:
+        """에러(결측/범위 이탈) 값의 개수"""
+        selected = np.isin(self.kinds, ERROR_SPAN_KINDS)
+        return int((self.stops[selected] - self.starts[selected]).sum())
+
+    def mask(self, kinds: Sequence[int] = ERROR_SPAN_KINDS) -> np.ndarray:
+        """
+        지정한 종류의 구간에 속한 값의 불리언 마스크를 만듭니다.
+
+        Args:
+            kinds: 포함할 구간 종류 (기본값: 에러 종류 전체)
+
+        Returns:
+            values와 같은 길이의 bool 배열
+        """
+        selected = np.isin(self.kinds, kinds)
+        # 구간 경계에 +1/-1을 두고 누적합하면 구간 내부만 1이 됨
+        edges = np.zeros(self.values.size + 1, dtype=np.int64)
+        np.add.at(edges, self.starts[selected], 1)
+        np.add.at(edges, self.stops[selected], -1)
+        return np.cumsum(edges[:-1]) > 0
+
+    def indices(self, kinds: Sequence[int] = ERROR_SPAN_KINDS) -> np.ndarray:
+        """지정한 종류의 구간에 속한 인덱스 배열 (오름차순)"""
+        return np.flatnonzero(self.mask(kinds))
+
+    def messages(self, kinds: Sequence[int] = ERROR_SPAN_KINDS) -> List[str]:
+        """
+        지정한 종류의 구간 메시지를 최대 max_messages개 만듭니다.
+
+        구간이 더 많으면 생략된 구간 수를 알리는 메시지를 마지막에 붙입니다.
+        """
+        selected = np.flatnonzero(np.isin(self.kinds, kinds))
+        messages = [
+            self._format_span(int(i)) for i in selected[:self.max_messages]
+        ]
+        omitted = selected.size - len(messages)
+        if omitted > 0:
+            messages.append(f"... 외 {omitted}개 구간 생략")
+        return messages
+
+    def to_result(self) -> ValidationResult:
+        """메시지 수를 제한한 ValidationResult로 변환합니다."""
+        result = ValidationResult(is_valid=self.is_valid)
+        if self.values.size == 0:
+            result.warnings.append("검증할 데이터가 비어있습니다")
+            return result
+        result.errors = self.messages(ERROR_SPAN_KINDS)
+        result.warnings = self.messages(WARNING_SPAN_KINDS)
+        return result
+
+    def _format_span(self, i: int) -> str:
+        start, stop, kind = int(self.starts[i]), int(self.stops[i]), int(self.kinds[i])
+        if stop - start == 1:
+            where = f"인덱스 {start}: {self.sensor_type}"
+        else:
+            where = f"인덱스 {start}~{stop - 1} ({stop - start}개): {self.sensor_type}"
+
+        if kind == SPAN_MISSING:
+            return f"{where} 값이 None 또는 NaN입니다"
+
+        span = self.values[start:stop]
+        if stop - start == 1:
+            shown = f"값 {span[0]}이(가)"
+        else:
+            shown = f"값(최소 {span.min()}, 최대 {span.max()})이"
+
+        if kind in (SPAN_BELOW, SPAN_ABOVE):
+            return (
+                f"{where} {shown} "
+                f"허용 범위({self.min_val}~{self.max_val})를 벗어났습니다"
+            )
+        if kind == SPAN_NEAR_MIN:
+            return f"{where} {shown} 하한({self.min_val})에 근접합니다"
+        return f"{where} {shown} 상한({self.max_val})에 근접합니다"
+
+
+# 스키마 배치 검증에서 문제 종류/컬럼별로 보관할 행 인덱스 수 기본값
+DEFAULT_SAMPLE_ROWS = 5
+
+
+@dataclass
+class ColumnIssue:
+    """
+    한 컬럼의 한 가지 스키마 문제 집계
+
+    Attributes:
+        count: 문제가 있는 레코드 수
+        rows: 처음 sample_rows개의 문제 행 인덱스
+        type_names: 발견된 실제 타입 이름들 (타입 오류일 때, 발견 순서)
+    """
+    count: int = 0
+    rows: List[int] = field(default_factory=list)
+    type_names: List[str] = field(default_factory=list)
+
+
+@dataclass
+class SchemaReport:
+    """
+    CompiledSchema 배치 검증 결과 (컬럼별 집계)
+
+    Attributes:
+        n_records: 검증한 레코드 수
+        column_types: 예상 컬럼명 → 기대 타입 이름
+        missing: 컬럼별 누락 집계
+        type_errors: 컬럼별 타입 오류 집계
+        int_as_float: float 컬럼에 int가 들어온 경우 집계 (경고)
+        extra_columns: 예상하지 않은 컬럼별 집계 (경고)
+    """
+    n_records: int = 0
+    column_types: Dict[str, str] = field(default_factory=dict)
+    missing: Dict[str, ColumnIssue] = field(default_factory=dict)
+    type_errors: Dict[str, ColumnIssue] = field(default_factory=dict)
+    int_as_float: Dict[str, ColumnIssue] = field(default_factory=dict)
+    extra_columns: Dict[str, ColumnIssue] = field(default_factory=dict)
+
+    @property
+    def is_valid(self) -> bool:
+        """누락/타입 오류가 없으면 True"""
+        return not self.missing and not self.type_errors
+
+    def to_result(self) -> ValidationResult:
+        """컬럼마다 메시지 하나로 요약한 ValidationResult로 변환합니다."""
+        result = ValidationResult(is_valid=self.is_valid)
+
+        for name, issue in self.missing.items():
+            result.errors.append(
+                f"필수 컬럼 '{name}'이(가) 누락되었습니다 "
+                f"({issue.count}/{self.n_records}개 레코드, 행: {issue.rows})"
+            )
+        for name, issue in self.type_errors.items():
+            result.errors.append(
+                f"컬럼 '{name}'의 타입이 올바르지 않습니다: "
+                f"기대 {self.column_types.get(name, '?')}, "
+                f"실제 {', '.join(issue.type_names)} "
+                f"({issue.count}/{self.n_records}개 레코드, 행: {issue.rows})"
+            )
+        for name, issue in self.int_as_float.items():
+            result.warnings.append(
+                f"컬럼 '{name}'의 타입이 int입니다 (float 기대, 자동 변환 가능) "
+                f"({issue.count}/{self.n_records}개 레코드, 행: {issue.rows})"
+            )
+        for name, issue in self.extra_columns.items():
+            result.warnings.append(
+                f"예상하지 않은 컬럼이 있습니다: '{name}' "
+                f"({issue.count}/{self.n_records}개 레코드, 행: {issue.rows})"
+            )
+
+        return result
+
+
+class CompiledSchema:
+    """
+    한 번 컴파일해 재사용하는 배치 스키마 검증기
+
+    validate_schema()와 같은 규칙(누락·타입 불일치는 에러, float 컬럼의 int와
+    예상하지 않은 컬럼은 경고)을 레코드 배치 전체에 적용하고,
+    결과를 컬럼별 개수와 처음 몇 개의 문제 행 인덱스로 집계합니다.
+    컬럼 목록, 키 집합, int 허용 여부는 생성 시 한 번만 계산합니다.
+    """
+
+    def __init__(
+        self,
+        expected_columns: Dict[str, type],
+        sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    ):
+        """
+        Args:
+            expected_columns: 예상 컬럼명과 타입 딕셔너리
+            sample_rows: 문제별로 보관할 행 인덱스 수
+
+        Raises:
+            ValueError: sample_rows가 음수일 때
+        """
+        if sample_rows < 0:
+            raise ValueError("sample_rows는 0 이상이어야 합니다")
+
+        # (컬럼명, 타입, int를 경고로 허용하는지)
+        self._columns: Tuple[Tuple[str, type, bool], ...] = tuple(
+            (name, col_type, col_type is float)
+            for name, col_type in expected_columns.items()
+        )
+        self._expected_keys = frozenset(expected_columns)
+        self._type_names = {
+            name: col_type.__name__ for name, col_type in expected_columns.items()
+        }
+        self.sample_rows = sample_rows
+
+    @property
+    def columns(self) -> Dict[str, type]:
+        """컴파일된 예상 컬럼 딕셔너리 (사본)"""
+        return {name: col_type for name, col_type, _ in self._columns}
+
+    def _add(
+        self,
+        issues: Dict[str, ColumnIssue],
+        name: str,
+        row: int,
+        type_name: Optional[str] = None,
+    ) -> None:
+        issue = issues.get(name)
+        if issue is None:
+            issue = issues[name] = ColumnIssue()
+        issue.count += 1
+        if len(issue.rows) < self.sample_rows:
+            issue.rows.append(row)
+        if type_name is not None and type_name not in issue.type_names:
+            issue.type_names.append(type_name)
+
+    def check(self, records: Iterable[Mapping[str, Any]]) -> SchemaReport:
+        """
+        레코드(딕셔너리) 배치를 검증해 컬럼별로 집계합니다.
+
+        Args:
+            records: 검증할 레코드들 (list of dict 등)
+
+        Returns:
+            SchemaReport: 컬럼별 집계 결과
+        """
+        report = SchemaReport(column_types=self._type_names)
+        columns = self._columns
+        expected_keys = self._expected_keys
+        n_expected = len(columns)
+        row = -1
+
+        for row, record in enumerate(records):
+            present = n_expected
+            for name, col_type, int_ok in columns:
+                try:
+                    value = record[name]
+                except KeyError:
+                    present -= 1
+                    self._add(report.missing, name, row)
+                    continue
+
+                # 정확한 타입 일치가 대부분이므로 isinstance보다 먼저 확인
+                if type(value) is col_type or isinstance(value, col_type):
+                    continue
+                if int_ok and isinstance(value, int):
+                    self._add(report.int_as_float, name, row)
+                else:
+                    self._add(
+                        report.type_errors, name, row, type(value).__name__
+                    )
+
+            if len(record) != present:
+                for name in record.keys() - expected_keys:
+                    self._add(report.extra_columns, name, row)
+
+        report.n_records = row + 1
+        return report
+
+    def check_columns(self, columns: Mapping[str, Sequence[Any]]) -> SchemaReport:
+        """
+        컬럼형 배치({컬럼명: 값 시퀀스})를 검증해 컬럼별로 집계합니다.
+
+        NumPy 배열 컬럼은 dtype만으로 판정하고, 리스트 컬럼은 값 타입 집합이
+        기대 타입 하나뿐이면 원소별 검사를 생략합니다.
+
+        Args:
+            columns: 컬럼명 → 값 시퀀스 (모든 컬럼의 길이가 같아야 함)
+
+        Returns:
+            SchemaReport: 컬럼별 집계 결과
+
+        Raises:
+            ValueError: 컬럼 길이가 서로 다를 때
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"컬럼 길이가 서로 다릅니다: {sorted(lengths)}")
+
+        n_records = lengths.pop() if lengths else 0
+        report = SchemaReport(
+            n_records=n_records, column_types=self._type_names
+        )
+        all_rows = range(n_records)
+
+        for name, col_type, int_ok in self._columns:
+            if name not in columns:
+                self._add_rows(report.missing, name, all_rows)
+                continue
+
+            values = columns[name]
+            if isinstance(values, np.ndarray) and values.dtype != object:
+                kind = values.dtype.kind
+                if (col_type is float and kind == "f") or (
+                    col_type is int and kind in "iu"
+                ) or (col_type is bool and kind == "b"):
+                    continue
+                if int_ok and kind in "iub":
+                    self._add_rows(report.int_as_float, name, all_rows)
+                    continue
+                # 그 외 dtype은 원소별로 판정 (예: str 배열)
+                values = values.tolist()
+
+            if {type(v) for v in values} <= {col_type}:
+                continue
+
+            for row, value in enumerate(values):
+                if isinstance(value, col_type):
+                    continue
+                if int_ok and isinstance(value, int):
+                    self._add(report.int_as_float, name, row)
+                else:
+                    self._add(
+                        report.type_errors, name, row, type(value).__name__
+                    )
+
+        for name in columns.keys() - self._expected_keys:
+            self._add_rows(report.extra_columns, name, all_rows)
+
+        return report
+
+    def _add_rows(
+        self, issues: Dict[str, ColumnIssue], name: str, rows: range
+    ) -> None:
+        """컬럼 전체 행에 같은 문제가 있을 때 한 번에 집계합니다."""
+        issues[name] = ColumnIssue(
+            count=len(rows), rows=list(rows[:self.sample_rows])
+        )
+
+    def validate(self, records: Iterable[Mapping[str, Any]]) -> ValidationResult:
+        """check() 결과를 ValidationResult로 반환합니다."""
+        return self.check(records).to_result()
+
+    def validate_columns(
+        self, columns: Mapping[str, Sequence[Any]]
+    ) -> ValidationResult:
+        """check_columns() 결과를 ValidationResult로 반환합니다."""
+        return self.check_columns(columns).to_result()
+
+
+# epoch 나노초 → datetime 변환 기준 (naive UTC)
+_EPOCH = datetime(1970, 1, 1)
+_NS_PER_SECOND = 1_000_000_000
+
+
+def _as_epoch_ns(timestamps: Any) -> np.ndarray:
+    """
+    타임스탬프 배열을 int64 epoch 나노초 배열로 변환합니다.
+
+    int64 배열은 복사 없이, datetime64 배열은 ns 단위 뷰로 사용합니다.
+    datetime 객체 리스트는 datetime64[ns]로 변환합니다.
+
+    Raises:
+        ValueError: 정수/datetime64 1차원 배열이 아닐 때
+    """
+    arr = np.asarray(timestamps)
+    if arr.dtype == object:
+        # datetime 객체 리스트 (naive는 UTC로 간주)
+        arr = arr.astype("datetime64[ns]")
+    if arr.dtype.kind == "M":
+        arr = arr.astype("datetime64[ns]", copy=False).view(np.int64)
+    elif arr.dtype.kind in "iu":
+        arr = arr.astype(np.int64, copy=False)
+    else:
+        raise ValueError(
+            "int64 epoch 나노초 또는 datetime64 배열이 필요합니다: "
+            f"dtype={arr.dtype}"
+        )
+
+    if arr.ndim != 1:
+        raise ValueError(f"1차원 배열만 지원합니다: shape={arr.shape}")
+    return arr
+
+
+@dataclass
+class GapSpans:
+    """
+    벡터화 갭 탐지 결과
+
+    Attributes:
+        start_ns: 갭 직전 타임스탬프 (int64 epoch 나노초)
+        end_ns: 갭 직후 타임스탬프 (int64 epoch 나노초)
+    """
+    start_ns: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.int64)
+    )
+    end_ns: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.int64)
+    )
+
+    def __len__(self) -> int:
+        return int(self.start_ns.size)
+
+    @property
+    def gap_seconds(self) -> np.ndarray:
+        """갭 길이 (초, float64 배열)"""
+        return (self.end_ns - self.start_ns) / _NS_PER_SECOND
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """
+        detect_gaps()와 같은 형식의 리스트로 변환합니다.
+
+        epoch 나노초는 naive UTC datetime(마이크로초 단위)으로 변환됩니다.
+        """
+        return [
+            {
+                "start": _EPOCH + timedelta(microseconds=start // 1000),
+                "end": _EPOCH + timedelta(microseconds=end // 1000),
+                "gap_seconds": seconds,
+            }
+            for start, end, seconds in zip(
+                self.start_ns.tolist(), self.end_ns.tolist(),
+                self.gap_seconds.tolist(),
+            )
+        ]
+
+
+def _find_gaps(timestamps_ns: np.ndarray, max_gap_seconds: float) -> GapSpans:
+    """인접 차이가 max_gap_seconds를 넘는 위치를 한 번의 np.diff로 찾습니다."""
+    idx = np.flatnonzero(
+        np.diff(timestamps_ns) > max_gap_seconds * _NS_PER_SECOND
+    )
+    return GapSpans(timestamps_ns[idx], timestamps_ns[idx + 1])
+
+
+class StreamingGapDetector:
+    """
+    청크 단위로 들어오는 타임스탬프의 갭을 탐지하는 상태 유지 검출기
+
+    직전 청크의 마지막 타임스탬프를 기억하므로, 두 청크에 걸친 갭도
+    한 번에 처리한 결과와 똑같이 보고됩니다.
+    """
+
+    def __init__(self, max_gap_seconds: float):
+        """
+        Args:
+            max_gap_seconds: 허용 최대 갭 (초)
+        """
+        self.max_gap_seconds = max_gap_seconds
+        self.last_ns: Optional[int] = None
+        self.count = 0
+
+    def update(self, timestamps_ns: Any) -> GapSpans:
+        """
+        청크를 처리하고 이 청크에서 새로 발견된 갭을 반환합니다.
+
+        Args:
+            timestamps_ns: 정렬된 int64 epoch 나노초 (또는 datetime64) 배열
+
+        Returns:
+            GapSpans: 이전 청크와의 경계 갭을 포함한 이 청크의 갭
+        """
+        ts = _as_epoch_ns(timestamps_ns)
+        if ts.size == 0:
+            return GapSpans()
+
+        gaps = _find_gaps(ts, self.max_gap_seconds)
+
+        first = int(ts[0])
+        if self.last_ns is not None and (
+            first - self.last_ns > self.max_gap_seconds * _NS_PER_SECOND
+        ):
+            gaps = GapSpans(
+                np.concatenate(([self.last_ns], gaps.start_ns)),
+                np.concatenate(([first], gaps.end_ns)),
+            )
+
+        self.last_ns = int(ts[-1])
+        self.count += ts.size
+        return gaps
+
+
+# 완전성 버킷 이름 → 크기 (초). 버킷 경계는 epoch(UTC) 기준으로 정렬
+COMPLETENESS_BUCKETS: Dict[str, float] = {
+    "minute": 60.0,
+    "hour": 3600.0,
+    "day": 86400.0,
+}
+
+
+def _bucket_size_ns(bucket: Union[str, float]) -> int:
+    """버킷 이름 또는 초 단위 크기를 나노초로 변환합니다."""
+    if isinstance(bucket, str):
+        if bucket not in COMPLETENESS_BUCKETS:
+            raise ValueError(
+                f"지원하지 않는 버킷입니다: {bucket}. "
+                f"지원 버킷: {list(COMPLETENESS_BUCKETS)} 또는 초 단위 숫자"
+            )
+        bucket = COMPLETENESS_BUCKETS[bucket]
+    if not bucket > 0:
+        raise ValueError("버킷 크기는 양수여야 합니다")
+    return int(round(bucket * _NS_PER_SECOND))
+
+
+@dataclass
+class BucketCompleteness:
+    """
+    버킷별 완전성 결과
+
+    기대 개수는 각 버킷이 관측 구간 [start_ns, end_ns)와 겹치는 길이를
+    수집 간격으로 나눈 값이므로, 구간 양끝의 부분 버킷도 공정하게 평가됩니다.
+
+    Attributes:
+        bucket_ns: 버킷 크기 (나노초)
+        bucket_start_ns: 버킷 시작 시각 (int64 epoch 나노초)
+        actual: 버킷별 실제 데이터 수 (int64)
+        expected: 버킷별 기대 데이터 수 (float64)
+    """
+    bucket_ns: int
+    bucket_start_ns: np.ndarray
+    actual: np.ndarray
+    expected: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.bucket_start_ns.size)
+
+    @property
+    def completeness(self) -> np.ndarray:
+        """버킷별 완전성 비율 (0.0 ~ 100.0, validate_completeness()와 같이 100 상한)"""
+        safe = np.where(self.expected > 0, self.expected, 1.0)
+        ratio = np.where(self.expected > 0, self.actual / safe * 100.0, 100.0)
+        return np.minimum(ratio, 100.0)
+
+
+def _bucket_completeness(
+    bucket_ids: np.ndarray,
+    counts: np.ndarray,
+    bucket_ns: int,
+    interval_ns: float,
+    start_ns: int,
+    end_ns: int,
+) -> BucketCompleteness:
+    """버킷 번호별 개수를 [start_ns, end_ns) 전체 버킷 배열로 펼칩니다."""
+    first = start_ns // bucket_ns
+    last = (end_ns - 1) // bucket_ns
+    starts = np.arange(first, last + 1, dtype=np.int64) * bucket_ns
+
+    actual = np.zeros(starts.size, dtype=np.int64)
+    np.add.at(actual, bucket_ids - first, counts)
+
+    covered = (
+        np.minimum(starts + bucket_ns, end_ns) - np.maximum(starts, start_ns)
+    )
+    return BucketCompleteness(
+        bucket_ns=bucket_ns,
+        bucket_start_ns=starts,
+        actual=actual,
+        expected=covered / interval_ns,
+    )
+
+
+class CompletenessTracker:
+    """
+    새 데이터가 도착할 때마다 버킷별 개수를 누적하는 증분 완전성 집계기
+
+    버킷별 개수만 보관하므로 메모리는 버킷 수에 비례하며,
+    report()는 지금까지 본 구간의 BucketCompleteness를 반환합니다.
+    """
+
+    def __init__(
+        self,
+        expected_interval: float,
+        bucket: Union[str, float] = "hour",
+    ):
+        """
+        Args:
+            expected_interval: 예상 수집 간격 (초)
+            bucket: "minute", "hour", "day" 또는 초 단위 버킷 크기
+
+        Raises:
+            ValueError: 수집 간격이나 버킷 크기가 올바르지 않을 때
+        """
+        if not expected_interval > 0:
+            raise ValueError("예상 수집 간격은 양수여야 합니다")
+        self.interval_ns = expected_interval * _NS_PER_SECOND
+        self.bucket_ns = _bucket_size_ns(bucket)
+        self.first_ns: Optional[int] = None
+        self.last_ns: Optional[int] = None
+        self._counts: Dict[int, int] = {}
+
+    def update(self, timestamps: Any) -> None:
+        """
+        새 타임스탬프 청크를 반영합니다 (청크 간 순서는 무관).
+
+        Args:
+            timestamps: int64 epoch 나노초, datetime64 배열 또는 datetime 리스트
+        """
+        ts = _as_epoch_ns(timestamps)
+        if ts.size == 0:
+            return
+
+        ids, counts = np.unique(ts // self.bucket_ns, return_counts=True)
+        for bucket_id, count in zip(ids.tolist(), counts.tolist()):
+            self._counts[bucket_id] = self._counts.get(bucket_id, 0) + count
+
+        lo, hi = int(ts.min()), int(ts.max())
+        self.first_ns = lo if self.first_ns is None else min(self.first_ns, lo)
+        self.last_ns = hi if self.last_ns is None else max(self.last_ns, hi)
+
+    def report(
+        self,
+        start_ns: Optional[int] = None,
+        end_ns: Optional[int] = None,
+    ) -> BucketCompleteness:
+        """
+        누적된 개수로 버킷별 완전성을 계산합니다.
+
+        Args:
+            start_ns: 평가 구간 시작 (기본값: 첫 타임스탬프)
+            end_ns: 평가 구간 끝, 미포함 (기본값: 마지막 타임스탬프 + 수집 간격)
+
+        Raises:
+            ValueError: 데이터가 없는데 구간을 지정하지 않았거나 구간이 비어있을 때
+        """
+        if self.first_ns is None and (start_ns is None or end_ns is None):
+            raise ValueError("완전성 계산에 필요한 데이터가 없습니다")
+
+        if start_ns is None:
+            start_ns = self.first_ns
+        if end_ns is None:
+            end_ns = self.last_ns + int(self.interval_ns)
+        if end_ns <= start_ns:
+            raise ValueError("평가 구간의 끝이 시작보다 뒤여야 합니다")
+
+        lo = start_ns // self.bucket_ns
+        hi = (end_ns - 1) // self.bucket_ns
+        items = [(k, v) for k, v in self._counts.items() if lo <= k <= hi]
+        ids = np.array([k for k, _ in items], dtype=np.int64)
+        counts = np.array([v for _, v in items], dtype=np.int64)
+
+        return _bucket_completeness(
+            ids, counts, self.bucket_ns, self.interval_ns, start_ns, end_ns
+        )
+
 
 # 센서 타입별 물리적 범위 정의
 # 각 센서가 측정할 수 있는 물리적 한계값
@@ -58,6 +766,138 @@ SENSOR_RANGES: Dict[str, Dict[str, float]] = {
 }
 
 
+# 센서 리딩 필수 필드
+READING_FIELDS = ["timestamp", "sensor_type", "value"]
+
+
+def _future_warning(ts: datetime) -> str:
+    return f"timestamp가 미래 시각입니다: {ts}"
+
+
+def _unknown_sensor_error(sensor_type: Any) -> str:
+    return (
+        f"알 수 없는 센서 타입입니다: '{sensor_type}'. "
+        f"지원 타입: {list(SENSOR_RANGES.keys())}"
+    )
+
+
+_NAT_NS = np.iinfo(np.int64).min
+_NAT_ERROR = "timestamp가 비어있습니다 (NaT)"
+
+
+def _reading_timestamps_ns(timestamps: Sequence[Any]) -> Optional[np.ndarray]:
+    """
+    리딩 timestamp 컬럼을 벡터화할 수 있으면 epoch 나노초 배열로 변환합니다.
+
+    datetime64/정수 배열과 모든 원소가 datetime인 리스트만 변환하고,
+    None이나 문자열이 섞인 컬럼은 None을 반환해 단건 검증 경로로 보냅니다.
+    (datetime64[ns]로 캐스팅하면 None은 NaT가 되고 문자열은 파싱되어
+    단건 규칙과 달리 유효한 것으로 통과하기 때문)
+    """
+    if isinstance(timestamps, np.ndarray):
+        if timestamps.dtype.kind not in "Miu":
+            return None
+    elif not all(type(ts) is datetime for ts in timestamps):
+        return None
+    try:
+        return _as_epoch_ns(timestamps)
+    except ValueError:
+        return None
+
+
+def _range_error(sensor_type: str, value: Any) -> str:
+    sensor_range = SENSOR_RANGES[sensor_type]
+    return (
+        f"{sensor_type} 값 {value}이(가) 허용 범위"
+        f"({sensor_range['min']}~{sensor_range['max']} "
+        f"{sensor_range['unit']})를 벗어났습니다"
+    )
+
+
+@dataclass
+class ReadingBatchResult:
+    """
+    validate_readings() 배치 검증 결과
+
+    유효한 리딩에는 아무것도 할당하지 않고, 에러나 경고가 있는 리딩만
+    인덱스별 메시지를 보관합니다.
+
+    Attributes:
+        valid: 리딩별 유효 여부 (bool 배열)
+        errors: 실패한 리딩 인덱스 → 에러 메시지 리스트
+        warnings: 경고가 있는 리딩 인덱스 → 경고 메시지 리스트
+    """
+    valid: np.ndarray
+    errors: Dict[int, List[str]] = field(default_factory=dict)
+    warnings: Dict[int, List[str]] = field(default_factory=dict)
+
+    @property
+    def n_invalid(self) -> int:
+        """실패한 리딩 수"""
+        return int(self.valid.size - np.count_nonzero(self.valid))
+
+    def result_at(self, index: int) -> ValidationResult:
+        """index번째 리딩의 결과를 ValidationResult로 복원합니다."""
+        return ValidationResult(
+            is_valid=bool(self.valid[index]),
+            errors=list(self.errors.get(index, [])),
+            warnings=list(self.warnings.get(index, [])),
+        )
+
+    def _record(self, index: int, result: ValidationResult) -> None:
+        """단건 검증 결과를 반영합니다."""
+        if not result.is_valid:
+            self.valid[index] = False
+        if result.errors:
+            self.errors[index] = result.errors
+        if result.warnings:
+            self.warnings[index] = result.warnings
+
+
+# validate_partitioned() 워커 프로세스가 공유하는 전체 리딩
+# (fork 환경에서는 복사 없이 상속, 그 외에는 워커마다 한 번만 전달)
+_partition_readings: Sequence[Dict[str, Any]] = ()
+
+
+def _init_partition_worker(readings: Sequence[Dict[str, Any]]) -> None:
+    """프로세스 풀 초기화 함수: 워커에 전체 리딩을 한 번만 설정합니다."""
+    global _partition_readings
+    _partition_readings = readings
+
+
+def _validate_partition(indices: Sequence[int]) -> ValidationResult:
+    """
+    프로세스 풀 작업 함수: 원본 인덱스로 지정된 파티션을 검증합니다.
+
+    작업 인자는 인덱스(range 또는 리스트)뿐이므로 파티션마다 리딩을
+    피클링하지 않습니다.
+    """
+    return _validate_indices(_partition_readings, indices)
+
+
+def _validate_indices(
+    readings: Sequence[Dict[str, Any]], indices: Sequence[int]
+) -> ValidationResult:
+    """
+    파티션 하나를 validate_readings()로 검증해 ValidationResult로 변환합니다.
+
+    메시지 앞에 원본 리딩 인덱스를 붙여 병합 후에도 어느 리딩의
+    문제인지 알 수 있게 합니다.
+    """
+    if isinstance(indices, range) and indices.step == 1:
+        partition = readings[indices.start:indices.stop]
+    else:
+        partition = [readings[i] for i in indices]
+
+    batch = SensorDataValidator().validate_readings(partition)
+    result = ValidationResult(is_valid=batch.n_invalid == 0)
+    for local in sorted(batch.errors.keys() | batch.warnings.keys()):
+        prefix = f"리딩 {indices[local]}: "
+        result.errors.extend(prefix + m for m in batch.errors.get(local, []))
+        result.warnings.extend(prefix + m for m in batch.warnings.get(local, []))
+    return result
+
+
 class SensorDataValidator:
     """
     센서 데이터 유효성 검증기
@@ -113,6 +953,27 @@ class SensorDataValidator:
 
         return result
 
+    def compile_schema(
+        self,
+        expected_columns: Dict[str, type],
+        sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    ) -> CompiledSchema:
+        """
+        배치 검증용 스키마를 컴파일합니다.
+
+        validate_schema()와 같은 규칙을 레코드 배치 전체에 적용하는
+        재사용 가능한 검증기를 반환합니다.
+
+        Args:
+            expected_columns: 예상 컬럼명과 타입 딕셔너리
+                예: {"timestamp": float, "temperature": float}
+            sample_rows: 문제별로 보관할 행 인덱스 수
+
+        Returns:
+            CompiledSchema: validate(records) / validate_columns(columns) 제공
+        """
+        return CompiledSchema(expected_columns, sample_rows)
+
     def validate_range(
         self,
         values: List[float],
@@ -171,6 +1032,61 @@ class SensorDataValidator:
 
         return result
 
+    def validate_range_columnar(
+        self,
+        values: Union[Sequence[Optional[float]], np.ndarray],
+        min_val: float,
+        max_val: float,
+        sensor_type: str,
+        max_messages: int = DEFAULT_MAX_MESSAGES,
+    ) -> RangeViolations:
+        """
+        validate_range()의 컬럼형 버전: 대량 배치를 벡터 연산으로 검증합니다.
+
+        값마다 메시지를 만드는 대신 같은 종류의 연속 위반을 구간으로 압축해
+        반환하므로, 메모리 사용량이 위반 구간 수에 비례합니다.
+        판정 규칙은 validate_range()와 같습니다 (None/NaN과 범위 이탈은 에러,
+        에러가 없을 때만 범위 양끝 10% 이내 값을 경고).
+
+        Args:
+            values: 검증할 값 (리스트 또는 배열, None은 NaN으로 취급)
+            min_val: 허용 최소값
+            max_val: 허용 최대값
+            sensor_type: 센서 타입 (메시지에 사용)
+            max_messages: 종류(에러/경고)별 최대 메시지 수
+
+        Returns:
+            RangeViolations: 구간 압축된 검증 결과.
+            to_result()로 ValidationResult를 얻을 수 있습니다.
+        """
+        if isinstance(values, np.ndarray):
+            arr = values.astype(np.float64, copy=False)
+        else:
+            arr = np.array(values, dtype=np.float64)
+
+        codes = np.zeros(arr.size, dtype=np.int8)
+        codes[arr < min_val] = SPAN_BELOW
+        codes[arr > max_val] = SPAN_ABOVE
+        codes[np.isnan(arr)] = SPAN_MISSING
+
+        if arr.size and not codes.any():
+            warning_margin = (max_val - min_val) * 0.1
+            codes[arr > max_val - warning_margin] = SPAN_NEAR_MAX
+            # validate_range()와 같이 하한 근접 판정이 우선
+            codes[arr < min_val + warning_margin] = SPAN_NEAR_MIN
+
+        starts, stops, kinds = _run_length_spans(codes)
+        return RangeViolations(
+            sensor_type=sensor_type,
+            min_val=min_val,
+            max_val=max_val,
+            values=arr,
+            starts=starts,
+            stops=stops,
+            kinds=kinds,
+            max_messages=max_messages,
+        )
+
     def detect_gaps(
         self,
         timestamps: List[datetime],
@@ -204,6 +1120,29 @@ class SensorDataValidator:
 
         return gaps
 
+    def detect_gaps_ns(
+        self,
+        timestamps_ns: Any,
+        max_gap_seconds: float,
+    ) -> GapSpans:
+        """
+        detect_gaps()의 벡터화 버전: int64 epoch 나노초 배열에서 갭을 찾습니다.
+
+        datetime 객체마다 total_seconds()를 호출하지 않고 np.diff 한 번으로
+        처리합니다. 청크로 나뉜 데이터는 StreamingGapDetector를 사용하세요.
+
+        Args:
+            timestamps_ns: 정렬된 int64 epoch 나노초 (또는 datetime64) 배열
+            max_gap_seconds: 허용 최대 갭 (초)
+
+        Returns:
+            GapSpans: 갭 시작/끝 배열 (to_dicts()로 detect_gaps() 형식 변환)
+
+        Raises:
+            ValueError: 정수/datetime64 1차원 배열이 아닐 때
+        """
+        return _find_gaps(_as_epoch_ns(timestamps_ns), max_gap_seconds)
+
     def validate_completeness(
         self,
         timestamps: List[datetime],
@@ -246,6 +1185,67 @@ class SensorDataValidator:
 
         return completeness
 
+    def validate_completeness_buckets(
+        self,
+        timestamps: Any,
+        expected_interval: float,
+        bucket: Union[str, float] = "hour",
+        start_ns: Optional[int] = None,
+        end_ns: Optional[int] = None,
+    ) -> BucketCompleteness:
+        """
+        정렬된 타임스탬프의 버킷(분/시/일/사용자 크기)별 완전성을 한 번에 계산합니다.
+
+        리스트를 잘라 validate_completeness()를 반복 호출하는 대신,
+        버킷 번호 계산과 np.bincount 한 번으로 모든 버킷의 개수를 셉니다.
+        데이터가 전혀 없는 버킷도 0%로 포함됩니다.
+        새 데이터를 이어서 반영하려면 CompletenessTracker를 사용하세요.
+
+        Args:
+            timestamps: 정렬된 int64 epoch 나노초, datetime64 배열 또는 datetime 리스트
+            expected_interval: 예상 수집 간격 (초)
+            bucket: "minute", "hour", "day" 또는 초 단위 버킷 크기
+            start_ns: 평가 구간 시작 (기본값: 첫 타임스탬프)
+            end_ns: 평가 구간 끝, 미포함 (기본값: 마지막 타임스탬프 + 수집 간격).
+                구간 밖의 타임스탬프는 무시
+
+        Returns:
+            BucketCompleteness: 버킷별 실제/기대 개수와 완전성 비율
+
+        Raises:
+            ValueError: 데이터가 없는데 구간을 지정하지 않았거나,
+                수집 간격/버킷 크기/구간이 올바르지 않을 때
+        """
+        if not expected_interval > 0:
+            raise ValueError("예상 수집 간격은 양수여야 합니다")
+
+        ts = _as_epoch_ns(timestamps)
+        bucket_ns = _bucket_size_ns(bucket)
+        interval_ns = expected_interval * _NS_PER_SECOND
+
+        if ts.size == 0 and (start_ns is None or end_ns is None):
+            raise ValueError("완전성 계산에 필요한 데이터가 없습니다")
+
+        if start_ns is None:
+            start_ns = int(ts[0])
+        if end_ns is None:
+            end_ns = int(ts[-1]) + int(interval_ns)
+        if end_ns <= start_ns:
+            raise ValueError("평가 구간의 끝이 시작보다 뒤여야 합니다")
+
+        lo = np.searchsorted(ts, start_ns, side="left")
+        hi = np.searchsorted(ts, end_ns, side="left")
+        ids = ts[lo:hi] // bucket_ns
+
+        first = start_ns // bucket_ns
+        n_buckets = (end_ns - 1) // bucket_ns - first + 1
+        counts = np.bincount(ids - first, minlength=n_buckets)
+
+        return _bucket_completeness(
+            np.arange(first, first + n_buckets, dtype=np.int64),
+            counts, bucket_ns, interval_ns, start_ns, end_ns,
+        )
+
     def validate_sensor_reading(
         self, reading: Dict[str, Any]
     ) -> ValidationResult:
@@ -269,10 +1269,16 @@ class SensorDataValidator:
         Returns:
             ValidationResult: 검증 결과
         """
+        return self._check_reading(reading, datetime.now() + timedelta(days=1))
+
+    def _check_reading(
+        self, reading: Dict[str, Any], future_limit: datetime
+    ) -> ValidationResult:
+        """validate_sensor_reading() 본체 (미래 시각 판정 기준을 인자로 받음)"""
         result = ValidationResult()
 
         # 1. 필수 필드 확인
-        required_fields = ["timestamp", "sensor_type", "value"]
+        required_fields = READING_FIELDS
         for field_name in required_fields:
             if field_name not in reading:
                 result.is_valid = False
@@ -293,19 +1299,14 @@ class SensorDataValidator:
 
         # 미래 시각 검증 (현재 + 1일 이후면 경고)
         if isinstance(ts, datetime):
-            if ts > datetime.now() + timedelta(days=1):
-                result.warnings.append(
-                    f"timestamp가 미래 시각입니다: {ts}"
-                )
+            if ts > future_limit:
+                result.warnings.append(_future_warning(ts))
 
         # 3. sensor_type 유효성 확인
         sensor_type = reading["sensor_type"]
         if sensor_type not in SENSOR_RANGES:
             result.is_valid = False
-            result.errors.append(
-                f"알 수 없는 센서 타입입니다: '{sensor_type}'. "
-                f"지원 타입: {list(SENSOR_RANGES.keys())}"
-            )
+            result.errors.append(_unknown_sensor_error(sensor_type))
             return result
 
         # 4. value 범위 검증
@@ -320,10 +1321,233 @@ class SensorDataValidator:
         sensor_range = SENSOR_RANGES[sensor_type]
         if value < sensor_range["min"] or value > sensor_range["max"]:
             result.is_valid = False
-            result.errors.append(
-                f"{sensor_type} 값 {value}이(가) 허용 범위"
-                f"({sensor_range['min']}~{sensor_range['max']} "
-                f"{sensor_range['unit']})를 벗어났습니다"
+            result.errors.append(_range_error(sensor_type, value))
+
+        return result
+
+    def validate_readings(
+        self,
+        readings: Union[Sequence[Dict[str, Any]], Mapping[str, Sequence[Any]]],
+    ) -> ReadingBatchResult:
+        """
+        센서 리딩 배치를 한 번에 검증합니다 (validate_sensor_reading()과 같은 규칙).
+
+        현재 시각은 배치마다 한 번만 읽고, 리딩을 sensor_type별로 묶어
+        범위를 벡터 연산으로 검사합니다. 유효한 리딩에는 ValidationResult를
+        만들지 않으며, 실패/경고가 있는 리딩만 메시지를 보관합니다.
+
+        Args:
+            readings: 리딩 딕셔너리 리스트, 또는 컬럼형 매핑
+                {"timestamp": datetime64/int64 epoch 나노초/datetime 리스트,
+                 "sensor_type": 문자열 시퀀스, "value": 숫자 배열}
+
+        Returns:
+            ReadingBatchResult: 유효 마스크와 실패/경고 리딩의 메시지
+        """
+        future_limit = datetime.now() + timedelta(days=1)
+        if isinstance(readings, Mapping):
+            return self._validate_reading_columns(readings, future_limit)
+
+        n = len(readings)
+        result = ReadingBatchResult(valid=np.ones(n, dtype=bool))
+        values = np.empty(n, dtype=np.float64)
+        groups: Dict[str, List[int]] = {}
+
+        for i, reading in enumerate(readings):
+            try:
+                ts = reading["timestamp"]
+                sensor_type = reading["sensor_type"]
+                value = reading["value"]
+            except KeyError:
+                ts = sensor_type = value = None
+
+            value_type = type(value)
+            if (
+                type(ts) is not datetime
+                or (value_type is not float and value_type is not int)
+                or sensor_type not in SENSOR_RANGES
+            ):
+                # 드문 예외 경우는 단건 검증 경로로 처리
+                result._record(i, self._check_reading(reading, future_limit))
+                continue
+
+            if ts > future_limit:
+                result.warnings[i] = [_future_warning(ts)]
+
+            values[i] = value
+            group = groups.get(sensor_type)
+            if group is None:
+                group = groups[sensor_type] = []
+            group.append(i)
+
+        for sensor_type, rows in groups.items():
+            idx = np.array(rows, dtype=np.int64)
+            sensor_range = SENSOR_RANGES[sensor_type]
+            selected = values[idx]
+            bad = idx[
+                (selected < sensor_range["min"]) | (selected > sensor_range["max"])
+            ]
+            for i in bad.tolist():
+                result.valid[i] = False
+                result.errors[i] = [
+                    _range_error(sensor_type, readings[i]["value"])
+                ]
+
+        return result
+
+    def validate_partitioned(
+        self,
+        readings: Sequence[Dict[str, Any]],
+        partition_by: str = "time",
+        n_partitions: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> ValidationResult:
+        """
+        리딩을 파티션으로 나누어 프로세스 풀에서 검증하고 결과를 병합합니다.
+
+        파티션 결과는 파티션 순서대로 ValidationResult.merge_all()로 합치므로
+        워커 수와 관계없이 같은 결과가 나옵니다. 각 메시지에는
+        "리딩 {원본 인덱스}: " 접두어가 붙습니다.
+
+        Args:
+            readings: 리딩 딕셔너리 리스트
+            partition_by: 분할 기준
+                "time": 입력 순서(시간순으로 가정)대로 연속 구간을 균등 분할
+                그 외: 해당 필드 값별로 분할 (예: "sensor_type", "sensor_id").
+                    필드 값이 처음 등장한 순서가 파티션 순서
+            n_partitions: "time" 분할 시 파티션 수 (None이면 워커 수의 4배)
+            max_workers: 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 처리)
+
+        Returns:
+            ValidationResult: 병합된 검증 결과
+
+        Raises:
+            ValueError: max_workers나 n_partitions가 0 이하일 때
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers <= 0:
+            raise ValueError("max_workers는 양수여야 합니다")
+
+        if partition_by == "time":
+            if n_partitions is None:
+                n_partitions = max_workers * 4
+            if n_partitions <= 0:
+                raise ValueError("n_partitions는 양수여야 합니다")
+            size = max(1, -(-len(readings) // n_partitions))
+            tasks: List[Sequence[int]] = [
+                range(start, min(start + size, len(readings)))
+                for start in range(0, len(readings), size)
+            ]
+        else:
+            groups: Dict[Any, List[int]] = {}
+            for i, reading in enumerate(readings):
+                key = reading.get(partition_by)
+                group = groups.get(key)
+                if group is None:
+                    group = groups[key] = []
+                group.append(i)
+            tasks = list(groups.values())
+
+        if not tasks:
+            return ValidationResult()
+
+        if max_workers == 1:
+            return ValidationResult.merge_all(
+                _validate_indices(readings, indices) for indices in tasks
+            )
+
+        # 리딩은 워커 초기화 때 한 번만 넘기고, 작업에는 인덱스만 전달
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(tasks)),
+            initializer=_init_partition_worker,
+            initargs=(readings,),
+        ) as executor:
+            return ValidationResult.merge_all(
+                executor.map(_validate_partition, tasks)
+            )
+
+    def _validate_reading_columns(
+        self,
+        columns: Mapping[str, Sequence[Any]],
+        future_limit: datetime,
+    ) -> ReadingBatchResult:
+        """validate_readings()의 컬럼형 경로 (모든 판정이 벡터 연산)"""
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"컬럼 길이가 서로 다릅니다: {sorted(lengths)}")
+        n = lengths.pop() if lengths else 0
+
+        missing = [name for name in READING_FIELDS if name not in columns]
+        values = np.asarray(columns.get("value", []))
+        ts_ns = _reading_timestamps_ns(columns["timestamp"]) if not missing else None
+
+        if missing or ts_ns is None or values.dtype.kind not in "fiub":
+            # 컬럼 단위로 벡터화할 수 없으면 레코드로 풀어 단건 규칙 적용
+            records = [
+                dict(zip(columns.keys(), row)) for row in zip(*columns.values())
+            ]
+            result = ReadingBatchResult(valid=np.ones(n, dtype=bool))
+            for i, record in enumerate(records):
+                result._record(i, self._check_reading(record, future_limit))
+            return result
+
+        result = ReadingBatchResult(valid=np.ones(n, dtype=bool))
+        values = values.astype(np.float64, copy=False)
+
+        limit_ns = int(
+            (future_limit - _EPOCH) // timedelta(microseconds=1)
+        ) * 1000
+        for i in np.flatnonzero(ts_ns > limit_ns).tolist():
+            ts = _EPOCH + timedelta(microseconds=int(ts_ns[i]) // 1000)
+            result.warnings[i] = [_future_warning(ts)]
+        # NaT는 단건 경로의 "datetime이 아님"에 해당하는 에러
+        for i in np.flatnonzero(ts_ns == _NAT_NS).tolist():
+            result.valid[i] = False
+            result.errors[i] = [_NAT_ERROR]
+
+        # 알려진 sensor_type마다 비교 한 번으로 범위 배열을 채움
+        types = np.asarray(columns["sensor_type"])
+        if types.dtype.kind != "U":
+            types = types.astype(str)
+        lower = np.full(n, np.nan)
+        upper = np.full(n, np.nan)
+        for sensor_type, sensor_range in SENSOR_RANGES.items():
+            selected = types == sensor_type
+            lower[selected] = sensor_range["min"]
+            upper[selected] = sensor_range["max"]
+
+        unknown = np.isnan(lower)
+        out_of_range = (values < lower) | (values > upper)
+
+        for i in np.flatnonzero(unknown).tolist():
+            result.valid[i] = False
+            result.errors.setdefault(i, []).append(_unknown_sensor_error(types[i]))
+        for i in np.flatnonzero(out_of_range).tolist():
+            result.valid[i] = False
+            result.errors.setdefault(i, []).append(
+                _range_error(str(types[i]), values[i].item())
             )
 
         return result
+
+
+def _run_length_spans(
+    codes: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    코드 배열에서 0이 아닌 같은 값의 연속 구간을 찾습니다.
+
+    Returns:
+        (starts, stops, kinds) 배열 튜플. 구간은 [start, stop)
+    """
+    if codes.size == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy(), np.empty(0, dtype=np.int8)
+
+    boundaries = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    stops = np.concatenate((boundaries, [codes.size]))
+    kinds = codes[starts]
+    keep = kinds != 0
+    return starts[keep], stops[keep], kinds[keep]
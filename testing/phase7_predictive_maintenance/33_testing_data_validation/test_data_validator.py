@@ -9,12 +9,26 @@ SensorDataValidator 클래스의 모든 검증 기능을 테스트합니다:
 - 단일 리딩 종합 검증
 """
 
+import numpy as np
 import pytest
 from datetime import datetime, timedelta
 from src_data_validator import (
     SensorDataValidator,
     ValidationResult,
+    RangeViolations,
+    ReadingBatchResult,
+    BucketCompleteness,
+    CompiledSchema,
+    CompletenessTracker,
+    GapSpans,
+    SchemaReport,
+    StreamingGapDetector,
     SENSOR_RANGES,
+    SPAN_ABOVE,
+    SPAN_BELOW,
+    SPAN_MISSING,
+    SPAN_NEAR_MAX,
+    WARNING_SPAN_KINDS,
 )
 
 
@@ -87,6 +101,27 @@ class TestValidationResult:
 
         assert len(result2.errors) == 0
 
+    def test_병합(self):
+        """is_valid는 논리곱, 메시지는 순서대로 이어 붙임 (원본 불변)"""
+        a = ValidationResult(errors=[], warnings=["w1"])
+        b = ValidationResult(is_valid=False, errors=["e1"], warnings=["w2"])
+
+        merged = a.merge(b)
+
+        assert merged == ValidationResult(False, ["e1"], ["w1", "w2"])
+        assert a.warnings == ["w1"] and b.errors == ["e1"]
+
+    def test_병합_결합법칙과_항등원(self):
+        """(a+b)+c == a+(b+c), 빈 결과는 항등원"""
+        a = ValidationResult(False, ["a"], [])
+        b = ValidationResult(True, [], ["b"])
+        c = ValidationResult(False, ["c"], ["c"])
+
+        assert a.merge(b).merge(c) == a.merge(b.merge(c))
+        assert ValidationResult().merge(a) == a == a.merge(ValidationResult())
+        assert ValidationResult.merge_all([a, b, c]) == a.merge(b).merge(c)
+        assert ValidationResult.merge_all([]) == ValidationResult()
+
 
 # ============================================================
 # 스키마 검증 테스트
@@ -185,6 +220,113 @@ class TestValidateSchema:
         assert result.is_valid is True
 
 
+class TestCompiledSchema:
+    """컴파일된 스키마의 배치 검증 테스트"""
+
+    SCHEMA = {"timestamp": float, "sensor_id": str, "value": float}
+
+    @pytest.fixture
+    def schema(self, validator):
+        """문제 행을 최대 3개까지 보관하는 컴파일된 스키마"""
+        return validator.compile_schema(self.SCHEMA, sample_rows=3)
+
+    @pytest.fixture
+    def records(self):
+        """유효한 레코드 100개"""
+        return [
+            {"timestamp": float(i), "sensor_id": "S-01", "value": 1.5}
+            for i in range(100)
+        ]
+
+    def test_유효한_배치(self, schema, records):
+        result = schema.validate(records)
+
+        assert isinstance(schema, CompiledSchema)
+        assert result.is_valid is True
+        assert result.errors == [] and result.warnings == []
+
+    def test_컬럼별_집계(self, schema, records):
+        """문제 종류/컬럼마다 개수와 처음 N개 행 인덱스만 보관"""
+        for row in (3, 10, 20, 30, 40):
+            del records[row]["value"]
+        records[7]["sensor_id"] = 17
+        records[8]["sensor_id"] = None
+
+        report = schema.check(records)
+
+        assert isinstance(report, SchemaReport)
+        assert report.n_records == 100
+        assert report.missing["value"].count == 5
+        assert report.missing["value"].rows == [3, 10, 20]
+        assert report.type_errors["sensor_id"].rows == [7, 8]
+        assert report.type_errors["sensor_id"].type_names == ["int", "NoneType"]
+
+        result = report.to_result()
+        assert result.is_valid is False
+        assert len(result.errors) == 2
+        assert "5/100" in result.errors[0]
+
+    def test_int_float_경고_및_추가_컬럼(self, schema, records):
+        """float 컬럼의 int와 예상하지 않은 컬럼은 경고"""
+        records[0]["value"] = 2
+        records[5]["extra"] = "x"
+
+        result = schema.validate(records)
+
+        assert result.is_valid is True
+        assert any("int" in w and "행: [0]" in w for w in result.warnings)
+        assert any("'extra'" in w for w in result.warnings)
+
+    def test_단건_검증과_판정_일치(self, validator, schema):
+        """레코드마다 validate_schema()를 호출한 결과와 is_valid가 같음"""
+        batch = [
+            {"timestamp": 1.0, "sensor_id": "S-01", "value": 1.0},
+            {"timestamp": 1.0, "sensor_id": "S-01", "value": 1},
+            {"timestamp": 1.0, "sensor_id": "S-01"},
+            {"timestamp": "1.0", "sensor_id": "S-01", "value": 1.0, "x": 1},
+        ]
+        report = schema.check(batch)
+        bad_rows = {
+            row for issues in (report.missing, report.type_errors)
+            for issue in issues.values() for row in issue.rows
+        }
+
+        for row, record in enumerate(batch):
+            single = validator.validate_schema(record, self.SCHEMA)
+            assert single.is_valid == (row not in bad_rows)
+
+    def test_컬럼형_배치(self, schema):
+        """컬럼형 입력도 같은 규칙으로 집계"""
+        columns = {
+            "timestamp": np.arange(4, dtype=np.float64),
+            "sensor_id": ["S-01", "S-01", 3, "S-01"],
+            "value": np.array([1, 2, 3, 4]),
+        }
+
+        report = schema.check_columns(columns)
+
+        assert report.n_records == 4
+        assert report.type_errors["sensor_id"].rows == [2]
+        assert report.int_as_float["value"].count == 4
+        assert "timestamp" not in report.type_errors
+
+    def test_컬럼형_누락_컬럼(self, schema):
+        """누락된 컬럼은 모든 행에서 누락으로 집계"""
+        report = schema.check_columns({
+            "timestamp": [1.0, 2.0], "sensor_id": ["a", "b"],
+        })
+        assert report.missing["value"].count == 2
+        assert report.missing["value"].rows == [0, 1]
+
+    def test_컬럼형_길이_불일치(self, schema):
+        with pytest.raises(ValueError, match="컬럼 길이"):
+            schema.check_columns({"timestamp": [1.0], "sensor_id": ["a", "b"]})
+
+    def test_음수_sample_rows(self, validator):
+        with pytest.raises(ValueError, match="sample_rows"):
+            validator.compile_schema(self.SCHEMA, sample_rows=-1)
+
+
 # ============================================================
 # 물리적 범위 검증 테스트
 # ============================================================
@@ -263,6 +405,96 @@ class TestValidateRange:
         assert len(result.errors) == 2  # -100.0과 500.0
 
 
+class TestValidateRangeColumnar:
+    """컬럼형(구간 압축) 범위 검증 테스트"""
+
+    def test_구간_압축(self, validator):
+        """같은 종류의 연속 위반은 하나의 구간"""
+        values = [25.0, 300.0, 310.0, 26.0, None, -100.0]
+        result = validator.validate_range_columnar(
+            values, -40.0, 200.0, "temperature")
+
+        assert isinstance(result, RangeViolations)
+        assert result.is_valid is False
+        assert result.starts.tolist() == [1, 4, 5]
+        assert result.stops.tolist() == [3, 5, 6]
+        assert result.kinds.tolist() == [SPAN_ABOVE, SPAN_MISSING, SPAN_BELOW]
+        assert result.violation_count == 4
+
+    def test_마스크와_인덱스(self, validator):
+        """구간에서 불리언 마스크와 인덱스 배열 복원"""
+        values = np.array([25.0, 300.0, 310.0, 26.0, np.nan])
+        result = validator.validate_range_columnar(
+            values, -40.0, 200.0, "temperature")
+
+        assert result.mask().tolist() == [False, True, True, False, True]
+        assert result.indices().tolist() == [1, 2, 4]
+        assert result.indices([SPAN_MISSING]).tolist() == [4]
+
+    @pytest.mark.parametrize("values", [
+        [25.0, 30.0, 35.0],
+        [25.0, 300.0, 26.0],
+        [-100.0, 25.0, 500.0],
+        [25.0, None, 26.0],
+        [-40.0, 200.0],
+        [190.0, -35.0, 100.0],
+        [],
+    ])
+    def test_기존_판정과_일치(self, validator, values):
+        """is_valid와 위반/경고 인덱스가 validate_range()와 같음"""
+        expected = validator.validate_range(values, -40.0, 200.0, "temperature")
+        result = validator.validate_range_columnar(
+            values, -40.0, 200.0, "temperature").to_result()
+
+        assert result.is_valid == expected.is_valid
+        assert len(result.errors) == len(expected.errors)
+        assert len(result.warnings) == len(expected.warnings)
+
+    def test_단일_값_메시지는_기존_형식(self, validator):
+        """길이 1 구간은 validate_range()와 같은 메시지"""
+        values = [25.0, 300.0, 26.0]
+        expected = validator.validate_range(values, -40.0, 200.0, "temperature")
+        result = validator.validate_range_columnar(
+            values, -40.0, 200.0, "temperature")
+
+        assert result.messages() == expected.errors
+
+    def test_경고_구간(self, validator):
+        """에러가 없으면 상한/하한 근접 구간을 경고로 보고"""
+        result = validator.validate_range_columnar(
+            [190.0, 195.0, 100.0], -40.0, 200.0, "temperature")
+
+        assert result.is_valid is True
+        assert result.kinds.tolist() == [SPAN_NEAR_MAX]
+        assert result.indices(WARNING_SPAN_KINDS).tolist() == [0, 1]
+        assert "상한" in result.to_result().warnings[0]
+
+    def test_메시지_수_제한(self, validator):
+        """메시지는 max_messages개와 생략 안내만 생성"""
+        values = np.tile([25.0, 300.0], 1000)
+        result = validator.validate_range_columnar(
+            values, -40.0, 200.0, "temperature", max_messages=5)
+
+        errors = result.to_result().errors
+        assert len(errors) == 6
+        assert "995개 구간 생략" in errors[-1]
+
+    def test_대량_배치_구간_수에_비례(self, validator):
+        """100만 점 중 연속 위반 구간은 원소 수가 아니라 구간 수로 보관"""
+        values = np.full(1_000_000, 25.0)
+        values[200_000:700_000] = 500.0
+        values[900_000] = -100.0
+
+        result = validator.validate_range_columnar(
+            values, -40.0, 200.0, "temperature")
+
+        assert result.starts.size == 2
+        assert result.violation_count == 500_001
+        assert result.kinds.tolist() == [SPAN_ABOVE, SPAN_BELOW]
+        assert "(500000개)" in result.messages()[0]
+        assert np.shares_memory(result.values, values)
+
+
 # ============================================================
 # 시계열 갭 탐지 테스트
 # ============================================================
@@ -328,6 +560,72 @@ class TestDetectGaps:
         assert gaps[0]["gap_seconds"] == pytest.approx(60.0)
 
 
+class TestDetectGapsNs:
+    """int64 epoch 나노초 벡터화 갭 탐지와 스트리밍 검출기 테스트"""
+
+    NS = 1_000_000_000
+
+    @pytest.fixture
+    def gapped_ns(self, gapped_timestamps):
+        """gapped_timestamps를 int64 epoch 나노초로 변환"""
+        return np.array(gapped_timestamps, dtype="datetime64[ns]").view(np.int64)
+
+    def test_기존_결과와_일치(self, validator, gapped_timestamps, gapped_ns):
+        """to_dicts()가 detect_gaps()와 같은 결과"""
+        gaps = validator.detect_gaps_ns(gapped_ns, max_gap_seconds=5)
+
+        assert isinstance(gaps, GapSpans)
+        assert gaps.to_dicts() == validator.detect_gaps(
+            gapped_timestamps, max_gap_seconds=5)
+
+    def test_datetime64_입력(self, validator, gapped_timestamps):
+        """datetime64 배열도 그대로 받음"""
+        gaps = validator.detect_gaps_ns(
+            np.array(gapped_timestamps, dtype="datetime64[s]"), 5)
+        assert gaps.gap_seconds.tolist() == [21.0, 21.0]
+
+    def test_짧은_입력(self, validator):
+        """원소가 2개 미만이면 갭 없음"""
+        assert len(validator.detect_gaps_ns(np.empty(0, dtype=np.int64), 5)) == 0
+        assert len(validator.detect_gaps_ns(np.array([10], dtype=np.int64), 5)) == 0
+
+    def test_float_입력_거부(self, validator):
+        with pytest.raises(ValueError, match="epoch 나노초"):
+            validator.detect_gaps_ns(np.array([1.0, 2.0]), 5)
+
+    def test_1개월_1Hz_데이터(self, validator):
+        """259만 개 타임스탬프를 한 번의 벡터 연산으로 처리"""
+        ts = np.arange(30 * 86_400, dtype=np.int64) * self.NS
+        ts[1_000_000:] += 60 * self.NS
+
+        gaps = validator.detect_gaps_ns(ts, max_gap_seconds=2)
+
+        assert gaps.start_ns.tolist() == [999_999 * self.NS]
+        assert gaps.gap_seconds.tolist() == [61.0]
+
+    @pytest.mark.parametrize("split", [1, 10, 11, 20])
+    def test_스트리밍_청크_경계(self, validator, gapped_ns, split):
+        """청크 경계에 걸친 갭도 한 번에 처리한 결과와 같음"""
+        detector = StreamingGapDetector(max_gap_seconds=5)
+
+        parts = [detector.update(gapped_ns[:split]), detector.update(gapped_ns[split:])]
+        expected = validator.detect_gaps_ns(gapped_ns, 5)
+
+        assert np.concatenate([p.start_ns for p in parts]).tolist() == \
+            expected.start_ns.tolist()
+        assert np.concatenate([p.end_ns for p in parts]).tolist() == \
+            expected.end_ns.tolist()
+        assert detector.count == gapped_ns.size
+        assert detector.last_ns == int(gapped_ns[-1])
+
+    def test_스트리밍_빈_청크(self):
+        """빈 청크는 상태를 바꾸지 않음"""
+        detector = StreamingGapDetector(max_gap_seconds=5)
+        detector.update(np.array([0], dtype=np.int64))
+        assert len(detector.update(np.empty(0, dtype=np.int64))) == 0
+        assert len(detector.update(np.array([10 * self.NS], dtype=np.int64))) == 1
+
+
 # ============================================================
 # 데이터 완전성 검증 테스트
 # ============================================================
@@ -379,6 +677,108 @@ class TestValidateCompleteness:
             validator.validate_completeness(ts, expected_interval=1)
 
 
+class TestBucketCompleteness:
+    """버킷별 완전성과 증분 집계 테스트"""
+
+    NS = 1_000_000_000
+    # 2024-01-01 00:00:00 UTC (시간 버킷 경계에 정렬됨)
+    T0 = 1_704_067_200 * NS
+
+    @pytest.fixture
+    def three_hours(self):
+        """1 Hz 3시간 데이터, 두 번째 시간의 앞 30분 누락"""
+        ts = self.T0 + np.arange(3 * 3600, dtype=np.int64) * self.NS
+        return np.delete(ts, np.s_[3600:5400])
+
+    def test_시간별_완전성(self, validator, three_hours):
+        result = validator.validate_completeness_buckets(
+            three_hours, expected_interval=1.0, bucket="hour")
+
+        assert isinstance(result, BucketCompleteness)
+        assert result.actual.tolist() == [3600, 1800, 3600]
+        assert result.completeness.tolist() == [100.0, 50.0, 100.0]
+        assert result.bucket_start_ns[1] == self.T0 + 3600 * self.NS
+
+    def test_빈_버킷_포함(self, validator):
+        """데이터가 없는 버킷도 0%로 포함"""
+        ts = self.T0 + np.array([0, 1, 2, 180, 181], dtype=np.int64) * self.NS
+        result = validator.validate_completeness_buckets(ts, 1.0, "minute")
+
+        assert len(result) == 4
+        assert result.actual.tolist() == [3, 0, 0, 2]
+        assert result.completeness[1] == 0.0
+
+    def test_부분_버킷_기대_개수(self, validator):
+        """구간 양끝의 부분 버킷은 겹치는 길이만큼만 기대"""
+        ts = self.T0 + np.arange(1800, 5400, dtype=np.int64) * self.NS
+        result = validator.validate_completeness_buckets(ts, 1.0, "hour")
+
+        assert result.expected.tolist() == [1800.0, 1800.0]
+        assert result.completeness.tolist() == [100.0, 100.0]
+
+    def test_단일_버킷은_기존_결과와_일치(self, validator, continuous_timestamps):
+        """datetime 리스트도 받으며 버킷 하나면 validate_completeness()와 같음"""
+        result = validator.validate_completeness_buckets(
+            continuous_timestamps[::2], 1.0, bucket="day")
+        expected = validator.validate_completeness(continuous_timestamps[::2], 1.0)
+
+        assert result.completeness[0] == pytest.approx(expected, rel=0.02)
+
+    def test_사용자_버킷과_평가_구간(self, validator, three_hours):
+        """초 단위 버킷과 명시적 구간 (구간 밖 데이터 무시)"""
+        result = validator.validate_completeness_buckets(
+            three_hours, 1.0, bucket=900,
+            start_ns=self.T0, end_ns=self.T0 + 3600 * self.NS)
+
+        assert len(result) == 4
+        assert result.actual.sum() == 3600
+
+    @pytest.mark.parametrize("kwargs, match", [
+        ({"bucket": "week"}, "지원하지 않는 버킷"),
+        ({"bucket": 0}, "버킷 크기"),
+        ({"expected_interval": 0.0}, "수집 간격"),
+    ])
+    def test_잘못된_인자(self, validator, three_hours, kwargs, match):
+        args = {"expected_interval": 1.0}
+        args.update(kwargs)
+        with pytest.raises(ValueError, match=match):
+            validator.validate_completeness_buckets(three_hours, **args)
+
+    def test_빈_데이터_에러(self, validator):
+        with pytest.raises(ValueError, match="데이터가 없습니다"):
+            validator.validate_completeness_buckets(
+                np.empty(0, dtype=np.int64), 1.0)
+
+    def test_증분_집계는_일괄_계산과_일치(self, validator, three_hours):
+        """청크를 순서 없이 넣어도 한 번에 계산한 결과와 같음"""
+        tracker = CompletenessTracker(expected_interval=1.0, bucket="hour")
+        for chunk in reversed(np.array_split(three_hours, 7)):
+            tracker.update(chunk)
+
+        result = tracker.report()
+        expected = validator.validate_completeness_buckets(three_hours, 1.0)
+
+        assert result.actual.tolist() == expected.actual.tolist()
+        assert result.expected.tolist() == expected.expected.tolist()
+
+    def test_증분_집계_진행_중_보고(self):
+        """새 데이터가 들어올수록 현재 버킷의 개수가 늘어남"""
+        tracker = CompletenessTracker(expected_interval=1.0, bucket="hour")
+        hour_end = self.T0 + 3600 * self.NS
+
+        tracker.update(self.T0 + np.arange(600, dtype=np.int64) * self.NS)
+        first = tracker.report(start_ns=self.T0, end_ns=hour_end)
+        tracker.update(self.T0 + np.arange(600, 1800, dtype=np.int64) * self.NS)
+        second = tracker.report(start_ns=self.T0, end_ns=hour_end)
+
+        assert first.completeness[0] == pytest.approx(600 / 36)
+        assert second.completeness[0] == pytest.approx(50.0)
+
+    def test_증분_집계_데이터_없음(self):
+        with pytest.raises(ValueError, match="데이터가 없습니다"):
+            CompletenessTracker(expected_interval=1.0).report()
+
+
 # ============================================================
 # 단일 센서 리딩 검증 테스트
 # ============================================================
@@ -530,6 +930,203 @@ class TestValidateSensorReading:
         assert result.is_valid is False
 
 
+class TestValidateReadings:
+    """validate_readings() 배치 검증 테스트"""
+
+    @pytest.fixture
+    def mixed_readings(self):
+        """정상/범위 초과/필드 누락/타입 오류/미래 시각이 섞인 리딩"""
+        ts = datetime(2024, 6, 15, 10, 30, 0)
+        return [
+            {"timestamp": ts, "sensor_type": "temperature", "value": 25.0},
+            {"timestamp": ts, "sensor_type": "temperature", "value": 300.0},
+            {"timestamp": ts, "sensor_type": "vibration", "value": -1},
+            {"timestamp": ts, "sensor_type": "humidity", "value": 50.0},
+            {"timestamp": ts, "value": 1.0},
+            {"timestamp": "2024-06-15", "sensor_type": "rpm", "value": 1500.0},
+            {"timestamp": ts, "sensor_type": "pressure", "value": "high"},
+            {"timestamp": datetime.now() + timedelta(days=2),
+             "sensor_type": "current", "value": 10.0},
+            {"timestamp": ts, "sensor_type": "rpm", "value": True},
+        ]
+
+    def test_단건_검증과_일치(self, validator, mixed_readings):
+        """리딩마다 validate_sensor_reading()과 같은 판정과 메시지"""
+        batch = validator.validate_readings(mixed_readings)
+
+        assert isinstance(batch, ReadingBatchResult)
+        for i, reading in enumerate(mixed_readings):
+            assert batch.result_at(i) == validator.validate_sensor_reading(reading)
+
+    def test_실패한_리딩만_메시지_보관(self, validator, mixed_readings):
+        batch = validator.validate_readings(mixed_readings)
+
+        assert batch.valid.tolist() == [
+            True, False, False, False, False, False, False, True, True]
+        assert batch.n_invalid == 6
+        assert 0 not in batch.errors and 0 not in batch.warnings
+        assert list(batch.warnings) == [7]
+
+    def test_컬럼형_입력(self, validator):
+        """컬럼형 매핑은 벡터 연산으로 같은 결과를 냄"""
+        records = [
+            {"timestamp": datetime(2024, 6, 15, 10, 0, i),
+             "sensor_type": sensor_type, "value": value}
+            for i, (sensor_type, value) in enumerate([
+                ("temperature", 25.0), ("temperature", 250.0),
+                ("rpm", 60000.0), ("humidity", 1.0), ("current", 499.0),
+            ])
+        ]
+        columns = {
+            "timestamp": np.array(
+                [r["timestamp"] for r in records], dtype="datetime64[ns]"),
+            "sensor_type": np.array([r["sensor_type"] for r in records]),
+            "value": np.array([r["value"] for r in records]),
+        }
+
+        expected = validator.validate_readings(records)
+        batch = validator.validate_readings(columns)
+
+        assert batch.valid.tolist() == expected.valid.tolist()
+        assert batch.errors == expected.errors
+
+    def test_컬럼형_미래_시각_경고(self, validator):
+        future = datetime.now() + timedelta(days=3)
+        batch = validator.validate_readings({
+            "timestamp": [future.replace(microsecond=0)],
+            "sensor_type": ["temperature"],
+            "value": [20.0],
+        })
+
+        assert batch.valid.tolist() == [True]
+        assert batch.warnings[0] == [
+            f"timestamp가 미래 시각입니다: {future.replace(microsecond=0)}"]
+
+    def test_컬럼형_필드_누락은_단건_규칙(self, validator):
+        """벡터화할 수 없는 컬럼형 입력은 레코드 단위로 검증"""
+        batch = validator.validate_readings({
+            "timestamp": [datetime(2024, 1, 1)] * 2,
+            "value": [1.0, 2.0],
+        })
+
+        assert batch.valid.tolist() == [False, False]
+        assert "sensor_type" in batch.errors[1][0]
+
+    def test_컬럼형_None_문자열_timestamp(self, validator):
+        """None/문자열이 섞인 timestamp 컬럼은 단건 검증과 같은 에러"""
+        columns = {
+            "timestamp": [datetime(2024, 1, 1), None, "2020-01-01"],
+            "sensor_type": ["rpm"] * 3,
+            "value": [1500.0] * 3,
+        }
+        batch = validator.validate_readings(columns)
+
+        assert batch.valid.tolist() == [True, False, False]
+        for i in (1, 2):
+            expected = validator.validate_sensor_reading(
+                {name: column[i] for name, column in columns.items()})
+            assert batch.errors[i] == expected.errors
+            assert "datetime 타입이 아닙니다" in batch.errors[i][0]
+
+    def test_컬럼형_NaT는_에러(self, validator):
+        """datetime64 컬럼의 NaT는 유효하지 않음 (범위 에러도 함께 보고)"""
+        batch = validator.validate_readings({
+            "timestamp": np.array(["2024-01-01", "NaT", "NaT"], dtype="datetime64[ns]"),
+            "sensor_type": ["rpm", "rpm", "rpm"],
+            "value": np.array([1500.0, 1500.0, -1.0]),
+        })
+
+        assert batch.valid.tolist() == [True, False, False]
+        assert batch.errors[1] == ["timestamp가 비어있습니다 (NaT)"]
+        assert batch.errors[2][0] == "timestamp가 비어있습니다 (NaT)"
+        assert "허용 범위" in batch.errors[2][1]
+
+    def test_컬럼형_길이_불일치(self, validator):
+        with pytest.raises(ValueError, match="컬럼 길이"):
+            validator.validate_readings({
+                "timestamp": [datetime(2024, 1, 1)],
+                "sensor_type": ["rpm", "rpm"],
+                "value": [1.0],
+            })
+
+    def test_빈_배치(self, validator):
+        batch = validator.validate_readings([])
+        assert batch.valid.size == 0 and batch.n_invalid == 0
+
+
+class TestValidatePartitioned:
+    """파티션 병렬 검증 테스트"""
+
+    @pytest.fixture
+    def month_readings(self):
+        """센서 3종의 1분 간격 리딩 (일부 범위 초과)"""
+        base = datetime(2024, 6, 1)
+        types = ["temperature", "vibration", "rpm"]
+        values = {"temperature": 25.0, "vibration": 2.0, "rpm": 1500.0}
+        readings = [
+            {"timestamp": base + timedelta(minutes=i),
+             "sensor_type": types[i % 3],
+             "value": values[types[i % 3]]}
+            for i in range(300)
+        ]
+        for i in (5, 150, 299):
+            readings[i]["value"] = -999.0
+        return readings
+
+    def test_시간_분할_결과(self, validator, month_readings):
+        """메시지에 원본 인덱스가 붙고 인덱스 순서로 병합"""
+        result = validator.validate_partitioned(
+            month_readings, n_partitions=7, max_workers=1)
+
+        assert result.is_valid is False
+        assert [e.split(":")[0] for e in result.errors] == [
+            "리딩 5", "리딩 150", "리딩 299"]
+
+    def test_센서별_분할은_첫_등장_순서(self, validator, month_readings):
+        """필드 값별 파티션은 값이 처음 등장한 순서로 병합"""
+        result = validator.validate_partitioned(
+            month_readings, partition_by="sensor_type", max_workers=1)
+
+        # 5, 299는 rpm, 150은 temperature → temperature, vibration, rpm 순
+        assert [e.split(":")[0] for e in result.errors] == [
+            "리딩 150", "리딩 5", "리딩 299"]
+
+    def test_프로세스_풀_결과_동일(self, validator, month_readings):
+        """워커 수와 관계없이 같은 결과"""
+        sequential = validator.validate_partitioned(
+            month_readings, n_partitions=5, max_workers=1)
+        parallel = validator.validate_partitioned(
+            month_readings, n_partitions=5, max_workers=2)
+
+        assert parallel == sequential
+
+    def test_단일_검증과_일치(self, validator, month_readings):
+        """파티션 결과를 병합하면 리딩별 검증을 모두 합친 것과 같음"""
+        expected = ValidationResult.merge_all(
+            ValidationResult(
+                r.is_valid,
+                [f"리딩 {i}: {m}" for m in r.errors],
+                [f"리딩 {i}: {m}" for m in r.warnings],
+            )
+            for i, r in enumerate(
+                validator.validate_sensor_reading(x) for x in month_readings)
+        )
+
+        assert validator.validate_partitioned(
+            month_readings, n_partitions=4, max_workers=1) == expected
+
+    def test_빈_입력(self, validator):
+        assert validator.validate_partitioned([], max_workers=1) == ValidationResult()
+
+    @pytest.mark.parametrize("kwargs, match", [
+        ({"max_workers": 0}, "max_workers"),
+        ({"max_workers": 1, "n_partitions": 0}, "n_partitions"),
+    ])
+    def test_잘못된_인자(self, validator, month_readings, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            validator.validate_partitioned(month_readings, **kwargs)
+
+
 # ============================================================
 # SENSOR_RANGES 상수 테스트
 # ============================================================
@@ -0,0 +1,324 @@
+"""
+베어링 결함 주파수 인덱스 모듈
+
+베어링 형상과 축 회전수로부터 결함 특성 주파수를 계산하고,
+이를 스펙트럼 빈 인덱스로 변환해 캐시합니다.
+
+    BPFO (Ball Pass Frequency, Outer race): 외륜 결함
+    BPFI (Ball Pass Frequency, Inner race): 내륜 결함
+    BSF  (Ball Spin Frequency): 전동체 결함
+    FTF  (Fundamental Train Frequency): 케이지 결함
+
+빈 인덱스는 (형상, 회전수 구간, FFT 크기, 샘플링 주파수)마다 한 번만 계산되므로,
+설비군 전체의 결함 대역 에너지는 미리 계산된 인덱스로 PSD 값을 모으는
+gather 연산 한 번으로 끝나며 프레임마다 주파수를 다시 계산하지 않습니다.
+"""
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+
+# 결함 종류 (출력 순서)
+DEFECT_TYPES = ("bpfo", "bpfi", "bsf", "ftf")
+
+# BearingFailurePredictor의 추가 특징으로 사용할 수 있는 대역 에너지 이름
+DEFECT_FEATURE_NAMES = tuple(f"{defect}_energy" for defect in DEFECT_TYPES)
+
+# 대역에 포함할 고조파 수 (1x, 2x, 3x)
+DEFECT_HARMONICS = 3
+
+# 회전수 구간 폭 (rpm). 같은 구간의 회전수는 같은 빈 인덱스를 공유
+RPM_BUCKET_WIDTH = 10.0
+
+# 대역 반폭 = 중심 주파수 x 이 비율 (미끄럼 등으로 인한 주파수 편차 허용)
+DEFECT_BAND_RELATIVE_WIDTH = 0.02
+
+
+@dataclass(frozen=True)
+class BearingGeometry:
+    """
+    베어링 형상 (불변이므로 캐시 키로 사용 가능)
+
+    Attributes:
+        n_balls: 전동체 수
+        ball_diameter: 전동체 지름 (pitch_diameter와 같은 단위)
+        pitch_diameter: 피치원 지름
+        contact_angle: 접촉각 (도)
+    """
+    n_balls: int
+    ball_diameter: float
+    pitch_diameter: float
+    contact_angle: float = 0.0
+
+    def __post_init__(self):
+        if self.n_balls <= 0:
+            raise ValueError("전동체 수는 양수여야 합니다")
+        if not 0 < self.ball_diameter < self.pitch_diameter:
+            raise ValueError(
+                "전동체 지름은 0보다 크고 피치원 지름보다 작아야 합니다"
+            )
+
+    def defect_orders(self) -> Dict[str, float]:
+        """
+        축 회전 주파수 대비 결함 주파수 배수를 계산합니다.
+
+        Returns:
+            {"bpfo": float, "bpfi": float, "bsf": float, "ftf": float}
+        """
+        ratio = (
+            self.ball_diameter / self.pitch_diameter
+            * math.cos(math.radians(self.contact_angle))
+        )
+        return {
+            "bpfo": self.n_balls / 2.0 * (1.0 - ratio),
+            "bpfi": self.n_balls / 2.0 * (1.0 + ratio),
+            "bsf": self.pitch_diameter / (2.0 * self.ball_diameter)
+            * (1.0 - ratio * ratio),
+            "ftf": 0.5 * (1.0 - ratio),
+        }
+
+
+def rpm_bucket(rpm: float) -> int:
+    """
+    회전수를 RPM_BUCKET_WIDTH 폭의 구간 번호로 변환합니다.
+
+    Raises:
+        ValueError: 회전수가 양수가 아니거나, 구간 0(회전 주파수 0 Hz)으로
+            반올림될 만큼 낮을 때 (RPM_BUCKET_WIDTH / 2 이하)
+    """
+    if rpm <= 0:
+        raise ValueError("회전수는 양수여야 합니다")
+    bucket = int(round(rpm / RPM_BUCKET_WIDTH))
+    if bucket == 0:
+        raise ValueError(
+            f"회전수가 너무 낮아 결함 대역을 계산할 수 없습니다: {rpm} rpm "
+            f"({RPM_BUCKET_WIDTH / 2} rpm 초과 필요)"
+        )
+    return bucket
+
+
+@lru_cache(maxsize=4096)
+def defect_band_bins(
+    geometry: BearingGeometry,
+    bucket: int,
+    n_fft: int,
+    sample_rate: float,
+) -> Tuple[np.ndarray, ...]:
+    """
+    결함 종류별 스펙트럼 빈 인덱스를 계산합니다 (결과는 캐시됨).
+
+    각 결함의 1 ~ DEFECT_HARMONICS차 고조파 중심 주파수 주변
+    ± (DEFECT_BAND_RELATIVE_WIDTH x 중심 + 회전수 구간 반폭 편차) 범위의
+    rfft 빈을 모읍니다. 대역이 한 빈보다 좁으면 가장 가까운 빈을 사용하고,
+    나이퀴스트를 넘는 고조파는 제외합니다. DC 빈(0)은 포함하지 않으며,
+    중심 주파수가 빈 간격보다 낮아 DC와 구분되지 않는 고조파도 제외합니다.
+
+    Args:
+        geometry: 베어링 형상
+        bucket: rpm_bucket()으로 구한 회전수 구간 번호
+        n_fft: FFT 크기 (프레임 길이)
+        sample_rate: 샘플링 주파수 (Hz)
+
+    Returns:
+        DEFECT_TYPES 순서의 읽기 전용 int64 인덱스 배열 튜플 (중복 없이 정렬됨)
+
+    Raises:
+        ValueError: bucket이 1보다 작을 때
+    """
+    if bucket < 1:
+        raise ValueError(f"회전수 구간 번호는 1 이상이어야 합니다: {bucket}")
+    df = sample_rate / n_fft
+    n_bins = n_fft // 2 + 1
+    shaft_hz = bucket * RPM_BUCKET_WIDTH / 60.0
+    # 구간 안의 회전수 편차가 만드는 주파수 편차 (배수 1 기준)
+    bucket_slack_hz = RPM_BUCKET_WIDTH / 2.0 / 60.0
+
+    bins = []
+    orders = geometry.defect_orders()
+    for defect in DEFECT_TYPES:
+        indices: List[np.ndarray] = []
+        for harmonic in range(1, DEFECT_HARMONICS + 1):
+            order = orders[defect] * harmonic
+            center = order * shaft_hz
+            if center / df > n_bins - 1:
+                break
+            if center < df:
+                continue
+            half_width = (
+                center * DEFECT_BAND_RELATIVE_WIDTH + order * bucket_slack_hz
+            )
+            lo = max(math.ceil((center - half_width) / df), 1)
+            hi = min(math.floor((center + half_width) / df), n_bins - 1)
+            if hi < lo:
+                lo = hi = min(int(round(center / df)), n_bins - 1)
+            indices.append(np.arange(lo, hi + 1))
+
+        merged = (
+            np.unique(np.concatenate(indices)) if indices
+            else np.empty(0, dtype=np.int64)
+        ).astype(np.int64)
+        merged.setflags(write=False)
+        bins.append(merged)
+
+    return tuple(bins)
+
+
+class BearingGeometryRegistry:
+    """
+    베어링 모델명 → 형상 레지스트리
+
+    설비군의 각 유닛은 모델명과 회전수로 결함 대역 빈 인덱스를 조회합니다.
+    """
+
+    def __init__(self):
+        """빈 레지스트리 생성"""
+        self._geometries: Dict[str, BearingGeometry] = {}
+
+    def register(self, name: str, geometry: BearingGeometry) -> None:
+        """
+        베어링 형상을 등록합니다.
+
+        Raises:
+            ValueError: 같은 이름에 다른 형상이 이미 등록되어 있을 때
+        """
+        existing = self._geometries.get(name)
+        if existing is not None and existing != geometry:
+            raise ValueError(f"이미 다른 형상으로 등록된 베어링입니다: {name}")
+        self._geometries[name] = geometry
+
+    def get(self, name: str) -> BearingGeometry:
+        """
+        등록된 형상을 반환합니다.
+
+        Raises:
+            KeyError: 등록되지 않은 이름일 때
+        """
+        try:
+            return self._geometries[name]
+        except KeyError:
+            raise KeyError(f"등록되지 않은 베어링입니다: {name}")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._geometries
+
+    def defect_frequencies(self, name: str, rpm: float) -> Dict[str, List[float]]:
+        """
+        결함 종류별 고조파 주파수(Hz)를 계산합니다.
+
+        Args:
+            name: 베어링 모델명
+            rpm: 축 회전수 (rpm)
+
+        Returns:
+            {"bpfo": [1x, 2x, ...], "bpfi": [...], "bsf": [...], "ftf": [...]}
+        """
+        if rpm <= 0:
+            raise ValueError("회전수는 양수여야 합니다")
+        shaft_hz = rpm / 60.0
+        orders = self.get(name).defect_orders()
+        return {
+            defect: [
+                orders[defect] * h * shaft_hz
+                for h in range(1, DEFECT_HARMONICS + 1)
+            ]
+            for defect in DEFECT_TYPES
+        }
+
+    def band_bins(
+        self,
+        name: str,
+        rpm: float,
+        n_fft: int,
+        sample_rate: float,
+    ) -> Dict[str, np.ndarray]:
+        """
+        결함 종류별 빈 인덱스를 반환합니다 (defect_band_bins() 캐시 사용).
+
+        Raises:
+            KeyError: 등록되지 않은 베어링일 때
+            ValueError: 회전수, FFT 크기, 샘플링 주파수가 올바르지 않을 때
+        """
+        _validate_spectrum_shape(n_fft, sample_rate)
+        bins = defect_band_bins(
+            self.get(name), rpm_bucket(rpm), int(n_fft), float(sample_rate)
+        )
+        return dict(zip(DEFECT_TYPES, bins))
+
+    def band_energies(
+        self,
+        psd: np.ndarray,
+        bearings: Union[str, Sequence[str]],
+        rpms: Union[float, Sequence[float]],
+        n_fft: int,
+        sample_rate: float,
+    ) -> Dict[str, Union[float, np.ndarray]]:
+        """
+        PSD에서 결함 대역 에너지를 계산합니다.
+
+        유닛별 캐시된 빈 인덱스를 이어 붙여 결함 종류마다
+        gather 한 번과 np.bincount 한 번으로 모든 유닛의 에너지를 구합니다.
+
+        Args:
+            psd: (n_bins,) 단일 PSD 또는 (n_units, n_bins) 설비군 PSD
+                (n_bins = n_fft // 2 + 1)
+            bearings: 베어링 모델명 (단일) 또는 유닛별 모델명
+            rpms: 회전수 (단일) 또는 유닛별 회전수
+            n_fft: PSD를 계산한 FFT 크기
+            sample_rate: 샘플링 주파수 (Hz)
+
+        Returns:
+            {"bpfo_energy": ..., "bpfi_energy": ..., "bsf_energy": ..., "ftf_energy": ...}
+            단일 PSD이면 float, 설비군이면 (n_units,) 배열
+
+        Raises:
+            KeyError: 등록되지 않은 베어링이 있을 때
+            ValueError: PSD 크기나 유닛 수가 맞지 않을 때
+        """
+        _validate_spectrum_shape(n_fft, sample_rate)
+        psd = np.asarray(psd, dtype=np.float64)
+        single = psd.ndim == 1
+        block = psd[np.newaxis, :] if single else psd
+        if block.ndim != 2 or block.shape[1] != n_fft // 2 + 1:
+            raise ValueError(
+                f"PSD 크기가 FFT 크기 {n_fft}와 맞지 않습니다: shape={psd.shape}"
+            )
+
+        n_units = block.shape[0]
+        names = [bearings] * n_units if isinstance(bearings, str) else list(bearings)
+        speeds = (
+            [rpms] * n_units if np.ndim(rpms) == 0 else list(np.asarray(rpms))
+        )
+        if len(names) != n_units or len(speeds) != n_units:
+            raise ValueError(
+                f"유닛 수({n_units})와 베어링/회전수 수"
+                f"({len(names)}/{len(speeds)})가 다릅니다"
+            )
+
+        unit_bins = [
+            defect_band_bins(
+                self.get(name), rpm_bucket(rpm), int(n_fft), float(sample_rate)
+            )
+            for name, rpm in zip(names, speeds)
+        ]
+
+        df = sample_rate / n_fft
+        energies: Dict[str, Union[float, np.ndarray]] = {}
+        for k, feature in enumerate(DEFECT_FEATURE_NAMES):
+            cols = [bins[k] for bins in unit_bins]
+            rows = np.repeat(np.arange(n_units), [c.size for c in cols])
+            values = block[rows, np.concatenate(cols)] if cols else np.empty(0)
+            energy = np.bincount(rows, weights=values, minlength=n_units) * df
+            energies[feature] = float(energy[0]) if single else energy
+
+        return energies
+
+
+def _validate_spectrum_shape(n_fft: int, sample_rate: float) -> None:
+    if n_fft <= 0:
+        raise ValueError("FFT 크기는 양수여야 합니다")
+    if not sample_rate > 0:
+        raise ValueError("샘플링 주파수는 양수여야 합니다")
@@ -5,14 +5,20 @@
 학습 데이터의 정상 패턴(평균, 표준편차)을 기억하고,
 새로운 데이터가 정상 패턴에서 얼마나 벗어났는지로 건강도를 판단합니다.
 
-외부 라이브러리 없이 Python 표준 라이브러리만 사용합니다.
+단건 API는 Python 표준 라이브러리만 사용하며, 배치 API
+(predict_health_scores 등)는 NumPy 벡터 연산을 사용합니다.
+추가 특징으로 쓰는 결함 대역 에너지는 src_bearing_geometry에서 계산합니다.
 """
 
 import json
 import math
 import statistics
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional, Any
+from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Optional, Any, Sequence, Tuple
+
+import numpy as np
+
+from src_bearing_geometry import DEFECT_FEATURE_NAMES
 
 
 @dataclass
@@ -32,12 +38,305 @@ class HealthMetrics:
     f1: float
 
 
+# ThresholdSweep.best_threshold()에서 고를 수 있는 지표
+# ("youden" = TPR - FPR, ROC 곡선에서 대각선과 가장 먼 점)
+SWEEP_METRICS = ("accuracy", "precision", "recall", "f1", "youden")
+
+
+@dataclass
+class ThresholdSweep:
+    """
+    임계값 전체에 대한 누적 혼동 행렬
+
+    점수가 임계값 이하이면 "fault"로 예측할 때, 서로 다른 점수값 하나하나를
+    임계값으로 삼은 결과입니다 (오름차순). ROC/PR 곡선은 이 누적 개수에서
+    바로 계산됩니다.
+
+    Attributes:
+        thresholds: 후보 임계값 (서로 다른 점수, 오름차순)
+        tp: 임계값별 True Positive 수 (고장을 고장으로 예측)
+        fp: 임계값별 False Positive 수 (정상을 고장으로 예측)
+        n_fault: 전체 고장 샘플 수
+        n_normal: 전체 정상 샘플 수
+    """
+    thresholds: np.ndarray
+    tp: np.ndarray
+    fp: np.ndarray
+    n_fault: int
+    n_normal: int
+
+    @property
+    def fn(self) -> np.ndarray:
+        """임계값별 False Negative 수"""
+        return self.n_fault - self.tp
+
+    @property
+    def tn(self) -> np.ndarray:
+        """임계값별 True Negative 수"""
+        return self.n_normal - self.fp
+
+    @property
+    def recall(self) -> np.ndarray:
+        """재현율 = TPR (ROC의 y축, PR의 x축)"""
+        return _ratio(self.tp, np.full_like(self.tp, self.n_fault))
+
+    @property
+    def fpr(self) -> np.ndarray:
+        """False Positive Rate (ROC의 x축)"""
+        return _ratio(self.fp, np.full_like(self.fp, self.n_normal))
+
+    @property
+    def precision(self) -> np.ndarray:
+        """정밀도 (PR의 y축)"""
+        return _ratio(self.tp, self.tp + self.fp)
+
+    @property
+    def accuracy(self) -> np.ndarray:
+        """정확도"""
+        return _ratio(
+            self.tp + self.tn,
+            np.full_like(self.tp, self.n_fault + self.n_normal),
+        )
+
+    @property
+    def f1(self) -> np.ndarray:
+        """F1 점수"""
+        precision, recall = self.precision, self.recall
+        return _ratio(2 * precision * recall, precision + recall)
+
+    def roc_auc(self) -> float:
+        """ROC 곡선 아래 면적 ((0, 0)에서 시작하는 사다리꼴 적분)"""
+        fpr = np.concatenate([[0.0], self.fpr])
+        tpr = np.concatenate([[0.0], self.recall])
+        return float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2.0))
+
+    def metrics_at(self, threshold: float) -> HealthMetrics:
+        """
+        임의의 임계값에서의 지표를 계산합니다 (정렬된 임계값에서 이진 탐색).
+
+        evaluate()를 같은 임계값으로 실행한 결과와 같습니다.
+        """
+        index = int(np.searchsorted(self.thresholds, threshold, side="right")) - 1
+        if index < 0:
+            # 고장으로 예측한 샘플이 없음
+            return _metrics_from_counts(0, 0, self.n_fault, self.n_normal)
+        return _metrics_from_counts(
+            int(self.tp[index]), int(self.fp[index]), self.n_fault, self.n_normal
+        )
+
+    def best_threshold(self, metric: str = "f1") -> Tuple[float, HealthMetrics]:
+        """
+        지표를 최대화하는 임계값을 찾습니다 (동률이면 가장 낮은 임계값).
+
+        Args:
+            metric: SWEEP_METRICS 중 하나
+
+        Returns:
+            (임계값, 해당 임계값의 HealthMetrics) 튜플
+
+        Raises:
+            ValueError: 지원하지 않는 지표이거나 후보 임계값이 없을 때
+        """
+        if metric not in SWEEP_METRICS:
+            raise ValueError(
+                f"지원하지 않는 지표입니다: {metric}. 지원 지표: {list(SWEEP_METRICS)}"
+            )
+        if self.thresholds.size == 0:
+            raise ValueError("평가할 샘플이 없습니다")
+
+        values = self.recall - self.fpr if metric == "youden" else getattr(self, metric)
+        threshold = float(self.thresholds[int(np.argmax(values))])
+        return threshold, self.metrics_at(threshold)
+
+
+def threshold_sweep(scores: np.ndarray, is_fault: np.ndarray) -> ThresholdSweep:
+    """
+    정렬 한 번으로 모든 임계값의 혼동 행렬을 계산합니다.
+
+    점수를 오름차순으로 정렬한 뒤 고장/정상 누적 합을 구하고,
+    같은 점수가 끝나는 위치에서만 값을 취합니다. 비용은 정렬 O(n log n)입니다.
+
+    Args:
+        scores: (n,) 건강도 점수
+        is_fault: (n,) 실제 고장 여부
+
+    Returns:
+        ThresholdSweep
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    is_fault = np.asarray(is_fault, dtype=bool)
+    if scores.shape != is_fault.shape or scores.ndim != 1:
+        raise ValueError(
+            f"점수({scores.shape})와 라벨({is_fault.shape})의 모양이 다릅니다"
+        )
+
+    order = np.argsort(scores, kind="stable")
+    sorted_scores = scores[order]
+    sorted_fault = is_fault[order]
+
+    tp = np.cumsum(sorted_fault, dtype=np.int64)
+    fp = np.arange(1, scores.size + 1, dtype=np.int64) - tp
+
+    # 같은 점수는 한 임계값으로 묶음 (각 값의 마지막 위치)
+    last = np.flatnonzero(np.append(sorted_scores[1:] != sorted_scores[:-1], True))
+    if scores.size == 0:
+        last = last[:0]
+
+    n_fault = int(tp[-1]) if scores.size else 0
+    return ThresholdSweep(
+        thresholds=sorted_scores[last],
+        tp=tp[last],
+        fp=fp[last],
+        n_fault=n_fault,
+        n_normal=scores.size - n_fault,
+    )
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """분모가 0이면 0.0인 나눗셈 (evaluate()와 같은 규칙)"""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    return np.divide(
+        numerator, denominator,
+        out=np.zeros_like(numerator), where=denominator > 0,
+    )
+
+
+def _metrics_from_counts(tp: int, fp: int, n_fault: int, n_normal: int) -> HealthMetrics:
+    """혼동 행렬 개수로 HealthMetrics를 만듭니다."""
+    fn = n_fault - tp
+    tn = n_normal - fp
+    total = n_fault + n_normal
+    accuracy = (tp + tn) / total if total > 0 else 0.0
+    precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
+    recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
+    if precision + recall > 0:
+        f1 = 2 * (precision * recall) / (precision + recall)
+    else:
+        f1 = 0.0
+    return HealthMetrics(accuracy=accuracy, precision=precision, recall=recall, f1=f1)
+
+
+@dataclass
+class FeatureMoments:
+    """
+    한 특징의 누적 통계 (개수, 평균, 편차 제곱합)
+
+    Welford/Chan 방식으로 갱신하므로 데이터를 다시 읽지 않고
+    새 데이터를 반영하거나 다른 샤드의 통계와 정확히 합칠 수 있습니다.
+
+    Attributes:
+        count: 값 개수
+        mean: 평균
+        m2: 평균으로부터의 편차 제곱합 (표본분산 = m2 / (count - 1))
+    """
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @classmethod
+    def from_values(cls, values: Sequence[float]) -> "FeatureMoments":
+        """값 목록의 통계를 계산합니다."""
+        if not values:
+            return cls()
+        mean = math.fsum(values) / len(values)
+        m2 = math.fsum((v - mean) ** 2 for v in values)
+        return cls(count=len(values), mean=mean, m2=m2)
+
+    def merge(self, other: "FeatureMoments") -> "FeatureMoments":
+        """
+        두 통계를 합친 새 통계를 반환합니다 (Chan의 병렬 분산 공식).
+
+        결합 법칙이 성립하며 FeatureMoments()가 항등원입니다.
+        """
+        count = self.count + other.count
+        if count == 0:
+            return FeatureMoments()
+        delta = other.mean - self.mean
+        return FeatureMoments(
+            count=count,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2 + other.m2 + delta * delta * self.count * other.count / count,
+        )
+
+    @property
+    def std(self) -> float:
+        """표본 표준편차 (count < 2이면 0.0)"""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.count - 1))
+
+
+@dataclass
+class TrainingStatistics:
+    """
+    정상 데이터의 누적 학습 통계
+
+    데이터 샤드마다 from_data()로 계산한 뒤 merge()로 합치면
+    전체 데이터로 한 번에 계산한 것과 같은 결과가 됩니다.
+
+    Attributes:
+        n_normal: 지금까지 반영한 정상(normal) 데이터 수
+        moments: 특징 이름 → FeatureMoments
+    """
+    n_normal: int = 0
+    moments: Dict[str, FeatureMoments] = field(default_factory=dict)
+
+    @classmethod
+    def from_data(
+        cls,
+        training_data: Sequence[Dict[str, Any]],
+        feature_names: Sequence[str],
+    ) -> "TrainingStatistics":
+        """
+        학습 데이터 샤드의 통계를 계산합니다 (label="normal"인 데이터만 사용).
+
+        Args:
+            training_data: fit()과 같은 형식의 학습 데이터
+            feature_names: 통계를 계산할 특징 이름들
+        """
+        normal_data = [d for d in training_data if d.get("label") == "normal"]
+        return cls(
+            n_normal=len(normal_data),
+            moments={
+                feature: FeatureMoments.from_values(
+                    [d[feature] for d in normal_data if feature in d]
+                )
+                for feature in feature_names
+            },
+        )
+
+    def merge(self, other: "TrainingStatistics") -> "TrainingStatistics":
+        """두 통계를 합친 새 통계를 반환합니다 (결합 법칙 성립)."""
+        moments = dict(self.moments)
+        for feature, m in other.moments.items():
+            moments[feature] = moments.get(feature, FeatureMoments()).merge(m)
+        return TrainingStatistics(
+            n_normal=self.n_normal + other.n_normal, moments=moments
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON으로 저장할 수 있는 딕셔너리로 변환합니다."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TrainingStatistics":
+        """to_dict() 결과에서 통계를 복원합니다."""
+        return cls(
+            n_normal=data["n_normal"],
+            moments={
+                feature: FeatureMoments(**m)
+                for feature, m in data["moments"].items()
+            },
+        )
+
+
 class BearingFailurePredictor:
     """
     베어링 고장 예측기
 
     통계 기반 접근:
     1. fit(): 정상 데이터의 각 특징(feature) 평균/표준편차를 학습
+       (partial_fit()/merge_statistics()로 증분 학습 가능)
     2. predict_health_score(): 새 데이터가 정상 패턴에서 얼마나 벗어났는지 점수 계산
     3. predict_rul(): 건강도 이력을 선형 외삽하여 잔여 수명 추정
     4. evaluate(): 이진 분류 성능 지표 계산
@@ -49,8 +348,23 @@ class BearingFailurePredictor:
     # 특징 이름 목록
     FEATURE_NAMES = ["rms", "kurtosis", "crest_factor"]
 
-    def __init__(self):
-        """모델 초기화"""
+    # 선택적으로 추가할 수 있는 특징 (결함 대역 에너지)
+    EXTRA_FEATURE_NAMES = list(DEFECT_FEATURE_NAMES)
+
+    def __init__(self, extra_features: Optional[Sequence[str]] = None):
+        """
+        모델 초기화
+
+        Args:
+            extra_features: FEATURE_NAMES 뒤에 추가할 특징 이름들
+                (EXTRA_FEATURE_NAMES 중에서 선택, 예: ["bpfo_energy"])
+
+        Raises:
+            ValueError: 지원하지 않는 추가 특징일 때
+        """
+        self.feature_names: List[str] = self._resolve_feature_names(
+            extra_features or []
+        )
         self.is_fitted: bool = False
         self.normal_params: Dict[str, Dict[str, float]] = {}
         # normal_params 구조:
@@ -59,6 +373,23 @@ class BearingFailurePredictor:
         #     "kurtosis": {"mean": 0.2, "std": 0.05},
         #     "crest_factor": {"mean": 1.4, "std": 0.1},
         # }
+        # normal_params의 근거가 되는 누적 통계 (증분 학습용).
+        # 통계 없이 저장된 모델 파일을 로딩하면 None
+        self.training_stats: Optional[TrainingStatistics] = TrainingStatistics()
+
+    @classmethod
+    def _resolve_feature_names(cls, extra_features: Sequence[str]) -> List[str]:
+        """기본 특징 + 추가 특징 목록을 만듭니다 (중복 제거, 순서 유지)."""
+        unknown = [f for f in extra_features if f not in cls.EXTRA_FEATURE_NAMES]
+        if unknown:
+            raise ValueError(
+                f"지원하지 않는 추가 특징입니다: {unknown}. "
+                f"지원 특징: {cls.EXTRA_FEATURE_NAMES}"
+            )
+        return cls.FEATURE_NAMES + [
+            f for f in dict.fromkeys(extra_features)
+            if f not in cls.FEATURE_NAMES
+        ]
 
     def fit(self, training_data: List[Dict[str, Any]]) -> None:
         """
@@ -70,29 +401,69 @@ class BearingFailurePredictor:
             training_data: 학습 데이터 리스트
                 [{"rms": float, "kurtosis": float, "crest_factor": float,
                   "label": "normal"|"fault"}, ...]
+                추가 특징을 선택했다면 해당 키도 포함 (예: "bpfo_energy")
 
         Raises:
             ValueError: 정상 데이터가 2개 미만일 때
         """
-        # 정상 데이터만 필터링
-        normal_data = [
-            d for d in training_data if d.get("label") == "normal"
-        ]
+        stats = TrainingStatistics.from_data(training_data, self.feature_names)
 
-        if len(normal_data) < 2:
+        if stats.n_normal < 2:
             raise ValueError(
                 "정상(normal) 데이터가 최소 2개 이상 필요합니다. "
-                f"현재: {len(normal_data)}개"
+                f"현재: {stats.n_normal}개"
             )
 
-        # 각 특징의 평균과 표준편차 계산
+        self.training_stats = stats
+        self._update_params()
+
+    def partial_fit(self, training_data: List[Dict[str, Any]]) -> None:
+        """
+        새 학습 데이터를 기존 통계에 누적하여 학습합니다.
+
+        기존 데이터를 다시 읽지 않으므로 비용은 새 데이터 크기에만 비례합니다.
+        누적 정상 데이터가 2개 이상이 되면 is_fitted가 True가 됩니다.
+
+        Args:
+            training_data: fit()과 같은 형식의 새 학습 데이터
+
+        Raises:
+            RuntimeError: 누적 통계 없이 저장된 모델 파일을 로딩했을 때
+        """
+        self.merge_statistics(
+            TrainingStatistics.from_data(training_data, self.feature_names)
+        )
+
+    def merge_statistics(self, stats: TrainingStatistics) -> None:
+        """
+        다른 샤드에서 계산한 통계를 합쳐 파라미터를 갱신합니다.
+
+        여러 작업자가 서로 겹치지 않는 데이터로 TrainingStatistics.from_data()를
+        계산해 합치면 전체 데이터로 fit()한 것과 같은 파라미터가 됩니다.
+
+        Args:
+            stats: 합칠 통계 (feature_names 밖의 특징은 파라미터에 쓰이지 않음)
+
+        Raises:
+            RuntimeError: 누적 통계 없이 저장된 모델 파일을 로딩했을 때
+        """
+        if self.training_stats is None:
+            raise RuntimeError(
+                "누적 통계가 없는 모델입니다. fit()으로 다시 학습하세요."
+            )
+        self.training_stats = self.training_stats.merge(stats)
+        if self.training_stats.n_normal >= 2:
+            self._update_params()
+
+    def _update_params(self) -> None:
+        """누적 통계에서 각 특징의 평균과 표준편차를 계산합니다."""
         self.normal_params = {}
-        for feature in self.FEATURE_NAMES:
-            values = [d[feature] for d in normal_data if feature in d]
-            if len(values) >= 2:
+        for feature in self.feature_names:
+            moments = self.training_stats.moments.get(feature)
+            if moments is not None and moments.count >= 2:
                 self.normal_params[feature] = {
-                    "mean": statistics.mean(values),
-                    "std": max(statistics.stdev(values), 1e-10),
+                    "mean": moments.mean,
+                    "std": max(moments.std, 1e-10),
                     # std가 0이면 나눗셈 오류 방지를 위해 최소값 설정
                 }
 
@@ -110,6 +481,8 @@ class BearingFailurePredictor:
 
         Args:
             features: 특징 딕셔너리 {"rms": float, "kurtosis": float, ...}
+                값이 NaN인 특징은 없는 특징과 같이 제외됩니다
+                (predict_health_scores()와 같은 규칙)
 
         Returns:
             건강도 점수 (0.0 ~ 100.0)
@@ -120,10 +493,14 @@ class BearingFailurePredictor:
         if not self.is_fitted:
             raise RuntimeError("모델이 학습되지 않았습니다. fit()을 먼저 호출하세요.")
 
-        # 각 특징의 z-score 계산
+        # 각 특징의 z-score 계산 (NaN은 측정값 없음으로 간주)
         z_scores = []
-        for feature in self.FEATURE_NAMES:
-            if feature in features and feature in self.normal_params:
+        for feature in self.feature_names:
+            if (
+                feature in features
+                and feature in self.normal_params
+                and not math.isnan(features[feature])
+            ):
                 params = self.normal_params[feature]
                 z = abs(features[feature] - params["mean"]) / params["std"]
                 z_scores.append(z)
@@ -142,6 +519,70 @@ class BearingFailurePredictor:
 
         return score
 
+    def to_feature_matrix(
+        self, rows: Sequence[Dict[str, float]]
+    ) -> np.ndarray:
+        """
+        특징 딕셔너리 리스트를 feature_names 순서의 (n, n_features) 행렬로 변환합니다.
+
+        없는 특징은 NaN으로 채웁니다.
+        """
+        matrix = np.full((len(rows), len(self.feature_names)), np.nan)
+        for j, feature in enumerate(self.feature_names):
+            matrix[:, j] = [row.get(feature, np.nan) for row in rows]
+        return matrix
+
+    def predict_health_scores(self, features: np.ndarray) -> np.ndarray:
+        """
+        여러 행의 건강도 점수를 한 번의 벡터 연산으로 계산합니다.
+
+        predict_health_score()와 같은 규칙을 따릅니다: NaN(없는 특징)과
+        학습되지 않은 특징은 z-score 평균에서 제외하고, 사용할 특징이 하나도
+        없는 행은 50.0입니다.
+
+        Args:
+            features: feature_names 순서의 (n, n_features) 행렬
+                (딕셔너리 리스트는 to_feature_matrix()로 변환)
+
+        Returns:
+            (n,) 건강도 점수 배열 (0.0 ~ 100.0)
+
+        Raises:
+            RuntimeError: 모델이 학습되지 않았을 때
+            ValueError: 행렬 모양이 feature_names와 맞지 않을 때
+        """
+        if not self.is_fitted:
+            raise RuntimeError("모델이 학습되지 않았습니다. fit()을 먼저 호출하세요.")
+
+        matrix = np.asarray(features, dtype=np.float64)
+        if matrix.ndim != 2 or matrix.shape[1] != len(self.feature_names):
+            raise ValueError(
+                f"(n, {len(self.feature_names)}) 행렬이 필요합니다 "
+                f"(특징 순서: {self.feature_names}): shape={matrix.shape}"
+            )
+
+        means, stds = self.param_arrays()
+        return compute_health_scores(matrix, means, stds)
+
+    def param_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        feature_names 순서의 평균/표준편차 배열을 반환합니다.
+
+        학습되지 않은 특징은 NaN이므로 compute_health_scores()에서 자동 제외됩니다.
+
+        Returns:
+            (means, stds) 튜플, 각각 (n_features,) 배열
+        """
+        means = np.array([
+            self.normal_params.get(f, {}).get("mean", np.nan)
+            for f in self.feature_names
+        ])
+        stds = np.array([
+            self.normal_params.get(f, {}).get("std", np.nan)
+            for f in self.feature_names
+        ])
+        return means, stds
+
     def predict_rul(self, health_scores_history: List[float]) -> float:
         """
         건강도 이력을 기반으로 잔여 수명(RUL)을 추정합니다.
@@ -189,16 +630,7 @@ class BearingFailurePredictor:
 
         slope = numerator / denominator
 
-        # 건강도가 증가하는 추세이면 (설비 상태 개선)
-        if slope >= 0:
-            # 하락하지 않으므로 RUL은 매우 큼
-            return 999.0  # 실질적으로 무한
-
-        # 현재 건강도에서 임계값까지의 시간 단위 계산
-        # current_health + slope * rul = HEALTH_THRESHOLD
-        rul = (self.HEALTH_THRESHOLD - current_health) / slope
-
-        return max(0.0, rul)
+        return rul_from_trend(current_health, slope, self.HEALTH_THRESHOLD)
 
     def evaluate(
         self,
@@ -230,12 +662,12 @@ class BearingFailurePredictor:
                 f"데이터({len(test_data)})와 라벨({len(true_labels)}) 수가 다릅니다"
             )
 
-        # 예측 수행
-        predictions = []
-        for features in test_data:
-            score = self.predict_health_score(features)
-            pred = "fault" if score <= self.HEALTH_THRESHOLD else "normal"
-            predictions.append(pred)
+        # 예측 수행 (배치 점수 계산)
+        scores = self.predict_health_scores(self.to_feature_matrix(test_data))
+        predictions = [
+            "fault" if score <= self.HEALTH_THRESHOLD else "normal"
+            for score in scores.tolist()
+        ]
 
         # 혼동 행렬(Confusion Matrix) 계산
         tp = 0  # True Positive: 고장을 고장으로 예측
@@ -272,6 +704,42 @@ class BearingFailurePredictor:
             f1=f1,
         )
 
+    def evaluate_thresholds(
+        self,
+        test_data: List[Dict[str, float]],
+        true_labels: List[str],
+    ) -> ThresholdSweep:
+        """
+        테스트 데이터를 한 번만 점수화하여 모든 임계값의 성능을 계산합니다.
+
+        임계값마다 evaluate()를 다시 실행하지 않고, 반환된 ThresholdSweep에서
+        ROC/PR 곡선과 best_threshold()로 최적 임계값을 얻습니다.
+        "normal"/"fault" 이외의 라벨은 evaluate()처럼 집계에서 제외됩니다.
+
+        Args:
+            test_data: 테스트 특징 데이터 리스트
+            true_labels: 실제 라벨 리스트 ("normal" 또는 "fault")
+
+        Returns:
+            ThresholdSweep: 임계값별 누적 혼동 행렬
+
+        Raises:
+            RuntimeError: 모델이 학습되지 않았을 때
+            ValueError: 데이터와 라벨 수가 다를 때
+        """
+        if not self.is_fitted:
+            raise RuntimeError("모델이 학습되지 않았습니다")
+
+        if len(test_data) != len(true_labels):
+            raise ValueError(
+                f"데이터({len(test_data)})와 라벨({len(true_labels)}) 수가 다릅니다"
+            )
+
+        scores = self.predict_health_scores(self.to_feature_matrix(test_data))
+        labels = np.asarray(true_labels, dtype=object)
+        known = (labels == "fault") | (labels == "normal")
+        return threshold_sweep(scores[known], labels[known] == "fault")
+
     def save_model(self, filepath: str) -> None:
         """
         모델 파라미터를 JSON 파일로 저장합니다.
@@ -289,8 +757,10 @@ class BearingFailurePredictor:
             "is_fitted": self.is_fitted,
             "normal_params": self.normal_params,
             "health_threshold": self.HEALTH_THRESHOLD,
-            "feature_names": self.FEATURE_NAMES,
+            "feature_names": self.feature_names,
         }
+        if self.training_stats is not None:
+            model_data["statistics"] = self.training_stats.to_dict()
 
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(model_data, f, indent=2, ensure_ascii=False)
@@ -320,5 +790,72 @@ class BearingFailurePredictor:
             if key not in model_data:
                 raise ValueError(f"모델 파일에 '{key}'가 누락되었습니다")
 
+        feature_names = model_data.get("feature_names", self.FEATURE_NAMES)
+        self.feature_names = self._resolve_feature_names(
+            [f for f in feature_names if f not in self.FEATURE_NAMES]
+        )
         self.is_fitted = model_data["is_fitted"]
         self.normal_params = model_data["normal_params"]
+        # 예전 형식의 파일에는 누적 통계가 없으므로 증분 학습을 할 수 없음
+        stats = model_data.get("statistics")
+        self.training_stats = (
+            TrainingStatistics.from_dict(stats) if stats is not None else None
+        )
+
+
+# 건강도가 하락하지 않을 때 반환하는 RUL (실질적으로 무한)
+RUL_NOT_DECLINING = 999.0
+
+
+def rul_from_trend(current_health: float, slope: float, threshold: float) -> float:
+    """
+    현재 건강도와 하락 기울기로 임계값 도달까지의 시간 단위 수를 계산합니다.
+
+    Args:
+        current_health: 최신 건강도
+        slope: 시간 단위당 건강도 변화량 (선형 회귀 기울기)
+        threshold: 고장 판정 임계값
+
+    Returns:
+        잔여 수명 (이미 임계값 이하이면 0.0, 하락하지 않으면 RUL_NOT_DECLINING)
+    """
+    if current_health <= threshold:
+        return 0.0
+
+    # 건강도가 증가하는 추세이면 (설비 상태 개선)
+    if slope >= 0:
+        # 하락하지 않으므로 RUL은 매우 큼
+        return RUL_NOT_DECLINING
+
+    # 현재 건강도에서 임계값까지의 시간 단위 계산
+    # current_health + slope * rul = threshold
+    return max(0.0, (threshold - current_health) / slope)
+
+
+def compute_health_scores(
+    features: np.ndarray, means: np.ndarray, stds: np.ndarray
+) -> np.ndarray:
+    """
+    건강도 점수를 벡터 연산으로 계산합니다.
+
+    means/stds는 (n_features,)이면 모든 행에, (n, n_features)이면
+    행마다 다른 파라미터(예: 설비군의 베어링별 모델)에 적용됩니다.
+    NaN인 특징값이나 파라미터는 z-score 평균에서 제외하고,
+    사용할 특징이 하나도 없는 행은 50.0입니다.
+
+    Args:
+        features: (n, n_features) 특징 행렬
+        means: 정상 평균 배열
+        stds: 정상 표준편차 배열
+
+    Returns:
+        (n,) 건강도 점수 배열 (0.0 ~ 100.0)
+    """
+    z = np.abs(features - means) / stds
+    used = ~np.isnan(z)
+    count = used.sum(axis=1)
+    avg_z = np.where(used, z, 0.0).sum(axis=1) / np.maximum(count, 1)
+
+    scores = np.clip(100.0 * np.exp(-0.5 * avg_z), 0.0, 100.0)
+    scores[count == 0] = 50.0  # 판단할 수 없으면 중간값
+    return scores
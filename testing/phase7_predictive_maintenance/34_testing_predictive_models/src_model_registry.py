@@ -0,0 +1,361 @@
+"""
+설비군 베어링 모델 레지스트리 모듈
+
+베어링마다 save_model()로 JSON 파일을 하나씩 저장하면, 수만 대 규모에서는
+시작할 때 파일을 열고 파싱하는 데 대부분의 시간을 씁니다.
+이 모듈은 모든 베어링의 normal_params를 연속 배열로 묶어
+인덱스가 있는 바이너리 파일(.bmr) 하나에 저장합니다.
+
+파일 구조:
+    [헤더 64바이트] [인덱스 JSON (8바이트 정렬)] [means] [stds]
+
+    헤더 (리틀 엔디언):
+        magic       4s   b"BMR1"
+        version     H    형식 버전
+        n_features  H    특징 수
+        n_models    Q    베어링 수
+        index_size  Q    인덱스 JSON 바이트 수 (패딩 제외)
+
+    인덱스 JSON: {"feature_names": [...], "bearing_ids": [...]}
+    means, stds: (n_models, n_features) float64 행렬 (행 우선).
+        학습되지 않은 특징은 NaN
+
+파라미터 행렬은 copy-on-write 메모리 맵(mode="c")으로 열기 때문에
+실제로 접근한 페이지만 읽고, 단일 모델을 갱신해도 해당 페이지만
+메모리에 복사되며 save()를 호출하기 전까지 원본 파일은 바뀌지 않습니다.
+"""
+
+import json
+import os
+import struct
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from src_bearing_model import BearingFailurePredictor, compute_health_scores
+
+
+REGISTRY_MAGIC = b"BMR1"
+REGISTRY_VERSION = 1
+
+HEADER_SIZE = 64
+_HEADER_STRUCT = struct.Struct("<4sHHQQ")
+
+_PARAM_DTYPE = np.dtype("<f8")
+
+
+def _aligned(size: int) -> int:
+    """size를 8바이트 경계로 올림합니다."""
+    return (size + 7) // 8 * 8
+
+
+def _write_registry(
+    filepath: str,
+    feature_names: Sequence[str],
+    bearing_ids: Sequence[str],
+    means: np.ndarray,
+    stds: np.ndarray,
+) -> None:
+    """레지스트리 파일을 임시 파일에 쓴 뒤 원자적으로 교체합니다."""
+    index = json.dumps(
+        {"feature_names": list(feature_names), "bearing_ids": list(bearing_ids)},
+        ensure_ascii=False,
+    ).encode("utf-8")
+    header = _HEADER_STRUCT.pack(
+        REGISTRY_MAGIC, REGISTRY_VERSION,
+        len(feature_names), len(bearing_ids), len(index),
+    )
+
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        f.write(index.ljust(_aligned(len(index)), b"\0"))
+        np.ascontiguousarray(means, dtype=_PARAM_DTYPE).tofile(f)
+        np.ascontiguousarray(stds, dtype=_PARAM_DTYPE).tofile(f)
+    # 열려 있는 메모리 맵은 이전 파일을 계속 참조하므로 같은 경로에도 안전
+    os.replace(tmp_path, filepath)
+
+
+def write_model_registry(
+    filepath: str, models: Mapping[str, BearingFailurePredictor]
+) -> None:
+    """
+    베어링별 모델을 레지스트리 파일 하나로 저장합니다.
+
+    Args:
+        filepath: 저장 경로
+        models: 베어링 ID → 학습된 BearingFailurePredictor
+
+    Raises:
+        RuntimeError: 학습되지 않은 모델이 있을 때
+        ValueError: 모델마다 feature_names가 다를 때
+    """
+    bearing_ids = list(models)
+    feature_names = (
+        models[bearing_ids[0]].feature_names if bearing_ids
+        else BearingFailurePredictor.FEATURE_NAMES
+    )
+
+    means = np.empty((len(bearing_ids), len(feature_names)))
+    stds = np.empty_like(means)
+    for row, bearing_id in enumerate(bearing_ids):
+        means[row], stds[row] = _model_params(
+            bearing_id, models[bearing_id], feature_names
+        )
+
+    _write_registry(filepath, feature_names, bearing_ids, means, stds)
+
+
+def open_model_registry(filepath: str) -> "FleetModelRegistry":
+    """
+    레지스트리 파일을 엽니다 (파라미터 행렬은 지연 로딩).
+
+    Raises:
+        FileNotFoundError: 파일이 없을 때
+        ValueError: 파일 형식이 올바르지 않거나 잘렸을 때
+    """
+    try:
+        with open(filepath, "rb") as f:
+            raw = f.read(HEADER_SIZE)
+            if len(raw) < HEADER_SIZE:
+                raise ValueError("레지스트리 파일 헤더가 잘렸습니다")
+            magic, version, n_features, n_models, index_size = (
+                _HEADER_STRUCT.unpack_from(raw)
+            )
+            if magic != REGISTRY_MAGIC:
+                raise ValueError(f"모델 레지스트리 형식이 아닙니다: magic={magic!r}")
+            if version != REGISTRY_VERSION:
+                raise ValueError(f"지원하지 않는 레지스트리 버전입니다: {version}")
+            index = json.loads(f.read(index_size).decode("utf-8"))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"레지스트리 파일을 찾을 수 없습니다: {filepath}")
+
+    feature_names = index["feature_names"]
+    bearing_ids = index["bearing_ids"]
+    if len(feature_names) != n_features or len(bearing_ids) != n_models:
+        raise ValueError("레지스트리 인덱스가 헤더와 맞지 않습니다")
+
+    shape = (n_models, n_features)
+    offset = HEADER_SIZE + _aligned(index_size)
+    block_size = n_models * n_features * _PARAM_DTYPE.itemsize
+    if n_models == 0:
+        means = stds = np.empty(shape, dtype=_PARAM_DTYPE)
+    else:
+        try:
+            means = np.memmap(filepath, dtype=_PARAM_DTYPE, mode="c",
+                              offset=offset, shape=shape)
+            stds = np.memmap(filepath, dtype=_PARAM_DTYPE, mode="c",
+                             offset=offset + block_size, shape=shape)
+        except ValueError:
+            raise ValueError("레지스트리 파일의 파라미터 영역이 잘렸습니다")
+
+    return FleetModelRegistry(feature_names, bearing_ids, means, stds)
+
+
+def _model_params(
+    bearing_id: str,
+    model: BearingFailurePredictor,
+    feature_names: Sequence[str],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """모델 하나의 (means, stds) 행을 검증 후 반환합니다."""
+    if not model.is_fitted:
+        raise RuntimeError(f"학습되지 않은 모델은 저장할 수 없습니다: {bearing_id}")
+    if model.feature_names != list(feature_names):
+        raise ValueError(
+            f"레지스트리의 특징 목록과 다른 모델입니다: {bearing_id} "
+            f"({model.feature_names} != {list(feature_names)})"
+        )
+    return model.param_arrays()
+
+
+class FleetModelRegistry:
+    """
+    설비군 베어링 모델 레지스트리
+
+    open_model_registry()로 열고, 베어링 ID로 단일 모델을 꺼내거나
+    여러 베어링의 파라미터를 한 번의 인덱싱으로 모아 점수를 계산합니다.
+    update()는 메모리에만 반영되며 save()로 파일에 기록합니다.
+    """
+
+    def __init__(
+        self,
+        feature_names: Sequence[str],
+        bearing_ids: Sequence[str],
+        means: np.ndarray,
+        stds: np.ndarray,
+    ):
+        """
+        Args:
+            feature_names: 파라미터 열 순서
+            bearing_ids: 파라미터 행 순서
+            means: (n_models, n_features) 평균 행렬
+            stds: (n_models, n_features) 표준편차 행렬
+        """
+        self.feature_names: List[str] = list(feature_names)
+        self._bearing_ids: List[str] = list(bearing_ids)
+        self._rows: Dict[str, int] = {
+            bearing_id: row for row, bearing_id in enumerate(self._bearing_ids)
+        }
+        self._means = means
+        self._stds = stds
+        # 파일에 없던 새 베어링의 파라미터 (save() 전까지 메모리에만 존재).
+        # 용량을 두 배씩 늘리는 배열에 추가하며 앞의 _n_new 행만 유효
+        self._n_new = 0
+        self._new_means = np.empty((0, len(self.feature_names)))
+        self._new_stds = np.empty_like(self._new_means)
+
+    def __len__(self) -> int:
+        return len(self._bearing_ids)
+
+    def __contains__(self, bearing_id: str) -> bool:
+        return bearing_id in self._rows
+
+    @property
+    def bearing_ids(self) -> List[str]:
+        """등록된 베어링 ID 목록 (행 순서)"""
+        return list(self._bearing_ids)
+
+    def _row_indices(self, bearing_ids: Sequence[str]) -> np.ndarray:
+        try:
+            return np.fromiter(
+                (self._rows[b] for b in bearing_ids),
+                dtype=np.intp, count=len(bearing_ids),
+            )
+        except KeyError as e:
+            raise KeyError(f"등록되지 않은 베어링입니다: {e.args[0]}")
+
+    def _append_new(self, means: np.ndarray, stds: np.ndarray) -> None:
+        """새 베어링 행을 추가합니다 (분할 상환 O(1))."""
+        if self._n_new == self._new_means.shape[0]:
+            capacity = max(8, 2 * self._n_new)
+            for name in ("_new_means", "_new_stds"):
+                grown = np.empty((capacity, len(self.feature_names)))
+                grown[:self._n_new] = getattr(self, name)[:self._n_new]
+                setattr(self, name, grown)
+        self._new_means[self._n_new] = means
+        self._new_stds[self._n_new] = stds
+        self._n_new += 1
+
+    def _full_params(self) -> Tuple[np.ndarray, np.ndarray]:
+        """파일 행렬 + 새 베어링 행을 합친 행렬 (새 베어링이 없으면 복사 없음)"""
+        if not self._n_new:
+            return self._means, self._stds
+        return (
+            np.concatenate([self._means, self._new_means[:self._n_new]]),
+            np.concatenate([self._stds, self._new_stds[:self._n_new]]),
+        )
+
+    def params(
+        self, bearing_ids: Sequence[str]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 베어링의 파라미터를 한 번에 모읍니다.
+
+        Args:
+            bearing_ids: 베어링 ID 목록 (중복 허용)
+
+        Returns:
+            (means, stds) 튜플, 각각 (len(bearing_ids), n_features) 배열
+
+        Raises:
+            KeyError: 등록되지 않은 베어링이 있을 때
+        """
+        rows = self._row_indices(bearing_ids)
+        n_base = self._means.shape[0]
+        if not self._n_new or rows.size == 0 or rows.max() < n_base:
+            return self._means[rows], self._stds[rows]
+
+        # 파일 행은 메모리 맵에서, 새 베어링 행은 추가 배열에서 각각 모음
+        means = np.empty((rows.size, len(self.feature_names)))
+        stds = np.empty_like(means)
+        in_file = rows < n_base
+        means[in_file] = self._means[rows[in_file]]
+        stds[in_file] = self._stds[rows[in_file]]
+        new_rows = rows[~in_file] - n_base
+        means[~in_file] = self._new_means[new_rows]
+        stds[~in_file] = self._new_stds[new_rows]
+        return means, stds
+
+    def health_scores(
+        self, bearing_ids: Sequence[str], features: np.ndarray
+    ) -> np.ndarray:
+        """
+        행마다 해당 베어링의 모델로 건강도 점수를 계산합니다.
+
+        Args:
+            bearing_ids: 행별 베어링 ID (n,)
+            features: feature_names 순서의 (n, n_features) 특징 행렬
+
+        Returns:
+            (n,) 건강도 점수 배열
+
+        Raises:
+            KeyError: 등록되지 않은 베어링이 있을 때
+            ValueError: 행렬 모양이 맞지 않을 때
+        """
+        matrix = np.asarray(features, dtype=np.float64)
+        if matrix.shape != (len(bearing_ids), len(self.feature_names)):
+            raise ValueError(
+                f"({len(bearing_ids)}, {len(self.feature_names)}) 행렬이 필요합니다 "
+                f"(특징 순서: {self.feature_names}): shape={matrix.shape}"
+            )
+        means, stds = self.params(bearing_ids)
+        return compute_health_scores(matrix, means, stds)
+
+    def get(self, bearing_id: str) -> BearingFailurePredictor:
+        """
+        베어링 하나의 모델을 복원합니다.
+
+        레지스트리에는 normal_params만 저장되므로 복원된 모델의
+        training_stats는 None입니다 (partial_fit() 불가).
+
+        Raises:
+            KeyError: 등록되지 않은 베어링일 때
+        """
+        means, stds = self.params([bearing_id])
+        model = BearingFailurePredictor(
+            extra_features=self.feature_names[len(BearingFailurePredictor.FEATURE_NAMES):]
+        )
+        model.normal_params = {
+            feature: {"mean": float(mean), "std": float(std)}
+            for feature, mean, std in zip(self.feature_names, means[0], stds[0])
+            if not np.isnan(mean)
+        }
+        model.is_fitted = True
+        model.training_stats = None
+        return model
+
+    def update(self, bearing_id: str, model: BearingFailurePredictor) -> None:
+        """
+        베어링 하나의 모델을 갱신하거나 추가합니다.
+
+        기존 베어링은 copy-on-write 메모리 맵의 해당 행만 바뀌며,
+        save()를 호출하기 전까지 파일에는 기록되지 않습니다.
+
+        Raises:
+            RuntimeError: 학습되지 않은 모델일 때
+            ValueError: feature_names가 레지스트리와 다를 때
+        """
+        means, stds = _model_params(bearing_id, model, self.feature_names)
+        row = self._rows.get(bearing_id)
+        n_base = self._means.shape[0]
+
+        if row is None:
+            self._rows[bearing_id] = len(self._bearing_ids)
+            self._bearing_ids.append(bearing_id)
+            self._append_new(means, stds)
+        elif row < n_base:
+            self._means[row] = means
+            self._stds[row] = stds
+        else:
+            self._new_means[row - n_base] = means
+            self._new_stds[row - n_base] = stds
+
+    def save(self, filepath: str) -> None:
+        """
+        현재 상태(갱신 포함)를 레지스트리 파일로 저장합니다.
+
+        임시 파일에 쓴 뒤 교체하므로 열려 있는 파일 경로에 저장해도 안전합니다.
+        """
+        means, stds = self._full_params()
+        _write_registry(filepath, self.feature_names, self._bearing_ids, means, stds)
@@ -0,0 +1,298 @@
+"""
+스트리밍 잔여 수명(RUL) 추정 모듈
+
+BearingFailurePredictor.predict_rul()은 호출할 때마다 전체 이력으로
+최소제곱 기울기를 다시 계산하므로 새 점수 하나에 O(n)이 듭니다.
+RULTracker는 회귀에 필요한 누적 합만 유지하여 점수마다 O(1)로 갱신하고,
+predict_rul_batch()는 여러 베어링의 이력을 한 번의 배열 연산으로 처리합니다.
+
+창(window) 방식:
+    전체 이력     window=None, halflife=None  → predict_rul(history)와 같음
+    슬라이딩 창   window=k                    → predict_rul(history[-k:])와 같음
+    지수 가중     halflife=h                  → h 단위 전의 점수는 가중치 1/2
+"""
+
+import math
+from collections import deque
+from typing import Deque, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src_bearing_model import (
+    RUL_NOT_DECLINING,
+    BearingFailurePredictor,
+    rul_from_trend,
+)
+
+
+# 기울기 분자를 0으로 볼 반올림 오차 한계 계수 (x 누적 항의 크기 대비)
+_SLOPE_ROUNDING = 64 * np.finfo(np.float64).eps
+
+
+def _validate_window(window: Optional[int], halflife: Optional[float]) -> None:
+    if window is not None and halflife is not None:
+        raise ValueError("window와 halflife는 함께 지정할 수 없습니다")
+    if window is not None and window < 2:
+        raise ValueError("window는 2 이상이어야 합니다")
+    if halflife is not None and not halflife > 0:
+        raise ValueError("halflife는 양수여야 합니다")
+
+
+class RULTracker:
+    """
+    건강도 점수 스트림의 잔여 수명 추정기
+
+    창 안의 점수를 x = 0, 1, ..., n-1 (오래된 순)에 놓은 선형 회귀 기울기를
+    누적 합으로 유지합니다. 지수 가중 모드는 최신 점수를 x = 0에 놓고
+    한 단위 지날 때마다 기존 점수의 가중치와 좌표를 갱신합니다.
+
+    수치 안정성:
+        누적 합은 기준 점수(ref)와의 차이로 유지하므로 평탄한 이력은
+        기울기가 정확히 0입니다. 슬라이딩 창은 창을 빼기 없이 두 블록으로
+        나눕니다. window번 갱신마다 창을 "이전 블록"으로 고정해 접미 합을
+        미리 계산하고(분할 상환 O(1)), 이후 점수는 "새 블록"에 더하기만 합니다.
+        창에서 빠진 점수는 접미 합의 시작 위치만 옮기므로, 이미 빠진 큰 값의
+        반올림 오차가 남지 않습니다.
+    """
+
+    def __init__(
+        self,
+        window: Optional[int] = None,
+        halflife: Optional[float] = None,
+        threshold: float = BearingFailurePredictor.HEALTH_THRESHOLD,
+    ):
+        """
+        Args:
+            window: 슬라이딩 창 크기 (None이면 전체 이력)
+            halflife: 지수 가중 반감기 (시간 단위 수, window와 함께 쓸 수 없음)
+            threshold: 고장 판정 임계값
+
+        Raises:
+            ValueError: 창 설정이 올바르지 않을 때
+        """
+        _validate_window(window, halflife)
+        self.window = window
+        self.halflife = halflife
+        self.threshold = threshold
+
+        self.count: int = 0
+        self.last_score: Optional[float] = None
+        self._decay = 0.5 ** (1.0 / halflife) if halflife is not None else 1.0
+
+        # 누적 합의 기준 점수 (y 대신 y - ref를 누적)
+        self._ref = 0.0
+
+        # 전체 이력/슬라이딩 창: 새 블록 누적 합 (블록 안 위치 i 기준)
+        # 개수, Σdy, Σi·dy, Σ|dy|
+        self._n_new = 0
+        self._sy = 0.0
+        self._siy = 0.0
+        self._sabs = 0.0
+        # 슬라이딩 창: 현재 창 점수와 이전 블록의 접미 합
+        # (_suffix_*[k] = 이전 블록 k번째 이후 점수의 합, 위치는 k 기준)
+        self._scores: Deque[float] = deque()
+        self._n_old = 0
+        self._dropped = 0
+        self._suffix_y: List[float] = [0.0]
+        self._suffix_iy: List[float] = [0.0]
+        self._suffix_abs: List[float] = [0.0]
+
+        # 지수 가중: Σw, Σwx, Σwx², Σwdy, Σwxdy, Σw|dy|, Σw|x||dy|
+        self._w = 0.0
+        self._wx = 0.0
+        self._wxx = 0.0
+        self._wy = 0.0
+        self._wxy = 0.0
+        self._wabs = 0.0
+        self._wxabs = 0.0
+
+    def update(self, score: float) -> None:
+        """새 건강도 점수를 반영합니다 (분할 상환 O(1))."""
+        if self.count == 0:
+            self._ref = score
+        dy = score - self._ref
+
+        if self.halflife is not None:
+            # 기존 점수: 가중치 x decay, 좌표 x - 1 (최신 점수가 x = 0)
+            d = self._decay
+            self._wxx = d * (self._wxx - 2.0 * self._wx + self._w)
+            self._wxy = d * (self._wxy - self._wy)
+            self._wxabs = d * (self._wxabs + self._wabs)
+            self._wx = d * (self._wx - self._w)
+            self._w *= d
+            self._wy *= d
+            self._wabs *= d
+            self._w += 1.0
+            self._wy += dy
+            self._wabs += abs(dy)
+        else:
+            if self.window is not None:
+                if len(self._scores) == self.window:
+                    # 가장 오래된 점수는 항상 이전 블록에 있음 (window번마다 재구성)
+                    self._scores.popleft()
+                    self._dropped += 1
+                self._scores.append(score)
+            self._siy += self._n_new * dy
+            self._sy += dy
+            self._sabs += abs(dy)
+            self._n_new += 1
+
+        self.count += 1
+        self.last_score = score
+
+        if self.window is not None and self.count % self.window == 0:
+            self._freeze_window()
+
+    def _freeze_window(self) -> None:
+        """현재 창을 이전 블록으로 고정하고 접미 합을 계산합니다 (기준은 최신 점수)."""
+        self._ref = self.last_score
+        diffs = [y - self._ref for y in self._scores]
+        n = len(diffs)
+
+        suffix_y = [0.0] * (n + 1)
+        suffix_iy = [0.0] * (n + 1)
+        suffix_abs = [0.0] * (n + 1)
+        for k in range(n - 1, -1, -1):
+            # 위치를 k 기준으로 맞추면 k+1 이후 점수의 위치가 1씩 늘어남
+            suffix_iy[k] = suffix_iy[k + 1] + suffix_y[k + 1]
+            suffix_y[k] = suffix_y[k + 1] + diffs[k]
+            suffix_abs[k] = suffix_abs[k + 1] + abs(diffs[k])
+
+        self._suffix_y, self._suffix_iy, self._suffix_abs = (
+            suffix_y, suffix_iy, suffix_abs
+        )
+        self._n_old = n
+        self._dropped = 0
+        self._n_new = 0
+        self._sy = self._siy = self._sabs = 0.0
+
+    def _window_sums(self) -> Tuple[float, float, float, float]:
+        """현재 창의 (n, Σdy, Σx·dy, Σ|dy|) (x = 0..n-1)"""
+        k = self._dropped
+        n_old = self._n_old - k
+        return (
+            n_old + self._n_new,
+            self._suffix_y[k] + self._sy,
+            self._suffix_iy[k] + self._siy + n_old * self._sy,
+            self._suffix_abs[k] + self._sabs,
+        )
+
+    def slope(self) -> float:
+        """
+        현재 창의 건강도 기울기 (시간 단위당 변화량)
+
+        분자가 누적 합의 반올림 오차 한계 이내이면 0으로 봅니다.
+
+        Raises:
+            ValueError: 점수가 2개 미만일 때
+        """
+        if self.count < 2:
+            raise ValueError("RUL 예측에는 최소 2개의 건강도 이력이 필요합니다")
+
+        if self.halflife is not None:
+            numerator = self._w * self._wxy - self._wx * self._wy
+            tolerance = _SLOPE_ROUNDING * (
+                self._w * self._wxabs + abs(self._wx) * self._wabs
+            )
+            denominator = self._w * self._wxx - self._wx * self._wx
+        else:
+            n, sy, sxy, sabs = self._window_sums()
+            # x = 0..n-1이면 Σx, Σ(x - x̄)²는 닫힌 식으로 계산
+            x_mean = (n - 1.0) / 2.0
+            numerator = sxy - x_mean * sy
+            tolerance = _SLOPE_ROUNDING * n * sabs
+            denominator = n * (n * n - 1.0) / 12.0
+
+        if abs(numerator) <= tolerance:
+            return 0.0
+        return numerator / denominator
+
+    def estimate(self) -> float:
+        """
+        현재 잔여 수명을 추정합니다 (predict_rul()과 같은 규칙).
+
+        Returns:
+            잔여 수명 (남은 시간 단위 수)
+
+        Raises:
+            ValueError: 점수가 2개 미만일 때
+        """
+        slope = self.slope()
+        return rul_from_trend(self.last_score, slope, self.threshold)
+
+
+def predict_rul_batch(
+    histories: Union[np.ndarray, Sequence[Sequence[float]]],
+    window: Optional[int] = None,
+    halflife: Optional[float] = None,
+    threshold: float = BearingFailurePredictor.HEALTH_THRESHOLD,
+) -> np.ndarray:
+    """
+    여러 베어링의 잔여 수명을 한 번에 추정합니다.
+
+    행마다 RULTracker에 이력을 순서대로 넣은 결과와 같습니다.
+
+    Args:
+        histories: (n_bearings, length) 배열 또는 길이가 다른 이력 리스트.
+            배열이면 각 행의 NaN은 끝부분 패딩으로 간주
+        window: 슬라이딩 창 크기 (None이면 전체 이력)
+        halflife: 지수 가중 반감기 (window와 함께 쓸 수 없음)
+        threshold: 고장 판정 임계값
+
+    Returns:
+        (n_bearings,) 잔여 수명 배열. 이력이 2개 미만인 행은 NaN
+
+    Raises:
+        ValueError: 창 설정이나 입력 모양이 올바르지 않을 때
+    """
+    _validate_window(window, halflife)
+
+    if isinstance(histories, np.ndarray):
+        scores = histories.astype(np.float64, copy=False)
+    else:
+        length = max((len(h) for h in histories), default=0)
+        scores = np.full((len(histories), length), np.nan)
+        for row, history in enumerate(histories):
+            scores[row, :len(history)] = history
+    if scores.ndim != 2:
+        raise ValueError(f"2차원 이력 배열이 필요합니다: shape={scores.shape}")
+
+    n_rows, length = scores.shape
+    if length == 0:
+        return np.full(n_rows, np.nan)
+    valid = ~np.isnan(scores)
+    lengths = valid.sum(axis=1)
+    cols = np.arange(length)
+
+    # 최신 점수가 x = 0이 되는 좌표 (오래될수록 음수)
+    x = (cols - (lengths[:, np.newaxis] - 1)).astype(np.float64)
+    if halflife is not None:
+        weights = np.where(valid, 0.5 ** (-x / halflife), 0.0)
+    elif window is not None:
+        weights = (valid & (x > -window)).astype(np.float64)
+    else:
+        weights = valid.astype(np.float64)
+
+    # 행마다 x는 가중 평균, y는 최신 점수를 기준으로 중심화
+    # (평탄한 이력은 dy가 정확히 0이므로 기울기도 정확히 0)
+    current = scores[np.arange(n_rows), np.maximum(lengths - 1, 0)]
+    dy = np.where(valid, scores - current[:, np.newaxis], 0.0)
+    w = weights.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_mean = (weights * x).sum(axis=1) / w
+    dx = np.where(weights > 0, x - x_mean[:, np.newaxis], 0.0)
+
+    wdx = weights * dx
+    numerator = (wdx * dy).sum(axis=1)
+    tolerance = _SLOPE_ROUNDING * (np.abs(wdx) * np.abs(dy)).sum(axis=1)
+    numerator[np.abs(numerator) <= tolerance] = 0.0
+
+    enough = lengths >= 2
+    denominator = np.where(enough, (wdx * dx).sum(axis=1), 1.0)
+    slope = numerator / denominator
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rul = np.maximum((threshold - current) / slope, 0.0)
+    rul = np.where(slope >= 0, RUL_NOT_DECLINING, rul)
+    rul = np.where(current <= threshold, 0.0, rul)
+    return np.where(enough, rul, np.nan)
@@ -0,0 +1,212 @@
+"""
+베어링 결함 주파수 인덱스 테스트 모듈
+
+src_bearing_geometry의 결함 주파수 계산, 빈 인덱스 캐시,
+설비군 결함 대역 에너지 gather를 테스트합니다.
+"""
+
+import numpy as np
+import pytest
+from src_bearing_geometry import (
+    DEFECT_FEATURE_NAMES,
+    BearingGeometry,
+    BearingGeometryRegistry,
+    defect_band_bins,
+    rpm_bucket,
+)
+
+
+# SKF 6205-2RS (CWRU 베어링 데이터셋의 구동단 베어링)
+SKF_6205 = BearingGeometry(n_balls=9, ball_diameter=7.94, pitch_diameter=39.04)
+
+N_FFT = 4096
+SAMPLE_RATE = 12000.0
+
+
+@pytest.fixture
+def registry():
+    """6205와 6203이 등록된 레지스트리"""
+    reg = BearingGeometryRegistry()
+    reg.register("6205", SKF_6205)
+    reg.register("6203", BearingGeometry(8, 6.75, 28.5))
+    return reg
+
+
+class TestBearingGeometry:
+    """베어링 형상과 결함 주파수 배수 테스트"""
+
+    def test_6205_결함_배수(self):
+        """알려진 6205 결함 주파수 배수와 일치"""
+        orders = SKF_6205.defect_orders()
+
+        assert orders["bpfo"] == pytest.approx(3.5848, abs=1e-4)
+        assert orders["bpfi"] == pytest.approx(5.4152, abs=1e-4)
+        assert orders["bsf"] == pytest.approx(2.3568, abs=1e-4)
+        assert orders["ftf"] == pytest.approx(0.3983, abs=1e-4)
+
+    def test_BPFO_BPFI_합(self):
+        """BPFO + BPFI = 전동체 수 (접촉각과 무관)"""
+        orders = BearingGeometry(12, 10.0, 60.0, contact_angle=15.0).defect_orders()
+        assert orders["bpfo"] + orders["bpfi"] == pytest.approx(12.0)
+
+    @pytest.mark.parametrize("args", [(0, 7.0, 39.0), (9, 40.0, 39.0), (9, 0.0, 39.0)])
+    def test_잘못된_형상(self, args):
+        """전동체 수/지름이 올바르지 않으면 ValueError"""
+        with pytest.raises(ValueError):
+            BearingGeometry(*args)
+
+
+class TestRegistry:
+    """레지스트리 등록/조회 테스트"""
+
+    def test_조회(self, registry):
+        assert registry.get("6205") is SKF_6205
+        assert "6205" in registry and "6301" not in registry
+
+    def test_미등록_베어링(self, registry):
+        with pytest.raises(KeyError, match="등록되지 않은"):
+            registry.get("6301")
+
+    def test_다른_형상_재등록_에러(self, registry):
+        """같은 형상 재등록은 허용, 다른 형상은 ValueError"""
+        registry.register("6205", BearingGeometry(9, 7.94, 39.04))
+        with pytest.raises(ValueError, match="이미 다른 형상"):
+            registry.register("6205", BearingGeometry(8, 7.94, 39.04))
+
+    def test_고조파_주파수(self, registry):
+        """1800 rpm(30 Hz)에서 고조파는 기본 주파수의 정수배"""
+        freqs = registry.defect_frequencies("6205", 1800.0)
+        assert freqs["bpfo"][0] == pytest.approx(3.5848 * 30.0, abs=1e-2)
+        assert freqs["bpfo"][2] == pytest.approx(3 * freqs["bpfo"][0])
+
+
+class TestBandBins:
+    """결함 대역 빈 인덱스 캐시 테스트"""
+
+    def test_중심_빈_포함(self, registry):
+        """각 고조파 중심 주파수의 빈이 인덱스에 포함"""
+        bins = registry.band_bins("6205", 1797.0, N_FFT, SAMPLE_RATE)
+        freqs = registry.defect_frequencies("6205", 1800.0)
+        df = SAMPLE_RATE / N_FFT
+
+        for defect, centers in freqs.items():
+            for center in centers:
+                assert int(round(center / df)) in bins[defect]
+
+    def test_같은_회전수_구간은_캐시_공유(self, registry):
+        """구간 안의 회전수는 같은 (읽기 전용) 배열 객체를 반환"""
+        a = registry.band_bins("6205", 1797.0, N_FFT, SAMPLE_RATE)
+        b = registry.band_bins("6205", 1802.0, N_FFT, SAMPLE_RATE)
+
+        assert rpm_bucket(1797.0) == rpm_bucket(1802.0)
+        assert a["bpfo"] is b["bpfo"]
+        assert not a["bpfo"].flags.writeable
+
+    def test_구간_0으로_반올림되는_회전수(self):
+        """회전 주파수 0 Hz 구간은 DC 빈으로 뭉개지므로 ValueError"""
+        with pytest.raises(ValueError, match="너무 낮아"):
+            rpm_bucket(3.0)
+        with pytest.raises(ValueError, match="1 이상"):
+            defect_band_bins(SKF_6205, 0, N_FFT, SAMPLE_RATE)
+
+    def test_FFT_크기별_캐시(self, registry):
+        """FFT 크기가 다르면 별도 항목"""
+        defect_band_bins.cache_clear()
+        registry.band_bins("6205", 1800.0, 1024, SAMPLE_RATE)
+        registry.band_bins("6205", 1800.0, 4096, SAMPLE_RATE)
+        registry.band_bins("6205", 1800.0, 4096, SAMPLE_RATE)
+
+        info = defect_band_bins.cache_info()
+        assert info.misses == 2 and info.hits == 1
+
+    def test_나이퀴스트_초과_고조파_제외(self, registry):
+        """샘플링 주파수가 낮으면 높은 고조파 빈이 없음"""
+        bins = registry.band_bins("6205", 1800.0, 256, 400.0)
+        assert bins["bpfi"].size > 0
+        assert bins["bpfi"].max() <= 128
+
+    @pytest.mark.parametrize("n_fft, sample_rate, rpm", [
+        (1024, 25600.0, 1800.0),  # FTF 11.9 Hz < 빈 간격 25 Hz
+        (N_FFT, SAMPLE_RATE, 60.0),
+    ])
+    def test_DC_빈_제외(self, registry, n_fft, sample_rate, rpm):
+        """분해능이 낮거나 회전수가 낮아도 DC 빈은 결함 대역에 들어가지 않음"""
+        bins = registry.band_bins("6205", rpm, n_fft, sample_rate)
+        freqs = registry.defect_frequencies("6205", rpm)
+        df = sample_rate / n_fft
+
+        for defect, indices in bins.items():
+            assert 0 not in indices
+            # 한 빈 이상 떨어진 고조파는 그대로 포함
+            for center in freqs[defect]:
+                if df <= center <= sample_rate / 2:
+                    assert int(round(center / df)) in indices
+
+    @pytest.mark.parametrize("kwargs", [
+        {"rpm": 0.0}, {"rpm": 3.0}, {"n_fft": 0}, {"sample_rate": -1.0},
+    ])
+    def test_잘못된_인자(self, registry, kwargs):
+        args = {"rpm": 1800.0, "n_fft": N_FFT, "sample_rate": SAMPLE_RATE}
+        args.update(kwargs)
+        with pytest.raises(ValueError):
+            registry.band_bins("6205", **args)
+
+
+class TestBandEnergies:
+    """결함 대역 에너지 gather 테스트"""
+
+    @pytest.fixture
+    def fleet_psd(self):
+        """유닛 4대의 PSD (n_units, n_fft // 2 + 1)"""
+        rng = np.random.default_rng(3)
+        return rng.random((4, N_FFT // 2 + 1)) * 1e-4
+
+    def test_BPFO_피크_검출(self, registry):
+        """BPFO 주파수에 피크를 넣으면 bpfo 에너지가 가장 큼"""
+        psd = np.full(N_FFT // 2 + 1, 1e-6)
+        bpfo_hz = registry.defect_frequencies("6205", 1800.0)["bpfo"][0]
+        psd[int(round(bpfo_hz * N_FFT / SAMPLE_RATE))] = 1.0
+
+        energies = registry.band_energies(psd, "6205", 1800.0, N_FFT, SAMPLE_RATE)
+
+        assert set(energies) == set(DEFECT_FEATURE_NAMES)
+        assert isinstance(energies["bpfo_energy"], float)
+        assert max(energies, key=energies.get) == "bpfo_energy"
+
+    def test_설비군_결과가_유닛별_계산과_일치(self, registry, fleet_psd):
+        """gather 결과가 유닛별 인덱스 합과 같음"""
+        bearings = ["6205", "6203", "6205", "6203"]
+        rpms = [1800.0, 1500.0, 1200.0, 3600.0]
+        df = SAMPLE_RATE / N_FFT
+
+        fleet = registry.band_energies(
+            fleet_psd, bearings, rpms, N_FFT, SAMPLE_RATE)
+
+        for i, (name, rpm) in enumerate(zip(bearings, rpms)):
+            bins = registry.band_bins(name, rpm, N_FFT, SAMPLE_RATE)
+            for defect, feature in zip(bins, DEFECT_FEATURE_NAMES):
+                expected = fleet_psd[i, bins[defect]].sum() * df
+                assert fleet[feature][i] == pytest.approx(expected)
+
+    def test_단일_베어링명_브로드캐스트(self, registry, fleet_psd):
+        """베어링명과 회전수가 하나면 모든 유닛에 적용"""
+        a = registry.band_energies(fleet_psd, "6205", 1800.0, N_FFT, SAMPLE_RATE)
+        b = registry.band_energies(
+            fleet_psd, ["6205"] * 4, [1800.0] * 4, N_FFT, SAMPLE_RATE)
+        np.testing.assert_array_equal(a["bsf_energy"], b["bsf_energy"])
+
+    def test_유닛_0대(self, registry):
+        """유닛이 없으면 빈 배열"""
+        energies = registry.band_energies(
+            np.zeros((0, N_FFT // 2 + 1)), [], [], N_FFT, SAMPLE_RATE)
+        assert set(energies) == set(DEFECT_FEATURE_NAMES)
+        assert all(e.shape == (0,) for e in energies.values())
+
+    def test_PSD_크기_불일치(self, registry):
+        with pytest.raises(ValueError, match="PSD 크기"):
+            registry.band_energies(np.zeros(100), "6205", 1800.0, N_FFT, SAMPLE_RATE)
+
+    def test_유닛_수_불일치(self, registry, fleet_psd):
+        with pytest.raises(ValueError, match="유닛 수"):
+            registry.band_energies(
+                fleet_psd, ["6205"] * 3, 1800.0, N_FFT, SAMPLE_RATE)
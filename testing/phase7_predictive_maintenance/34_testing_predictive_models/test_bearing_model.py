@@ -2,18 +2,27 @@
 베어링 고장 예측 모델 테스트 모듈
 
 BearingFailurePredictor 클래스의 전체 ML 파이프라인을 테스트합니다:
-- 모델 학습 (fit)
+- 모델 학습 (fit, partial_fit)
 - 건강도 예측 (predict_health_score)
 - 잔여 수명 예측 (predict_rul)
-- 모델 평가 (evaluate)
+- 모델 평가 (evaluate, evaluate_thresholds)
 - 모델 저장/로딩 (save_model / load_model)
 - 결정론적 테스트 (fixed seed)
 - 성능 임계값 테스트 (regression test)
 """
 
+import json
+import numpy as np
 import pytest
 import random
-from src_bearing_model import BearingFailurePredictor, HealthMetrics
+import statistics
+from src_bearing_model import (
+    BearingFailurePredictor,
+    FeatureMoments,
+    HealthMetrics,
+    TrainingStatistics,
+    threshold_sweep,
+)
 
 
 # ============================================================
@@ -139,6 +148,160 @@ class TestPredictHealthScore:
         assert score_slight > score_moderate > score_severe
 
 
+# ============================================================
+# 증분 학습 / 통계 병합 테스트
+# ============================================================
+
+class TestPartialFit:
+    """partial_fit()과 샤드 통계 병합 테스트"""
+
+    def assert_same_params(self, a, b):
+        assert a.keys() == b.keys()
+        for feature in a:
+            assert a[feature]["mean"] == pytest.approx(b[feature]["mean"], rel=1e-12)
+            assert a[feature]["std"] == pytest.approx(b[feature]["std"], rel=1e-12)
+
+    def test_분할_학습이_전체_학습과_일치(self, fitted_model, mixed_training_data):
+        """나눠서 partial_fit()해도 fit()과 같은 파라미터"""
+        model = BearingFailurePredictor()
+        for start in range(0, len(mixed_training_data), 7):
+            model.partial_fit(mixed_training_data[start:start + 7])
+
+        assert model.is_fitted
+        self.assert_same_params(model.normal_params, fitted_model.normal_params)
+
+    def test_샤드_통계_병합(self, fitted_model, mixed_training_data):
+        """서로 겹치지 않는 샤드의 통계를 합치면 전체 학습과 같음"""
+        shards = [mixed_training_data[i::3] for i in range(3)]
+        stats = [
+            TrainingStatistics.from_data(shard, BearingFailurePredictor.FEATURE_NAMES)
+            for shard in shards
+        ]
+
+        model = BearingFailurePredictor()
+        model.merge_statistics(stats[0].merge(stats[1]).merge(stats[2]))
+
+        self.assert_same_params(model.normal_params, fitted_model.normal_params)
+
+    def test_statistics_모듈과_일치(self):
+        """FeatureMoments가 statistics.mean/stdev와 같은 값"""
+        random.seed(7)
+        values = [random.gauss(1e6, 1.0) for _ in range(500)]
+        merged = FeatureMoments.from_values(values[:123]).merge(
+            FeatureMoments.from_values(values[123:]))
+
+        assert merged.count == 500
+        assert merged.mean == pytest.approx(statistics.mean(values), rel=1e-12)
+        assert merged.std == pytest.approx(statistics.stdev(values), rel=1e-6)
+
+    def test_빈_통계는_항등원(self):
+        m = FeatureMoments.from_values([1.0, 2.0, 4.0])
+        assert m.merge(FeatureMoments()) == m
+        assert FeatureMoments().merge(m) == m
+
+    def test_정상_데이터_부족시_미학습(self):
+        """누적 정상 데이터가 2개가 될 때 학습 완료"""
+        model = BearingFailurePredictor()
+        row = {"rms": 0.5, "kurtosis": 0.2, "crest_factor": 1.4, "label": "normal"}
+
+        model.partial_fit([row, dict(row, label="fault")])
+        assert not model.is_fitted
+
+        model.partial_fit([dict(row, rms=0.6)])
+        assert model.is_fitted
+        assert model.normal_params["rms"]["mean"] == pytest.approx(0.55)
+
+    def test_저장_로딩후_증분_학습(self, mixed_training_data, tmp_path):
+        """저장된 누적 통계로 이어서 학습"""
+        half = len(mixed_training_data) // 2
+        model = BearingFailurePredictor()
+        model.fit(mixed_training_data[:half])
+        filepath = str(tmp_path / "model.json")
+        model.save_model(filepath)
+
+        loaded = BearingFailurePredictor()
+        loaded.load_model(filepath)
+        loaded.partial_fit(mixed_training_data[half:])
+
+        full = BearingFailurePredictor()
+        full.fit(mixed_training_data)
+        self.assert_same_params(loaded.normal_params, full.normal_params)
+
+    def test_통계_없는_모델_파일은_증분_학습_불가(self, fitted_model, tmp_path):
+        """예전 형식(통계 없음) 파일은 로딩되지만 partial_fit()은 에러"""
+        filepath = tmp_path / "old_model.json"
+        filepath.write_text(json.dumps({
+            "is_fitted": True, "normal_params": fitted_model.normal_params,
+        }))
+
+        loaded = BearingFailurePredictor()
+        loaded.load_model(str(filepath))
+
+        with pytest.raises(RuntimeError, match="누적 통계가 없는"):
+            loaded.partial_fit([{"rms": 0.5, "label": "normal"}])
+
+
+# ============================================================
+# 배치 건강도 예측 테스트
+# ============================================================
+
+class TestPredictHealthScores:
+    """predict_health_scores() 배치 API 테스트"""
+
+    def test_단건_결과와_일치(self, fitted_model, test_data_with_labels):
+        """행마다 predict_health_score()와 같은 점수"""
+        test_data, _ = test_data_with_labels
+        scores = fitted_model.predict_health_scores(
+            fitted_model.to_feature_matrix(test_data))
+
+        expected = [fitted_model.predict_health_score(f) for f in test_data]
+        np.testing.assert_allclose(scores, expected, rtol=1e-12)
+
+    def test_누락_특징은_NaN으로_제외(self, fitted_model, normal_features):
+        """없는 특징(NaN)은 단건 경로처럼 평균에서 제외"""
+        partial = {"rms": normal_features["rms"]}
+        matrix = fitted_model.to_feature_matrix([partial])
+
+        assert np.isnan(matrix[0, 1:]).all()
+        assert fitted_model.predict_health_scores(matrix)[0] == pytest.approx(
+            fitted_model.predict_health_score(partial))
+
+    def test_NaN_특징은_단건_경로에서도_제외(self, fitted_model):
+        """NaN 값은 단건/배치 모두 없는 특징과 같이 처리"""
+        row = {"rms": float("nan"), "kurtosis": 0.2, "crest_factor": 1.4}
+
+        scalar = fitted_model.predict_health_score(row)
+
+        assert scalar == pytest.approx(fitted_model.predict_health_score(
+            {"kurtosis": 0.2, "crest_factor": 1.4}))
+        assert fitted_model.predict_health_scores(
+            np.array([[np.nan, 0.2, 1.4]]))[0] == pytest.approx(scalar)
+        assert fitted_model.predict_health_score(
+            {f: float("nan") for f in fitted_model.feature_names}) == 50.0
+
+    def test_특징이_모두_없으면_50점(self, fitted_model):
+        """사용할 특징이 없는 행은 중간값"""
+        matrix = np.full((2, 3), np.nan)
+        assert fitted_model.predict_health_scores(matrix).tolist() == [50.0, 50.0]
+
+    def test_특징_순서는_feature_names(self, fitted_model, normal_features, fault_features):
+        """열 순서는 feature_names 순서"""
+        matrix = np.array([
+            [row[f] for f in fitted_model.feature_names]
+            for row in (normal_features, fault_features)
+        ])
+        healthy, faulty = fitted_model.predict_health_scores(matrix)
+        assert healthy > 70.0 and faulty < 50.0
+
+    def test_열_수_불일치(self, fitted_model):
+        with pytest.raises(ValueError, match="행렬이 필요합니다"):
+            fitted_model.predict_health_scores(np.zeros((4, 2)))
+
+    def test_미학습_모델_에러(self, model):
+        with pytest.raises(RuntimeError, match="학습되지 않았습니다"):
+            model.predict_health_scores(np.zeros((1, 3)))
+
+
 # ============================================================
 # RUL 예측 테스트
 # ============================================================
@@ -246,6 +409,75 @@ class TestEvaluate:
             fitted_model.evaluate(test_data, true_labels)
 
 
+# ============================================================
+# 임계값 스윕(ROC/PR) 평가 테스트
+# ============================================================
+
+class TestEvaluateThresholds:
+    """evaluate_thresholds() / threshold_sweep() 테스트"""
+
+    @pytest.mark.parametrize("threshold", [30.0, 50.0, 70.0, 90.0])
+    def test_임계값별_evaluate와_일치(self, fitted_model, test_data_with_labels,
+                                  threshold, monkeypatch):
+        """스윕 결과가 임계값마다 evaluate()를 실행한 결과와 같음"""
+        test_data, true_labels = test_data_with_labels
+        sweep = fitted_model.evaluate_thresholds(test_data, true_labels)
+
+        monkeypatch.setattr(fitted_model, "HEALTH_THRESHOLD", threshold)
+        expected = fitted_model.evaluate(test_data, true_labels)
+
+        assert sweep.metrics_at(threshold) == pytest.approx(expected)
+
+    def test_누적_개수(self):
+        """같은 점수는 한 임계값으로 묶이고 개수는 누적"""
+        sweep = threshold_sweep(
+            [10.0, 40.0, 40.0, 80.0, 95.0],
+            [True, True, False, False, False],
+        )
+
+        assert sweep.thresholds.tolist() == [10.0, 40.0, 80.0, 95.0]
+        assert sweep.tp.tolist() == [1, 2, 2, 2]
+        assert sweep.fp.tolist() == [0, 1, 2, 3]
+        assert sweep.tn.tolist() == [3, 2, 1, 0]
+        assert sweep.recall.tolist() == [0.5, 1.0, 1.0, 1.0]
+        assert sweep.precision.tolist() == pytest.approx([1.0, 2 / 3, 0.5, 0.4])
+
+    def test_최적_임계값(self):
+        """F1 최대 임계값과 해당 지표"""
+        sweep = threshold_sweep(
+            [10.0, 20.0, 30.0, 60.0, 70.0, 80.0],
+            [True, True, True, False, False, False],
+        )
+        threshold, metrics = sweep.best_threshold("f1")
+
+        assert threshold == 30.0
+        assert metrics == HealthMetrics(accuracy=1.0, precision=1.0, recall=1.0, f1=1.0)
+        assert sweep.best_threshold("youden")[0] == 30.0
+        assert sweep.roc_auc() == pytest.approx(1.0)
+
+    def test_최소_점수보다_낮은_임계값(self):
+        """고장으로 예측한 샘플이 없으면 precision/recall 0"""
+        sweep = threshold_sweep([10.0, 90.0], [True, False])
+        assert sweep.metrics_at(5.0) == HealthMetrics(
+            accuracy=0.5, precision=0.0, recall=0.0, f1=0.0)
+
+    def test_무작위_점수의_AUC(self):
+        """점수가 라벨과 무관하면 AUC ≈ 0.5"""
+        rng = np.random.default_rng(0)
+        sweep = threshold_sweep(rng.random(20000), rng.random(20000) < 0.3)
+        assert sweep.roc_auc() == pytest.approx(0.5, abs=0.02)
+
+    def test_지원하지_않는_지표(self):
+        sweep = threshold_sweep([10.0, 90.0], [True, False])
+        with pytest.raises(ValueError, match="지원하지 않는 지표"):
+            sweep.best_threshold("auc")
+
+    def test_미학습_모델_에러(self, model, test_data_with_labels):
+        test_data, true_labels = test_data_with_labels
+        with pytest.raises(RuntimeError, match="학습되지 않았습니다"):
+            model.evaluate_thresholds(test_data, true_labels)
+
+
 # ============================================================
 # 모델 저장/로딩 테스트
 # ============================================================
@@ -322,6 +554,64 @@ class TestSaveLoad:
             model.load_model(str(filepath))
 
 
+# ============================================================
+# 추가 특징(결함 대역 에너지) 테스트
+# ============================================================
+
+class TestExtraFeatures:
+    """결함 대역 에너지를 추가 특징으로 선택하는 테스트"""
+
+    @pytest.fixture
+    def band_training_data(self, mixed_training_data):
+        """bpfo_energy가 포함된 학습 데이터 (고장은 에너지가 큼)"""
+        random.seed(44)
+        return [
+            dict(row, bpfo_energy=(
+                1e-3 if row["label"] == "normal" else 5e-2
+            ) * (1 + random.gauss(0, 0.1)))
+            for row in mixed_training_data
+        ]
+
+    def test_기본_특징_목록(self, model):
+        """추가 특징이 없으면 FEATURE_NAMES와 같음"""
+        assert model.feature_names == BearingFailurePredictor.FEATURE_NAMES
+
+    def test_추가_특징_학습(self, band_training_data):
+        """선택한 추가 특징도 mean/std를 학습"""
+        model = BearingFailurePredictor(extra_features=["bpfo_energy"])
+        model.fit(band_training_data)
+
+        assert model.feature_names[-1] == "bpfo_energy"
+        assert model.normal_params["bpfo_energy"]["mean"] == pytest.approx(
+            1e-3, rel=0.1)
+
+    def test_추가_특징이_점수에_반영(self, band_training_data, normal_features):
+        """결함 대역 에너지만 커져도 건강도가 낮아짐"""
+        model = BearingFailurePredictor(extra_features=["bpfo_energy"])
+        model.fit(band_training_data)
+
+        healthy = model.predict_health_score(dict(normal_features, bpfo_energy=1e-3))
+        defect = model.predict_health_score(dict(normal_features, bpfo_energy=5e-2))
+
+        assert defect < healthy
+
+    def test_지원하지_않는_추가_특징(self):
+        with pytest.raises(ValueError, match="지원하지 않는 추가 특징"):
+            BearingFailurePredictor(extra_features=["spectral_entropy"])
+
+    def test_저장_로딩시_특징_목록_복원(self, band_training_data, tmp_path):
+        """feature_names가 모델 파일과 함께 복원됨"""
+        model = BearingFailurePredictor(extra_features=["bpfo_energy", "bpfi_energy"])
+        model.fit(band_training_data)
+        filepath = str(tmp_path / "model.json")
+        model.save_model(filepath)
+
+        loaded = BearingFailurePredictor()
+        loaded.load_model(filepath)
+
+        assert loaded.feature_names == model.feature_names
+
+
 # ============================================================
 # 결정론적(deterministic) 테스트
 # ============================================================
@@ -0,0 +1,242 @@
+"""
+설비군 모델 레지스트리 테스트 모듈
+
+src_model_registry의 저장, 지연 로딩, copy-on-write 갱신,
+여러 베어링의 벡터화된 파라미터 조회를 테스트합니다.
+"""
+
+import numpy as np
+import pytest
+import random
+from src_bearing_model import BearingFailurePredictor
+from src_model_registry import (
+    HEADER_SIZE,
+    open_model_registry,
+    write_model_registry,
+)
+
+
+def make_model(seed, rms_mean=0.5, extra_features=None):
+    """시드로 정상 데이터를 만들어 학습한 모델"""
+    random.seed(seed)
+    data = [
+        {
+            "rms": rms_mean + random.gauss(0, 0.05),
+            "kurtosis": 0.2 + random.gauss(0, 0.03),
+            "crest_factor": 1.4 + random.gauss(0, 0.05),
+            "bpfo_energy": 1e-3 * (1 + random.gauss(0, 0.1)),
+            "label": "normal",
+        }
+        for _ in range(20)
+    ]
+    model = BearingFailurePredictor(extra_features=extra_features)
+    model.fit(data)
+    return model
+
+
+@pytest.fixture
+def fleet_models():
+    """베어링 ID → 학습된 모델 (베어링마다 rms 정상값이 다름)"""
+    return {
+        f"B{i:03d}": make_model(seed=i, rms_mean=0.5 + 0.1 * i)
+        for i in range(5)
+    }
+
+
+@pytest.fixture
+def registry_path(tmp_path, fleet_models):
+    """fleet_models가 저장된 레지스트리 파일 경로"""
+    path = str(tmp_path / "fleet.bmr")
+    write_model_registry(path, fleet_models)
+    return path
+
+
+class TestWriteAndOpen:
+    """write_model_registry() → open_model_registry() 왕복 테스트"""
+
+    def test_인덱스_복원(self, registry_path, fleet_models):
+        registry = open_model_registry(registry_path)
+
+        assert len(registry) == 5
+        assert registry.bearing_ids == list(fleet_models)
+        assert registry.feature_names == BearingFailurePredictor.FEATURE_NAMES
+        assert "B003" in registry and "B999" not in registry
+
+    def test_메모리_맵_지연_로딩(self, registry_path):
+        """파라미터 행렬은 copy-on-write 메모리 맵"""
+        registry = open_model_registry(registry_path)
+        assert isinstance(registry._means, np.memmap)
+        assert registry._means.mode == "c"
+
+    def test_단일_모델_복원(self, registry_path, fleet_models, normal_features):
+        """복원한 모델이 원본과 같은 점수"""
+        registry = open_model_registry(registry_path)
+        loaded = registry.get("B002")
+
+        assert loaded.is_fitted
+        assert loaded.normal_params == fleet_models["B002"].normal_params
+        assert loaded.predict_health_score(normal_features) == pytest.approx(
+            fleet_models["B002"].predict_health_score(normal_features))
+
+    def test_추가_특징_모델(self, tmp_path):
+        """추가 특징이 있는 모델도 특징 목록과 함께 복원"""
+        path = str(tmp_path / "fleet.bmr")
+        model = make_model(0, extra_features=["bpfo_energy"])
+        write_model_registry(path, {"B000": model})
+
+        loaded = open_model_registry(path).get("B000")
+        assert loaded.feature_names == model.feature_names
+        assert loaded.normal_params["bpfo_energy"] == pytest.approx(
+            model.normal_params["bpfo_energy"])
+
+    def test_빈_레지스트리(self, tmp_path):
+        path = str(tmp_path / "empty.bmr")
+        write_model_registry(path, {})
+        assert len(open_model_registry(path)) == 0
+
+
+class TestVectorizedAccess:
+    """여러 베어링 파라미터의 벡터화 조회 테스트"""
+
+    def test_파라미터_모으기(self, registry_path, fleet_models):
+        """요청 순서대로 (k, n_features) 행렬 반환 (중복 허용)"""
+        registry = open_model_registry(registry_path)
+        ids = ["B004", "B001", "B004"]
+
+        means, stds = registry.params(ids)
+
+        assert means.shape == (3, 3)
+        for row, bearing_id in enumerate(ids):
+            expected_means, expected_stds = fleet_models[bearing_id].param_arrays()
+            np.testing.assert_allclose(means[row], expected_means)
+            np.testing.assert_allclose(stds[row], expected_stds)
+
+    def test_베어링별_점수가_단일_모델과_일치(self, registry_path, fleet_models):
+        """행마다 자기 베어링의 모델로 계산한 점수"""
+        registry = open_model_registry(registry_path)
+        ids = ["B000", "B003", "B001", "B003"]
+        features = np.array([
+            [0.5, 0.2, 1.4], [0.8, 0.2, 1.4], [3.0, 8.0, 5.0], [0.6, 0.25, 1.5],
+        ])
+
+        scores = registry.health_scores(ids, features)
+
+        expected = [
+            fleet_models[b].predict_health_scores(features[i:i + 1])[0]
+            for i, b in enumerate(ids)
+        ]
+        np.testing.assert_allclose(scores, expected)
+
+    def test_미등록_베어링(self, registry_path):
+        registry = open_model_registry(registry_path)
+        with pytest.raises(KeyError, match="등록되지 않은"):
+            registry.params(["B000", "B999"])
+
+    def test_행렬_모양_불일치(self, registry_path):
+        registry = open_model_registry(registry_path)
+        with pytest.raises(ValueError, match="행렬이 필요합니다"):
+            registry.health_scores(["B000"], np.zeros((2, 3)))
+
+
+class TestCopyOnWrite:
+    """단일 모델 copy-on-write 갱신 테스트"""
+
+    def test_갱신은_저장_전까지_파일에_반영되지_않음(self, registry_path):
+        registry = open_model_registry(registry_path)
+        new_model = make_model(seed=99, rms_mean=2.0)
+
+        registry.update("B001", new_model)
+
+        assert registry.get("B001").normal_params == new_model.normal_params
+        reopened = open_model_registry(registry_path)
+        assert reopened.get("B001").normal_params["rms"]["mean"] < 1.0
+
+    def test_새_베어링_추가후_저장(self, registry_path, fleet_models):
+        """새 베어링은 기존 베어링 뒤에 추가되고 save()로 기록됨"""
+        registry = open_model_registry(registry_path)
+        new_model = make_model(seed=7)
+        registry.update("B100", new_model)
+        registry.update("B000", new_model)
+
+        means, _ = registry.params(["B100", "B002"])
+        np.testing.assert_allclose(means[0], new_model.param_arrays()[0])
+
+        registry.save(registry_path)
+        reopened = open_model_registry(registry_path)
+
+        assert reopened.bearing_ids == list(fleet_models) + ["B100"]
+        for bearing_id in ("B100", "B000"):
+            assert reopened.get(bearing_id).normal_params == new_model.normal_params
+        assert reopened.get("B002").normal_params == fleet_models["B002"].normal_params
+
+    def test_새_베어링_조회는_전체_행렬을_만들지_않음(
+            self, registry_path, fleet_models, monkeypatch):
+        """추가한 베어링 조회도 요청한 행만 모으고 전체 행렬은 save()에서만 합침"""
+        registry = open_model_registry(registry_path)
+        added = {f"N{i:03d}": make_model(seed=100 + i) for i in range(20)}
+        for bearing_id, model in added.items():
+            registry.update(bearing_id, model)
+        registry.update("N003", fleet_models["B000"])
+
+        def fail():
+            raise AssertionError("조회 중 전체 파라미터 행렬을 만듦")
+        monkeypatch.setattr(registry, "_full_params", fail)
+
+        ids = ["N019", "B002", "N003", "N000"]
+        means, stds = registry.params(ids)
+        expected = [
+            fleet_models["B002"] if b == "B002"
+            else fleet_models["B000"] if b == "N003"
+            else added[b]
+            for b in ids
+        ]
+        for row, model in enumerate(expected):
+            expected_means, expected_stds = model.param_arrays()
+            np.testing.assert_allclose(means[row], expected_means)
+            np.testing.assert_allclose(stds[row], expected_stds)
+        assert registry.health_scores(ids, np.zeros((4, 3))).shape == (4,)
+
+    def test_특징_목록이_다른_모델은_거부(self, registry_path):
+        registry = open_model_registry(registry_path)
+        with pytest.raises(ValueError, match="특징 목록"):
+            registry.update("B000", make_model(0, extra_features=["bpfo_energy"]))
+
+    def test_미학습_모델은_거부(self, registry_path):
+        registry = open_model_registry(registry_path)
+        with pytest.raises(RuntimeError, match="학습되지 않은"):
+            registry.update("B000", BearingFailurePredictor())
+
+
+class TestInvalidFiles:
+    """잘못된 레지스트리 파일 처리 테스트"""
+
+    def test_존재하지_않는_파일(self):
+        with pytest.raises(FileNotFoundError):
+            open_model_registry("/nonexistent/path/fleet.bmr")
+
+    def test_매직_넘버_불일치(self, tmp_path):
+        bad = tmp_path / "bad.bmr"
+        bad.write_bytes(b"NOPE" + b"\0" * (HEADER_SIZE - 4))
+        with pytest.raises(ValueError, match="모델 레지스트리 형식이 아닙니다"):
+            open_model_registry(str(bad))
+
+    def test_잘린_헤더(self, tmp_path):
+        bad = tmp_path / "short.bmr"
+        bad.write_bytes(b"BMR1")
+        with pytest.raises(ValueError, match="헤더가 잘렸습니다"):
+            open_model_registry(str(bad))
+
+    def test_잘린_파라미터_영역(self, registry_path):
+        with open(registry_path, "r+b") as f:
+            f.seek(0, 2)
+            f.truncate(f.tell() - 16)
+        with pytest.raises(ValueError, match="파라미터 영역"):
+            open_model_registry(registry_path)
+
+    def test_특징_목록이_다른_모델_저장_거부(self, tmp_path):
+        models = {
+            "B000": make_model(0),
+            "B001": make_model(1, extra_features=["bpfo_energy"]),
+        }
+        with pytest.raises(ValueError, match="특징 목록"):
+            write_model_registry(str(tmp_path / "fleet.bmr"), models)
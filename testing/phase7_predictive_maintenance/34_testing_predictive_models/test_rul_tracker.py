@@ -0,0 +1,181 @@
+"""
+스트리밍 RUL 추정 테스트 모듈
+
+src_rul_tracker의 O(1) 갱신 추정기와 배치 API가
+BearingFailurePredictor.predict_rul()과 같은 결과를 내는지 테스트합니다.
+"""
+
+import numpy as np
+import pytest
+import random
+from src_bearing_model import BearingFailurePredictor
+from src_rul_tracker import RULTracker, predict_rul_batch
+
+
+@pytest.fixture
+def noisy_history():
+    """잡음이 섞인 완만한 하락 이력 (임계값 위)"""
+    random.seed(42)
+    return [100.0 - 0.1 * i + random.gauss(0, 2.0) for i in range(200)]
+
+
+class TestRULTracker:
+    """RULTracker 스트리밍 추정 테스트"""
+
+    def test_전체_이력은_predict_rul과_일치(self, noisy_history):
+        """매 시점의 추정치가 그때까지의 이력으로 predict_rul()한 값과 같음"""
+        model = BearingFailurePredictor()
+        tracker = RULTracker()
+
+        for i, score in enumerate(noisy_history):
+            tracker.update(score)
+            if i >= 1:
+                assert tracker.estimate() == pytest.approx(
+                    model.predict_rul(noisy_history[:i + 1]), rel=1e-9)
+
+    def test_슬라이딩_창은_최근_구간과_일치(self, noisy_history):
+        """window=k이면 최근 k개로 predict_rul()한 값과 같음"""
+        model = BearingFailurePredictor()
+        tracker = RULTracker(window=30)
+
+        for i, score in enumerate(noisy_history):
+            tracker.update(score)
+            if i >= 1:
+                recent = noisy_history[max(0, i + 1 - 30):i + 1]
+                assert tracker.estimate() == pytest.approx(
+                    model.predict_rul(recent), rel=1e-9)
+
+    def test_하락_이력(self, declining_health_history):
+        """conftest 하락 이력과 같은 결과"""
+        tracker = RULTracker()
+        for score in declining_health_history:
+            tracker.update(score)
+
+        expected = BearingFailurePredictor().predict_rul(declining_health_history)
+        assert tracker.estimate() == pytest.approx(expected)
+
+    def test_안정_이력은_큰_RUL(self, stable_health_history):
+        tracker = RULTracker(halflife=3.0)
+        for score in stable_health_history:
+            tracker.update(score)
+        assert tracker.estimate() > 50.0
+
+    def test_지수_가중은_최근_추세_반영(self):
+        """오래 안정적이다가 최근 급락하면 전체 이력보다 RUL이 짧음"""
+        history = [95.0] * 100 + [95.0 - 3.0 * i for i in range(1, 8)]
+        full, weighted = RULTracker(), RULTracker(halflife=3.0)
+        for score in history:
+            full.update(score)
+            weighted.update(score)
+
+        assert weighted.estimate() < full.estimate()
+        assert weighted.slope() < full.slope() < 0
+
+    @pytest.mark.parametrize("history", [[77.3] * 7, [55.55] * 50, [83.33] * 7])
+    @pytest.mark.parametrize("kwargs", [{}, {"window": 5}, {"halflife": 3.0}])
+    def test_평탄한_이력은_하락_없음(self, history, kwargs):
+        """변화 없는 이력은 반올림 오차 없이 기울기 0 → predict_rul()과 같은 999.0"""
+        tracker = RULTracker(**kwargs)
+        for score in history:
+            tracker.update(score)
+
+        assert tracker.slope() == 0.0
+        assert tracker.estimate() == BearingFailurePredictor().predict_rul(history)
+
+    @pytest.mark.parametrize("window", [3, 10, 50])
+    def test_긴_스트림_후_평탄한_창(self, window):
+        """큰 값이 오래 드나든 뒤에도 슬라이딩 창 합에 오차가 쌓이지 않음"""
+        rng = np.random.default_rng(window)
+        tracker = RULTracker(window=window)
+        for score in rng.uniform(0.0, 1e4, 200_003).tolist():
+            tracker.update(score)
+        for _ in range(window):
+            tracker.update(77.3)
+
+        assert tracker.estimate() == 999.0
+
+    def test_긴_스트림_후에도_predict_rul과_일치(self):
+        """창이 여러 번 재구성된 뒤에도 최근 구간의 predict_rul()과 같음"""
+        rng = np.random.default_rng(1)
+        history = (100.0 - 1e-3 * np.arange(50_000)
+                   + rng.normal(0, 1.0, 50_000)).tolist()
+        tracker = RULTracker(window=30)
+        for score in history:
+            tracker.update(score)
+
+        expected = BearingFailurePredictor().predict_rul(history[-30:])
+        assert tracker.estimate() == pytest.approx(expected, rel=1e-9)
+
+    def test_임계값_이하면_0(self):
+        tracker = RULTracker(window=5)
+        for score in [80.0, 60.0, 45.0]:
+            tracker.update(score)
+        assert tracker.estimate() == 0.0
+
+    def test_이력_부족_에러(self):
+        tracker = RULTracker()
+        tracker.update(90.0)
+        with pytest.raises(ValueError, match="최소 2개"):
+            tracker.estimate()
+
+    @pytest.mark.parametrize("kwargs", [
+        {"window": 1}, {"halflife": 0.0}, {"window": 10, "halflife": 5.0},
+    ])
+    def test_잘못된_창_설정(self, kwargs):
+        with pytest.raises(ValueError):
+            RULTracker(**kwargs)
+
+
+class TestPredictRULBatch:
+    """predict_rul_batch() 배치 API 테스트"""
+
+    @pytest.mark.parametrize("kwargs", [{}, {"window": 20}, {"halflife": 8.0}])
+    def test_스트리밍_추정과_일치(self, kwargs):
+        """길이가 다른 이력도 행마다 RULTracker와 같은 결과"""
+        rng = np.random.default_rng(0)
+        histories = [
+            list(100.0 - 0.2 * np.arange(n) + rng.normal(0, 1.0, n))
+            for n in (5, 40, 120, 2)
+        ]
+
+        result = predict_rul_batch(histories, **kwargs)
+
+        for row, history in enumerate(histories):
+            tracker = RULTracker(**kwargs)
+            for score in history:
+                tracker.update(score)
+            assert result[row] == pytest.approx(tracker.estimate(), rel=1e-9)
+
+    def test_NaN_패딩_배열(self, declining_health_history, stable_health_history):
+        """배열 입력의 끝부분 NaN은 패딩"""
+        histories = np.full((3, 6), np.nan)
+        histories[0] = declining_health_history
+        histories[1, :4] = stable_health_history[:4]
+        histories[2, 0] = 90.0
+
+        result = predict_rul_batch(histories)
+        model = BearingFailurePredictor()
+
+        assert result[0] == pytest.approx(model.predict_rul(declining_health_history))
+        assert result[1] == pytest.approx(model.predict_rul(stable_health_history[:4]))
+        assert np.isnan(result[2])
+
+    @pytest.mark.parametrize("kwargs", [{}, {"window": 5}, {"halflife": 3.0}])
+    def test_평탄한_이력(self, kwargs):
+        """평탄한 행은 predict_rul()과 같은 999.0 (길이가 달라도)"""
+        histories = [[77.3] * 7, [55.55] * 50, [83.33] * 7, [80.0, 90.0, 80.0]]
+        result = predict_rul_batch(histories, **kwargs)
+        assert result[:3].tolist() == [999.0] * 3
+        if not kwargs:
+            assert result[3] == BearingFailurePredictor().predict_rul(histories[3])
+
+    def test_임계값_이하와_개선_추세(self):
+        result = predict_rul_batch([[80.0, 60.0, 45.0], [70.0, 80.0, 90.0]])
+        assert result.tolist() == [0.0, 999.0]
+
+    def test_빈_이력(self):
+        assert np.isnan(predict_rul_batch([[], []])).all()
+
+    def test_1차원_배열_에러(self):
+        with pytest.raises(ValueError, match="2차원"):
+            predict_rul_batch(np.zeros(5))